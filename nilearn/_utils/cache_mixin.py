@@ -2,6 +2,7 @@
 
 # Author: Gael Varoquaux, Alexandre Abraham, Philippe Gervais
 
+import functools
 import os
 import warnings
 
@@ -13,6 +14,48 @@ import nilearn
 
 from .helpers import stringify_path
 
+# Functions emptying the caches kept in the memory of the process,
+# see _lru_cache and clear_in_memory_caches.
+_IN_MEMORY_CACHES_CLEARS = []
+
+
+def _register_in_memory_cache(cache_clear):
+    """Register a function emptying an in-memory cache.
+
+    The function is called, without arguments, by
+    :func:`clear_in_memory_caches`.
+    """
+    _IN_MEMORY_CACHES_CLEARS.append(cache_clear)
+    return cache_clear
+
+
+def _lru_cache(maxsize):
+    """Decorate a function with :func:`functools.lru_cache`, \
+    registering its cache to be emptied by :func:`clear_in_memory_caches`.
+
+    The cached values are shared between calls, so they must not be modified
+    by the callers. The caches hold no lock, so they are safe to inherit in
+    processes forked by a multi-threaded parent.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of results kept in the cache.
+    """
+
+    def decorator(func):
+        cached_func = functools.lru_cache(maxsize=maxsize)(func)
+        _register_in_memory_cache(cached_func.cache_clear)
+        return cached_func
+
+    return decorator
+
+
+def clear_in_memory_caches():
+    """Empty all the caches kept in the memory of the process."""
+    for cache_clear in _IN_MEMORY_CACHES_CLEARS:
+        cache_clear()
+
 
 def _check_memory(memory, verbose=0):
     """Ensure an instance of a joblib.Memory object.
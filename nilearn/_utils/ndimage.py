@@ -3,7 +3,7 @@
 # Author: Gael Varoquaux, Alexandre Abraham, Philippe Gervais
 
 import numpy as np
-from scipy.ndimage import label, maximum_filter
+from scipy.ndimage import generate_binary_structure, label, maximum_filter
 
 ###############################################################################
 # Operating on connected components
@@ -63,6 +63,157 @@ def largest_connected_component(volume):
     return labels == label_count.argmax()
 
 
+def cluster_structure(connectivity=6):
+    """Return the structuring element defining 3D clusters.
+
+    Parameters
+    ----------
+    connectivity : {6, 18, 26} or :obj:`numpy.ndarray`, default=6
+        Voxels are in the same cluster if they share a face (6),
+        a face or an edge (18), or a face, an edge or a corner (26).
+        Also known as NN1, NN2 and NN3 in AFNI. A (3, 3, 3) structuring
+        element is returned as is.
+
+    Returns
+    -------
+    structure : :obj:`numpy.ndarray` of shape (3, 3, 3)
+        The structuring element, to pass to :func:`scipy.ndimage.label`.
+
+    """
+    if isinstance(connectivity, np.ndarray):
+        return connectivity
+    ranks = {6: 1, 18: 2, 26: 3}
+    if connectivity not in ranks:
+        raise ValueError(
+            f"connectivity must be 6, 18 or 26. Got {connectivity!r}."
+        )
+    return generate_binary_structure(3, ranks[connectivity])
+
+
+def label_clusters(arr, threshold=0, two_sided=False, connectivity=6):
+    """Label the clusters of a 3D array.
+
+    Positive clusters, where ``arr > threshold``, are labeled from 1 to
+    ``n_positive``. If `two_sided`, negative clusters, where
+    ``arr < -threshold``, are labeled from ``n_positive + 1`` to
+    ``n_clusters``, so that positive and negative voxels are never in
+    the same cluster.
+
+    Parameters
+    ----------
+    arr : :obj:`numpy.ndarray` of shape (X, Y, Z)
+        The 3D array.
+
+    threshold : :obj:`float`, default=0
+        The cluster-forming threshold.
+
+    two_sided : :obj:`bool`, default=False
+        Whether to also label the negative clusters.
+
+    connectivity : {6, 18, 26} or :obj:`numpy.ndarray`, default=6
+        See :func:`cluster_structure`.
+
+    Returns
+    -------
+    labels : :obj:`numpy.ndarray` of int of shape (X, Y, Z)
+        Cluster label of each voxel; 0 outside clusters.
+
+    n_clusters : :obj:`int`
+        Number of clusters.
+
+    """
+    structure = cluster_structure(connectivity)
+    labels, n_clusters = label(arr > threshold, structure)
+    if two_sided:
+        negative_labels, n_negative = label(arr < -threshold, structure)
+        negative_labels[negative_labels > 0] += n_clusters
+        labels += negative_labels
+        n_clusters += n_negative
+    return labels, n_clusters
+
+
+def cluster_measures(labels, n_clusters, arr=None, threshold=0):
+    """Compute the size, and optionally the mass, of all clusters at once.
+
+    Parameters
+    ----------
+    labels : :obj:`numpy.ndarray` of int
+        Cluster labels, as returned by :func:`label_clusters`.
+
+    n_clusters : :obj:`int`
+        Number of clusters.
+
+    arr : :obj:`numpy.ndarray` or None, default=None
+        The labeled array. If given, cluster masses are also computed.
+
+    threshold : :obj:`float`, default=0
+        The cluster-forming threshold, subtracted from the absolute value
+        of each voxel to compute the masses.
+
+    Returns
+    -------
+    sizes : :obj:`numpy.ndarray` of int of shape (n_clusters + 1,)
+        Number of voxels of each cluster, indexed by label.
+        The size of the background, label 0, is set to 0.
+
+    masses : :obj:`numpy.ndarray` of shape (n_clusters + 1,)
+        Returned if `arr` is given. Sum over the voxels of each cluster
+        of their absolute value minus `threshold`, indexed by label.
+        The mass of the background is 0.
+
+    """
+    labels = labels.ravel()
+    sizes = np.bincount(labels, minlength=n_clusters + 1)
+    sizes[0] = 0
+    if arr is None:
+        return sizes
+    masses = np.bincount(
+        labels,
+        weights=np.abs(arr.ravel()) - threshold,
+        minlength=n_clusters + 1,
+    )
+    masses[0] = 0
+    return sizes, masses
+
+
+def threshold_cluster_size(arr, cluster_threshold, connectivity=6, copy=True):
+    """Remove the clusters of a 3D array smaller than a threshold.
+
+    Clusters are the connected sets of positive voxels and the connected
+    sets of negative voxels.
+
+    Parameters
+    ----------
+    arr : :obj:`numpy.ndarray` of shape (X, Y, Z)
+        3D array that has been thresholded at the voxel level.
+
+    cluster_threshold : :obj:`float`
+        Cluster-size threshold, in voxels.
+
+    connectivity : {6, 18, 26} or :obj:`numpy.ndarray`, default=6
+        See :func:`cluster_structure`.
+
+    copy : :obj:`bool`, default=True
+        Whether to copy the array before modifying it or not.
+
+    Returns
+    -------
+    arr : :obj:`numpy.ndarray` of shape (X, Y, Z)
+        Cluster-extent thresholded array.
+
+    """
+    if copy:
+        arr = arr.copy()
+    labels, n_clusters = label_clusters(
+        arr, two_sided=True, connectivity=connectivity
+    )
+    # lookup table of the clusters to remove, indexed by label
+    too_small = cluster_measures(labels, n_clusters) < cluster_threshold
+    too_small[0] = False
+    arr[too_small[labels]] = 0
+    return arr
+
+
 def get_border_data(data, border_size):
     """Return the data at the border of an array."""
     return np.concatenate(
@@ -27,6 +27,56 @@ def _get_data(img):
     return data
 
 
+def _iter_volume_chunks(img, chunk_size):
+    """Iterate over the data of a 4D image, ``chunk_size`` volumes at a time.
+
+    If the data of the image is not in memory, its file is opened once and
+    read sequentially, so that only one chunk is in memory at a time;
+    compressed files are decompressed as a stream.
+
+    Parameters
+    ----------
+    img : 4D Niimg-like object
+        Image to read.
+
+    chunk_size : int
+        Number of volumes in each chunk.
+
+    Yields
+    ------
+    start : int
+        Index of the first volume of the chunk.
+
+    chunk : numpy.ndarray
+        Data of the volumes ``start`` to ``start + chunk_size``.
+
+    """
+    n_volumes = img.shape[3]
+    dataobj = img.dataobj
+    if img.in_memory or not isinstance(dataobj, nibabel.arrayproxy.ArrayProxy):
+        data = _get_data(img)
+        for start in range(0, n_volumes, chunk_size):
+            yield start, data[..., start : start + chunk_size]
+        return
+
+    with nibabel.openers.ImageOpener(dataobj.file_like) as fileobj:
+        # reading through the open file avoids opening (and, for
+        # compressed files, decompressing from the start) at each chunk
+        proxy = nibabel.arrayproxy.ArrayProxy(
+            fileobj,
+            (
+                dataobj.shape,
+                dataobj.dtype,
+                dataobj.offset,
+                dataobj.slope,
+                dataobj.inter,
+            ),
+            order=dataobj.order,
+        )
+        for start in range(0, n_volumes, chunk_size):
+            yield start, np.asanyarray(proxy[..., start : start + chunk_size])
+
+
 def safe_get_data(img, ensure_finite=False, copy_data=False):
     """Get the data in the image without having a side effect \
     on the Nifti1Image object.
@@ -132,7 +182,10 @@ def load_niimg(niimg, dtype=None):
             + _repr_niimgs(niimg, shorten=True)
         )
 
-    dtype = _get_target_dtype(_get_data(niimg).dtype, dtype)
+    # Without a target dtype, the data is not needed: do not decode it
+    # (which, for compressed files, means decompressing the whole file).
+    if dtype is not None:
+        dtype = _get_target_dtype(_get_data(niimg).dtype, dtype)
 
     if dtype is not None:
         # Copyheader and set dtype in header if header exists
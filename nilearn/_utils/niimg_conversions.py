@@ -140,69 +140,104 @@ def iter_check_niimg(
         ref_fov = target_fov
     i = -1
     for i, niimg in enumerate(niimgs):
-        try:
-            niimg = check_niimg(
-                niimg,
-                ensure_ndim=ndim_minus_one,
-                atleast_4d=atleast_4d,
-                dtype=dtype,
-            )
-            if i == 0:
-                ndim_minus_one = len(niimg.shape)
-                if ref_fov is None:
-                    ref_fov = (niimg.affine, niimg.shape[:3])
-                    resample_to_first_img = True
-
-            if not _check_fov(niimg, ref_fov[0], ref_fov[1]):
-                if target_fov is not None:
-                    from nilearn import image  # we avoid a circular import
-
-                    if resample_to_first_img:
-                        warnings.warn(
-                            "Affine is different across subjects."
-                            " Realignement on first subject "
-                            "affine forced"
-                        )
-                    niimg = cache(
-                        image.resample_img,
-                        memory,
-                        func_memory_level=2,
-                        memory_level=memory_level,
-                    )(niimg, target_affine=ref_fov[0], target_shape=ref_fov[1])
-                else:
-                    raise ValueError(
-                        "Field of view of image #%d is different from "
-                        "reference FOV.\n"
-                        "Reference affine:\n%r\nImage affine:\n%r\n"
-                        "Reference shape:\n%r\nImage shape:\n%r\n"
-                        % (
-                            i,
-                            ref_fov[0],
-                            niimg.affine,
-                            ref_fov[1],
-                            niimg.shape,
-                        )
-                    )
-            yield niimg
-        except DimensionError as exc:
-            # Keep track of the additional dimension in the error
-            exc.increment_stack_counter()
-            raise
-        except TypeError as exc:
-            img_name = ""
-            if isinstance(niimg, str):
-                img_name = f" ({niimg}) "
-
-            exc.args = (
-                f"Error encountered while loading image #{i}{img_name}",
-            ) + exc.args
-            raise
+        niimg = _check_niimg_in_list(
+            niimg,
+            i,
+            ensure_ndim=ndim_minus_one,
+            atleast_4d=atleast_4d,
+            dtype=dtype,
+            ref_fov=ref_fov,
+            resample=target_fov is not None,
+            warn_resample=resample_to_first_img,
+            memory=memory,
+            memory_level=memory_level,
+        )
+        if i == 0:
+            ndim_minus_one = len(niimg.shape)
+            if ref_fov is None:
+                ref_fov = (niimg.affine, niimg.shape[:3])
+                resample_to_first_img = True
+        yield niimg
 
     # Raising an error if input generator is empty.
     if i == -1:
         raise ValueError("Input niimgs list is empty.")
 
 
+def _check_niimg_in_list(
+    niimg,
+    index,
+    ensure_ndim=None,
+    atleast_4d=False,
+    dtype=None,
+    ref_fov=None,
+    resample=False,
+    warn_resample=False,
+    memory=None,
+    memory_level=0,
+):
+    """Check image #index of a list of niimgs, as done by iter_check_niimg.
+
+    If ``ref_fov`` is not None and the image has another field of view, it
+    is resampled to ``ref_fov`` if ``resample`` is True and an error is
+    raised otherwise. This only depends on the image and on the reference,
+    so the images of a list can be checked independently, e.g. in threads.
+    """
+    try:
+        niimg = check_niimg(
+            niimg,
+            ensure_ndim=ensure_ndim,
+            atleast_4d=atleast_4d,
+            dtype=dtype,
+        )
+        if ref_fov is not None and not _check_fov(
+            niimg, ref_fov[0], ref_fov[1]
+        ):
+            if resample:
+                from nilearn import image  # we avoid a circular import
+
+                if warn_resample:
+                    warnings.warn(
+                        "Affine is different across subjects."
+                        " Realignement on first subject "
+                        "affine forced"
+                    )
+                niimg = cache(
+                    image.resample_img,
+                    memory,
+                    func_memory_level=2,
+                    memory_level=memory_level,
+                )(niimg, target_affine=ref_fov[0], target_shape=ref_fov[1])
+            else:
+                raise ValueError(
+                    "Field of view of image #%d is different from "
+                    "reference FOV.\n"
+                    "Reference affine:\n%r\nImage affine:\n%r\n"
+                    "Reference shape:\n%r\nImage shape:\n%r\n"
+                    % (
+                        index,
+                        ref_fov[0],
+                        niimg.affine,
+                        ref_fov[1],
+                        niimg.shape,
+                    )
+                )
+        return niimg
+    except DimensionError as exc:
+        # Keep track of the additional dimension in the error
+        exc.increment_stack_counter()
+        raise
+    except TypeError as exc:
+        img_name = ""
+        if isinstance(niimg, str):
+            img_name = f" ({niimg}) "
+
+        exc.args = (
+            f"Error encountered while loading image #{index}{img_name}",
+        ) + exc.args
+        raise
+
+
 def check_niimg(
     niimg,
     ensure_ndim=None,
@@ -12,7 +12,7 @@ import warnings
 
 import numpy as np
 from scipy import __version__, ndimage as ndi, sparse
-from scipy.sparse.linalg import cg
+from scipy.sparse.linalg import cg, splu
 from sklearn.utils import as_float_array
 
 from nilearn._utils.helpers import compare_version
@@ -56,14 +56,16 @@ def _make_graph_edges_3d(n_x, n_y, n_z):
     return edges
 
 
-def _compute_weights_3d(data, spacing, beta=130, eps=1.0e-6):
+def _compute_weights_3d(data, spacing, beta=130, eps=1.0e-6, data_std=None):
     # Weight calculation is main difference in multispectral version
     # Original gradient**2 replaced with sum of gradients ** 2
     gradients = 0
     for channel in range(0, data.shape[-1]):
         gradients += _compute_gradients_3d(data[..., channel], spacing) ** 2
     # All channels considered together in this standard deviation
-    beta /= 10 * data.std()
+    if data_std is None:
+        data_std = data.std()
+    beta /= 10 * data_std
     gradients *= beta
     weights = np.exp(-gradients)
     weights += eps
@@ -147,10 +149,12 @@ def _mask_edges_weights(edges, weights, mask):
     return edges, weights
 
 
-def _build_laplacian(data, spacing, mask=None, beta=50):
+def _build_laplacian(data, spacing, mask=None, beta=50, data_std=None):
     l_x, l_y, l_z = tuple(data.shape[i] for i in range(3))
     edges = _make_graph_edges_3d(l_x, l_y, l_z)
-    weights = _compute_weights_3d(data, spacing, beta=beta, eps=1.0e-10)
+    weights = _compute_weights_3d(
+        data, spacing, beta=beta, eps=1.0e-10, data_std=data_std
+    )
     if mask is not None:
         edges, weights = _mask_edges_weights(edges, weights, mask)
     lap = _make_laplacian_sparse(edges, weights)
@@ -158,7 +162,15 @@ def _build_laplacian(data, spacing, mask=None, beta=50):
     return lap
 
 
-def random_walker(data, labels, beta=130, tol=1.0e-3, copy=True, spacing=None):
+def random_walker(
+    data,
+    labels,
+    beta=130,
+    tol=1.0e-3,
+    copy=True,
+    spacing=None,
+    mode="cg",
+):
     """Random walker algorithm for segmentation from markers.
 
     Parameters
@@ -193,6 +205,18 @@ def random_walker(data, labels, beta=130, tol=1.0e-3, copy=True, spacing=None):
         Spacing between voxels in each spatial dimension. If `None`, then
         the spacing between pixels/voxels in each dimension is assumed 1.
 
+    mode : {'cg', 'cg_j', 'bf'}, default='cg'
+        Method used to solve the linear system:
+
+        - 'cg': conjugate gradient method.
+        - 'cg_j': conjugate gradient method with a Jacobi (diagonal)
+          preconditioner.
+        - 'bf': sparse LU factorization of the Laplacian, computed once
+          and used to solve the system of each phase. It can be faster
+          than the conjugate gradient on small graphs with many phases,
+          but the memory of the factorization grows faster than linearly
+          with the number of pixels.
+
     Returns
     -------
     output : ndarray
@@ -226,6 +250,9 @@ def random_walker(data, labels, beta=130, tol=1.0e-3, copy=True, spacing=None):
     The weight w_ij is a decreasing function of the norm of the local gradient.
     This ensures that diffusion is easier between pixels of similar values.
 
+    Only the bounding box of the active pixels, where labels >= 0, is
+    used to build the graph of the image.
+
     When the Laplacian is decomposed into blocks of marked and unmarked
     pixels::
 
@@ -247,6 +274,8 @@ def random_walker(data, labels, beta=130, tol=1.0e-3, copy=True, spacing=None):
        Anal Mach Intell. 2006 Nov;28(11):1768-83.
 
     """
+    if mode not in ("cg", "cg_j", "bf"):
+        raise ValueError(f"mode must be 'cg', 'cg_j' or 'bf'. Got {mode!r}.")
     out_labels = np.copy(labels)
     if (labels != 0).all():
         warnings.warn(
@@ -329,10 +358,18 @@ def random_walker(data, labels, beta=130, tol=1.0e-3, copy=True, spacing=None):
 
     labels = np.atleast_3d(labels)
     if np.any(labels < 0):
+        # The weights are normalized by the standard deviation of the
+        # whole image, before restricting the graph to the bounding box
+        # of the active pixels
+        data_std = data.std()
+        box = ndi.find_objects((labels >= 0).astype(np.int8))[0]
+        out = labels.copy()
+        data, labels = data[box], labels[box]
         lap_sparse = _build_laplacian(
-            data, spacing, mask=labels >= 0, beta=beta
+            data, spacing, mask=labels >= 0, beta=beta, data_std=data_std
         )
     else:
+        box = None
         lap_sparse = _build_laplacian(data, spacing, beta=beta)
 
     lap_sparse, B = _buildAB(lap_sparse, labels)
@@ -341,20 +378,32 @@ def random_walker(data, labels, beta=130, tol=1.0e-3, copy=True, spacing=None):
     # lap_sparse X = B
     # where X[i, j] is the probability that a marker of label i arrives
     # first at pixel j by anisotropic diffusion.
-    X = _solve_cg(lap_sparse, B, tol=tol)
+    if mode == "bf":
+        X = _solve_bf(lap_sparse, B)
+    else:
+        X = _solve_cg(lap_sparse, B, tol=tol, precondition=mode == "cg_j")
 
     # Clean up results
-    X = _clean_labels_ar(X + 1, labels).reshape(dims)
-    return X
+    X = _clean_labels_ar(X + 1, labels).reshape(labels.shape)
+    if box is not None:
+        out[box] = X
+        X = out
+    return X.reshape(dims)
 
 
-def _solve_cg(lap_sparse, B, tol):
+def _solve_cg(lap_sparse, B, tol, precondition=False):
     """Solve lap_sparse X_i = B_i for each phase i, using the conjugate \
     gradient method.
 
+    If precondition is True, the inverse of the diagonal of lap_sparse
+    is used as preconditioner (Jacobi preconditioner).
+
     For each pixel, the label i corresponding to the maximal X_i is returned.
     """
     lap_sparse = lap_sparse.tocsc()
+    M = None
+    if precondition:
+        M = sparse.diags(1.0 / lap_sparse.diagonal(), format="csc")
     X = []
     for i in range(len(B)):
         # TODO Python 3.8
@@ -362,11 +411,25 @@ def _solve_cg(lap_sparse, B, tol):
         # would require pinning scipy to >= 1.12
         # See https://github.com/nilearn/nilearn/pull/4394
         if compare_version(__version__, ">=", "1.12"):
-            x0 = cg(lap_sparse, -B[i].todense(), rtol=tol, atol=0)[0]
+            x0 = cg(lap_sparse, -B[i].todense(), rtol=tol, atol=0, M=M)[0]
         else:
-            x0 = cg(lap_sparse, -B[i].todense(), tol=tol, atol="legacy")[0]
+            x0 = cg(lap_sparse, -B[i].todense(), tol=tol, atol="legacy", M=M)[
+                0
+            ]
         X.append(x0)
 
     X = np.array(X)
     X = np.argmax(X, axis=0)
     return X
+
+
+def _solve_bf(lap_sparse, B):
+    """Solve lap_sparse X_i = B_i for each phase i, using a sparse LU \
+    factorization of lap_sparse shared by all phases.
+
+    For each pixel, the label i corresponding to the maximal X_i is returned.
+    """
+    lu = splu(lap_sparse.tocsc())
+    X = np.array([lu.solve(-B[i].toarray().ravel()) for i in range(len(B))])
+    X = np.argmax(X, axis=0)
+    return X
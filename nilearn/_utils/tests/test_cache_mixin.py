@@ -148,3 +148,20 @@ def test_cache_shelving(tmp_path):
     res = cache_mixin.cache(f, mem, shelve=True)(2)
     assert res.get() == 2
     assert len(_get_subdirs(joblib_dir)) == 1
+
+
+def test_lru_cache():
+    calls = []
+
+    @cache_mixin._lru_cache(maxsize=2)
+    def g(x):
+        calls.append(x)
+        return x
+
+    for x in [1, 2, 1, 3, 1]:
+        assert g(x) == x
+    assert calls == [1, 2, 3]
+
+    cache_mixin.clear_in_memory_caches()
+    g(1)
+    assert calls == [1, 2, 3, 1]
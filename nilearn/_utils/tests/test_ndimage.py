@@ -9,7 +9,14 @@ import numpy as np
 import pytest
 
 from nilearn._utils import data_gen
-from nilearn._utils.ndimage import largest_connected_component, peak_local_max
+from nilearn._utils.ndimage import (
+    cluster_measures,
+    cluster_structure,
+    label_clusters,
+    largest_connected_component,
+    peak_local_max,
+    threshold_cluster_size,
+)
 
 
 def test_largest_cc():
@@ -72,3 +79,68 @@ def test_trivial_cases_in_peak_local_max():
     trivial = np.zeros((25, 25))
     peaks = peak_local_max(trivial, min_distance=1)
     assert (peaks.astype(bool) == trivial).all()
+
+
+@pytest.mark.parametrize(
+    "connectivity, n_clusters", [(6, 3), (18, 2), (26, 1)]
+)
+def test_label_clusters_connectivity(connectivity, n_clusters):
+    arr = np.zeros((4, 4, 4))
+    arr[0, 0, 0] = 1
+    # shares an edge with the first voxel
+    arr[1, 1, 0] = 1
+    # shares a corner with the second voxel
+    arr[2, 2, 1] = 1
+
+    _, n = label_clusters(arr, connectivity=connectivity)
+
+    assert n == n_clusters
+
+
+def test_cluster_structure_error():
+    with pytest.raises(ValueError, match="connectivity must be"):
+        cluster_structure(8)
+
+
+def test_label_clusters_and_measures():
+    arr = np.zeros((5, 5, 5))
+    arr[0, 0, :3] = 3
+    arr[0, 1, :3] = -4
+    arr[4, 4, 4] = 2.5
+
+    labels, n_clusters = label_clusters(arr, threshold=2, two_sided=True)
+
+    # positive clusters first, then negative clusters
+    assert n_clusters == 3
+    assert set(labels[0, 0, :3]) == {1}
+    assert set(labels[0, 1, :3]) == {3}
+    assert labels[4, 4, 4] == 2
+
+    sizes, masses = cluster_measures(labels, n_clusters, arr, threshold=2)
+
+    np.testing.assert_array_equal(sizes, [0, 3, 1, 3])
+    np.testing.assert_allclose(masses, [0, 3, 0.5, 6])
+
+    labels, n_clusters = label_clusters(arr, threshold=2)
+
+    assert n_clusters == 2
+    assert (labels[0, 1] == 0).all()
+
+
+def test_threshold_cluster_size(rng):
+    arr = rng.standard_normal((10, 11, 12))
+    arr[np.abs(arr) < 1] = 0
+
+    thresholded = threshold_cluster_size(arr, 3)
+
+    # compare with a cluster by cluster computation
+    expected = arr.copy()
+    for sign in [1, -1]:
+        labels, n_clusters = label_clusters(arr * sign)
+        for cluster in range(1, n_clusters + 1):
+            if np.sum(labels == cluster) < 3:
+                expected[labels == cluster] = 0
+
+    assert (thresholded != 0).any()
+    np.testing.assert_array_equal(thresholded, expected)
+    assert threshold_cluster_size(arr, 3, copy=False) is arr
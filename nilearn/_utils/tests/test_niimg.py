@@ -89,3 +89,45 @@ def test_load_niimg(img1, tmp_path):
     )
     filename = Path(filename)
     load_niimg(filename)
+
+
+def test_load_niimg_does_not_load_data(img1, tmp_path):
+    nb.save(img1, tmp_path / "img.nii.gz")
+
+    img = load_niimg(tmp_path / "img.nii.gz")
+
+    assert img.shape == img1.shape
+    assert not img.in_memory
+    assert load_niimg(tmp_path / "img.nii.gz", dtype="auto").in_memory
+
+
+def test_load_niimg_lazy_needs_file(img1, tmp_path):
+    """Images loaded without dtype conversion read their file lazily, so \
+    callers removing the file must read the data first."""
+    nb.save(img1, tmp_path / "img.nii")
+    lazy = load_niimg(tmp_path / "img.nii")
+    loaded = load_niimg(tmp_path / "img.nii")
+    get_data(loaded)
+    converted = load_niimg(tmp_path / "img.nii", dtype="auto")
+
+    (tmp_path / "img.nii").unlink()
+
+    with pytest.raises(FileNotFoundError):
+        get_data(lazy)
+    np.testing.assert_array_equal(get_data(loaded), get_data(img1))
+    np.testing.assert_array_equal(get_data(converted), get_data(img1))
+
+
+@pytest.mark.parametrize("suffix", [".nii", ".nii.gz"])
+def test_iter_volume_chunks(img1, tmp_path, suffix):
+    data = np.arange(40, dtype="float32").reshape((2, 2, 2, 5))
+    img = Nifti1Image(data, img1.affine)
+    nb.save(img, tmp_path / f"img{suffix}")
+
+    for img in (img, load_niimg(tmp_path / f"img{suffix}")):
+        chunks = list(niimg._iter_volume_chunks(img, 2))
+
+        assert [start for start, _ in chunks] == [0, 2, 4]
+        np.testing.assert_array_equal(
+            np.concatenate([chunk for _, chunk in chunks], axis=3), data
+        )
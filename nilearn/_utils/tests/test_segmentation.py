@@ -26,6 +26,49 @@ def test_modes_in_random_walker(rng):
     random_walker(img, labels, beta=30)
 
 
+@pytest.mark.parametrize("mode", ["cg", "cg_j", "bf"])
+def test_modes_agree_in_random_walker(rng, mode):
+    img = np.zeros((30, 30, 30)) + 0.1 * rng.standard_normal(size=(30, 30, 30))
+    img[9:21, 9:21, 9:21] = 1
+    img[10:20, 10:20, 10:20] = 0
+    labels = np.zeros_like(img)
+    labels[6, 6, 6] = 1
+    labels[14, 15, 16] = 2
+    expected = random_walker(img, labels, beta=90, tol=1e-8)
+    np.testing.assert_array_equal(
+        random_walker(img, labels, beta=90, tol=1e-8, mode=mode), expected
+    )
+
+
+def test_random_walker_bounding_box(rng):
+    """Check that restricting the graph to the bounding box of the active \
+    pixels does not change the segmentation."""
+    img = rng.standard_normal(size=(20, 20, 20))
+    labels = -np.ones(img.shape)
+    labels[5:12, 4:15, 8:17] = 0
+    labels[6, 5, 9] = 1
+    labels[10, 13, 15] = 2
+    result = random_walker(img, labels, mode="bf")
+    assert result.shape == img.shape
+    assert np.all(result[labels == -1] == -1)
+    assert set(np.unique(result[labels == 0])) == {1, 2}
+
+    # same segmentation on the cropped image, with the same weights:
+    # beta is normalized by the standard deviation of the whole image
+    box = (slice(5, 12), slice(4, 15), slice(8, 17))
+    beta = 130 * img[box].std() / img.std()
+    cropped = random_walker(img[box], labels[box], beta=beta, mode="bf")
+    np.testing.assert_array_equal(result[box], cropped)
+
+
+def test_random_walker_bad_mode(rng):
+    img = rng.random((5, 5, 5))
+    labels = np.zeros(img.shape)
+    labels[0, 0, 0] = 1
+    with pytest.raises(ValueError, match="mode must be"):
+        random_walker(img, labels, mode="amg")
+
+
 def test_isolated_pixel(rng):
     data = rng.random((3, 3))
 
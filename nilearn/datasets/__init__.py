@@ -55,6 +55,7 @@ from .struct import (
     GM_MNI152_FILE_PATH,
     MNI152_FILE_PATH,
     WM_MNI152_FILE_PATH,
+    clear_template_cache,
     fetch_icbm152_2009,
     fetch_icbm152_brain_gm_mask,
     fetch_oasis_vbm,
@@ -72,6 +73,7 @@ __all__ = [
     "MNI152_FILE_PATH",
     "GM_MNI152_FILE_PATH",
     "WM_MNI152_FILE_PATH",
+    "clear_template_cache",
     "fetch_abide_pcp",
     "fetch_adhd",
     "fetch_atlas_craddock_2012",
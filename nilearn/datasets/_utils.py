@@ -1,8 +1,10 @@
 """Private utility functions to the datasets module."""
 
+import collections
 import collections.abc
 import contextlib
 import fnmatch
+import functools
 import hashlib
 import os
 import pickle
@@ -17,6 +19,7 @@ from pathlib import Path
 
 import numpy as np
 import requests
+from joblib import Parallel, delayed, effective_n_jobs
 
 from .._utils import fill_doc
 from .utils import get_data_dirs
@@ -40,7 +43,7 @@ def _md5_sum_file(path):
     with open(path, "rb") as f:
         m = hashlib.md5()
         while True:
-            data = f.read(8192)
+            data = f.read(2**20)
             if data:
                 m.update(data)
             else:
@@ -125,6 +128,7 @@ def _chunk_read_(
     initial_size=0,
     total_size=None,
     verbose=1,
+    progress_hook=None,
 ):
     """Download a file chunk by chunk and show advancement.
 
@@ -148,6 +152,10 @@ def _chunk_read_(
     total_size : int, optional
         Expected final size of download (None means it is unknown).
     %(verbose)s
+    progress_hook : callable, optional
+        Called as ``progress_hook(bytes_so_far, total_size, elapsed)``
+        after each chunk is written, with ``elapsed`` the time in seconds
+        since the download started.
 
     Returns
     -------
@@ -182,6 +190,8 @@ def _chunk_read_(
             time_last_display = time_last_read
         if chunk:
             local_file.write(chunk)
+            if progress_hook is not None:
+                progress_hook(bytes_so_far, total_size, time_last_read - t0)
         else:
             break
 
@@ -482,6 +492,15 @@ class _NaiveFTPAdapter(requests.adapters.BaseAdapter):
         pass
 
 
+def _url_file_name(url):
+    """Return the name of the file in which fetch_single_file saves a url."""
+    parse = urllib.parse.urlparse(url)
+    file_name = os.path.basename(parse.path)
+    if file_name == "":
+        file_name = md5_hash(parse.path)
+    return file_name
+
+
 @fill_doc
 def fetch_single_file(
     url,
@@ -493,6 +512,7 @@ def fetch_single_file(
     password=None,
     verbose=1,
     session=None,
+    progress_hook=None,
 ):
     """Load requested file, downloading it if needed or requested.
 
@@ -516,6 +536,15 @@ def fetch_single_file(
     session : requests.Session, optional
         Session to use to send requests.
 
+    progress_hook : callable, optional
+        Called as ``progress_hook(url, bytes_so_far, total_size, elapsed)``
+        while the file is downloaded, with ``elapsed`` the time in seconds
+        since the download started. ``total_size`` is None when the server
+        does not report it. This can be used to report progress and
+        throughput.
+
+        .. versionadded:: 0.11.0
+
     Returns
     -------
     files : string
@@ -540,17 +569,13 @@ def fetch_single_file(
                 password=password,
                 verbose=verbose,
                 session=session,
+                progress_hook=progress_hook,
             )
     # Determine data path
     if not os.path.exists(data_dir):
         os.makedirs(data_dir)
 
-    # Determine filename using URL
-    parse = urllib.parse.urlparse(url)
-    file_name = os.path.basename(parse.path)
-    if file_name == "":
-        file_name = md5_hash(parse.path)
-
+    file_name = _url_file_name(url)
     temp_file_name = f"{file_name}.part"
     full_name = os.path.join(data_dir, file_name)
     temp_full_name = os.path.join(data_dir, temp_file_name)
@@ -562,8 +587,10 @@ def fetch_single_file(
     if os.path.exists(temp_full_name) and overwrite:
         os.remove(temp_full_name)
     t0 = time.time()
-    local_file = None
     initial_size = 0
+    chunk_hook = None
+    if progress_hook is not None:
+        chunk_hook = functools.partial(progress_hook, url)
 
     try:
         # Download data
@@ -600,13 +627,14 @@ def fetch_single_file(
                     ):
                         raise OSError("Server does not support resuming")
                     initial_size = local_file_size
-                    with open(local_file, "ab") as fh:
+                    with open(temp_full_name, "ab") as fh:
                         _chunk_read_(
                             resp,
                             fh,
                             report_hook=(verbose > 0),
                             initial_size=initial_size,
                             verbose=verbose,
+                            progress_hook=chunk_hook,
                         )
             except Exception:
                 if verbose > 0:
@@ -621,6 +649,7 @@ def fetch_single_file(
                     password=password,
                     verbose=verbose,
                     session=session,
+                    progress_hook=progress_hook,
                 )
         else:
             req = requests.Request(
@@ -638,6 +667,7 @@ def fetch_single_file(
                         report_hook=(verbose > 0),
                         initial_size=initial_size,
                         verbose=verbose,
+                        progress_hook=chunk_hook,
                     )
         shutil.move(temp_full_name, full_name)
         dt = time.time() - t0
@@ -653,7 +683,7 @@ def fetch_single_file(
         raise
     if md5sum is not None and _md5_sum_file(full_name) != md5sum:
         raise ValueError(
-            f"File {local_file} checksum verification has failed."
+            f"File {full_name} checksum verification has failed."
             " Dataset fetching aborted."
         )
     return full_name
@@ -711,8 +741,121 @@ def movetree(src, dst):
         raise Exception(errors)
 
 
+def _check_writable(data_dir):
+    # We may be in a global read-only repository. If so, we cannot
+    # download files.
+    if not os.access(data_dir, os.W_OK):
+        raise ValueError(
+            "Dataset files are missing but dataset"
+            " repository is read-only. Contact your data"
+            " administrator to solve the problem"
+        )
+
+
+def _needs_download(data_dir, temp_dir, file_, opts):
+    """Tell whether an entry of fetch_files must be downloaded."""
+    return opts.get("overwrite", False) or (
+        not os.path.exists(os.path.join(data_dir, file_))
+        and not os.path.exists(os.path.join(temp_dir, file_))
+    )
+
+
+def _prefetch_files(
+    data_dir,
+    temp_dir,
+    files,
+    resume=True,
+    verbose=1,
+    session=None,
+    n_jobs=1,
+    progress_hook=None,
+):
+    """Download concurrently all the urls that fetch_files will need.
+
+    Each url is downloaded once into temp_dir by a pool of threads,
+    and its md5 sum is checked by the thread that downloaded it.
+    Urls whose files would have the same name, such as
+    ``https://osf.io/<id>/download``, are each downloaded in their own
+    subdirectory of temp_dir, named after the url.
+
+    Returns
+    -------
+    prefetched : dict
+        Maps each downloaded url to the path of the downloaded file.
+
+    """
+    to_fetch = {}
+    for file_, url, opts in files:
+        if url not in to_fetch and _needs_download(
+            data_dir, temp_dir, file_, opts
+        ):
+            to_fetch[url] = opts
+    if not to_fetch:
+        return {}
+
+    _check_writable(data_dir)
+    if not os.path.exists(temp_dir):
+        os.mkdir(temp_dir)
+    if verbose > 0:
+        print(
+            f"Downloading {len(to_fetch)} files "
+            f"using {effective_n_jobs(n_jobs)} threads ..."
+        )
+    file_names = collections.Counter(map(_url_file_name, to_fetch))
+    download_dirs = [
+        (
+            temp_dir
+            if file_names[_url_file_name(url)] == 1
+            else os.path.join(temp_dir, md5_hash(url))
+        )
+        for url in to_fetch
+    ]
+    # progress lines of concurrent downloads would be interleaved,
+    # so per-file reports are left to progress_hook
+    paths = Parallel(n_jobs=n_jobs, prefer="threads")(
+        delayed(fetch_single_file)(
+            url,
+            download_dir,
+            resume=resume,
+            verbose=0,
+            md5sum=opts.get("md5sum", None),
+            username=opts.get("username", None),
+            password=opts.get("password", None),
+            session=session,
+            overwrite=opts.get("overwrite", False),
+            progress_hook=progress_hook,
+        )
+        for (url, opts), download_dir in zip(to_fetch.items(), download_dirs)
+    )
+    return dict(zip(to_fetch, paths))
+
+
+def _use_prefetched(dl_file, temp_dir):
+    """Move a prefetched file where fetch_single_file would have saved it.
+
+    Files prefetched in their own subdirectory of temp_dir are moved to
+    temp_dir when they are used, so that they are moved, uncompressed and
+    found by the next entries of fetch_files as if downloaded there.
+    """
+    download_dir = os.path.dirname(dl_file)
+    if download_dir == temp_dir:
+        return dl_file
+    target = os.path.join(temp_dir, os.path.basename(dl_file))
+    os.replace(dl_file, target)
+    shutil.rmtree(download_dir)
+    return target
+
+
 @fill_doc
-def fetch_files(data_dir, files, resume=True, verbose=1, session=None):
+def fetch_files(
+    data_dir,
+    files,
+    resume=True,
+    verbose=1,
+    session=None,
+    n_jobs=1,
+    progress_hook=None,
+):
     """Load requested dataset, downloading it if needed or requested.
 
     This function retrieves files from the hard drive or download them from
@@ -739,6 +882,25 @@ def fetch_files(data_dir, files, resume=True, verbose=1, session=None):
     %(verbose)s
     session : `requests.Session`, optional
         Session to use to send requests.
+        If None, a session is created; when downloading in parallel,
+        its connection pool keeps up to ``n_jobs`` connections per host.
+
+    n_jobs : :obj:`int`, default=1
+        Number of files downloaded concurrently.
+        `-1` means as many as there are CPUs.
+        Downloads are run in threads, and the md5 sum of each file is
+        checked by the thread that downloaded it.
+
+        .. versionadded:: 0.11.0
+
+    progress_hook : callable, optional
+        Called as ``progress_hook(url, bytes_so_far, total_size, elapsed)``
+        while each file is downloaded, with ``elapsed`` the time in
+        seconds since the download of this file started. ``total_size``
+        is None when the server does not report it. When ``n_jobs`` is
+        not 1, it may be called from several threads at once.
+
+        .. versionadded:: 0.11.0
 
     Returns
     -------
@@ -749,12 +911,20 @@ def fetch_files(data_dir, files, resume=True, verbose=1, session=None):
     if session is None:
         with requests.Session() as session:
             session.mount("ftp:", _NaiveFTPAdapter())
+            n_workers = effective_n_jobs(n_jobs)
+            if n_workers > 1:
+                # keep one connection per worker open for each host
+                adapter = requests.adapters.HTTPAdapter(pool_maxsize=n_workers)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
             return fetch_files(
                 data_dir,
                 files,
                 resume=resume,
                 verbose=verbose,
                 session=session,
+                n_jobs=n_jobs,
+                progress_hook=progress_hook,
             )
     # There are two working directories here:
     # - data_dir is the destination directory of the dataset
@@ -771,6 +941,21 @@ def fetch_files(data_dir, files, resume=True, verbose=1, session=None):
     if not os.path.exists(data_dir):
         os.makedirs(data_dir)
 
+    # When downloading in parallel, all the needed urls are first fetched
+    # into temp_dir; the loop below then only moves and uncompresses them.
+    prefetched = {}
+    if effective_n_jobs(n_jobs) > 1:
+        prefetched = _prefetch_files(
+            data_dir,
+            temp_dir,
+            files,
+            resume=resume,
+            verbose=verbose,
+            session=session,
+            n_jobs=n_jobs,
+            progress_hook=progress_hook,
+        )
+
     # Abortion flag, in case of error
     abort = None
 
@@ -789,36 +974,31 @@ def fetch_files(data_dir, files, resume=True, verbose=1, session=None):
         # Whether to keep existing files
         overwrite = opts.get("overwrite", False)
         if abort is None and (
-            overwrite
-            or (
-                not os.path.exists(target_file)
-                and not os.path.exists(temp_target_file)
-            )
+            url in prefetched
+            or _needs_download(data_dir, temp_dir, file_, opts)
         ):
-            # We may be in a global read-only repository. If so, we cannot
-            # download files.
-            if not os.access(data_dir, os.W_OK):
-                raise ValueError(
-                    "Dataset files are missing but dataset"
-                    " repository is read-only. Contact your data"
-                    " administrator to solve the problem"
-                )
+            _check_writable(data_dir)
 
             if not os.path.exists(temp_dir):
                 os.mkdir(temp_dir)
             md5sum = opts.get("md5sum", None)
 
-            dl_file = fetch_single_file(
-                url,
-                temp_dir,
-                resume=resume,
-                verbose=verbose,
-                md5sum=md5sum,
-                username=opts.get("username", None),
-                password=opts.get("password", None),
-                session=session,
-                overwrite=overwrite,
-            )
+            dl_file = prefetched.pop(url, None)
+            if dl_file is not None:
+                dl_file = _use_prefetched(dl_file, temp_dir)
+            else:
+                dl_file = fetch_single_file(
+                    url,
+                    temp_dir,
+                    resume=resume,
+                    verbose=verbose,
+                    md5sum=md5sum,
+                    username=opts.get("username", None),
+                    password=opts.get("password", None),
+                    session=session,
+                    overwrite=overwrite,
+                    progress_hook=progress_hook,
+                )
             if "move" in opts:
                 # XXX: here, move is supposed to be a dir, it can be a name
                 move = os.path.join(temp_dir, opts["move"])
@@ -849,6 +1029,13 @@ def fetch_files(data_dir, files, resume=True, verbose=1, session=None):
                 shutil.rmtree(temp_dir)
             raise OSError(f"Fetching aborted: {abort}")
         files_.append(target_file)
+    # Downloads that turned out not to be needed, because their target was
+    # provided by another entry, are not moved to data_dir.
+    for dl_file in prefetched.values():
+        if os.path.exists(dl_file):
+            os.remove(dl_file)
+        if os.path.dirname(dl_file) != temp_dir:
+            shutil.rmtree(os.path.dirname(dl_file), ignore_errors=True)
     # If needed, move files from temps directory to final directory.
     if os.path.exists(temp_dir):
         # XXX We could only moved the files requested
@@ -1889,6 +1889,9 @@ def _download_talairach(talairach_dir, verbose):
         )[0]
         atlas_img = nb.load(temp_file, mmap=False)
         atlas_img = check_niimg(atlas_img)
+        # check_niimg does not read the data: read it before the file
+        # is removed
+        get_data(atlas_img)
     finally:
         shutil.rmtree(temp_dir)
     labels_text = atlas_img.header.extensions[0].get_content()
@@ -15,6 +15,7 @@ import nibabel
 import nibabel as nib
 import numpy as np
 import pandas as pd
+from joblib import effective_n_jobs
 from scipy.io import loadmat
 
 try:
@@ -1856,7 +1857,7 @@ def _fetch_development_fmri_participants(data_dir, url, verbose):
 
 @fill_doc
 def _fetch_development_fmri_functional(
-    participants, data_dir, url, resume, verbose
+    participants, data_dir, url, resume, verbose, n_jobs=1
 ):
     """Help to fetch_development_fmri.
 
@@ -1874,6 +1875,9 @@ def _fetch_development_fmri_functional(
     %(url)s
     %(resume)s
     %(verbose)s
+    n_jobs : :obj:`int`, default=1
+        The number of participants whose files are downloaded
+        concurrently.
 
     Returns
     -------
@@ -1915,37 +1919,44 @@ def _fetch_development_fmri_functional(
         names=names,
     )
 
-    funcs = []
-    regressors = []
-
+    files = []
     for participant_id in participants["participant_id"]:
         this_osf_id = osf_data[osf_data["participant_id"] == participant_id]
-        # Download regressors
+        # Regressors
         confound_url = url.format(this_osf_id["key_r"][0])
-        regressor_file = [
+        files.append(
             (
                 confounds.format(participant_id),
                 confound_url,
                 {"move": confounds.format(participant_id)},
             )
-        ]
-        path_to_regressor = fetch_files(
-            data_dir, regressor_file, verbose=verbose
-        )[0]
-        regressors.append(path_to_regressor)
-        # Download bold images
+        )
+        # Bold images
         func_url = url.format(this_osf_id["key_b"][0])
-        func_file = [
+        files.append(
             (
                 func.format(participant_id, participant_id),
                 func_url,
                 {"move": func.format(participant_id)},
             )
-        ]
-        path_to_func = fetch_files(
-            data_dir, func_file, resume=resume, verbose=verbose
-        )[0]
-        funcs.append(path_to_func)
+        )
+    # The files of n_jobs participants are downloaded concurrently.
+    # fetch_files only moves the files to data_dir once they are all
+    # downloaded, so small batches keep the files already downloaded if
+    # the download is interrupted.
+    batch_size = 2 * effective_n_jobs(n_jobs)
+    paths = []
+    for start in range(0, len(files), batch_size):
+        paths.extend(
+            fetch_files(
+                data_dir,
+                files[start : start + batch_size],
+                resume=resume,
+                verbose=verbose,
+                n_jobs=n_jobs,
+            )
+        )
+    regressors, funcs = paths[::2], paths[1::2]
     return funcs, regressors
 
 
@@ -1957,6 +1968,7 @@ def fetch_development_fmri(
     resume=True,
     verbose=1,
     age_group="both",
+    n_jobs=1,
 ):
     """Fetch movie watching based brain development dataset (fMRI).
 
@@ -1992,6 +2004,12 @@ def fetch_development_fmri(
         - 'child' = fetch children only (n=122, ages 3-12)
         - 'both' = fetch full sample (n=155)
 
+    n_jobs : :obj:`int`, default=1
+        The number of files downloaded concurrently. -1 means
+        'all CPUs'.
+
+        .. versionadded:: 0.11.0
+
     Returns
     -------
     data : Bunch
@@ -2084,6 +2102,7 @@ def fetch_development_fmri(
         url=None,
         resume=resume,
         verbose=verbose,
+        n_jobs=n_jobs,
     )
 
     if reduce_confounds:
@@ -7,20 +7,24 @@ import json
 import os
 import re
 import shutil
+import threading
 import traceback
 import uuid
 import warnings
 from collections.abc import Container
 from copy import copy, deepcopy
 from glob import glob
+from itertools import islice
 from tempfile import mkdtemp
 from urllib.parse import urlencode, urljoin
 
 import numpy as np
 import requests
-from sklearn.feature_extraction import DictVectorizer
+from joblib import Parallel, delayed, effective_n_jobs
+from scipy import sparse
 from sklearn.utils import Bunch
 
+from .._utils.cache_mixin import _check_memory, cache
 from ..image import resample_img
 from ._utils import fetch_single_file, get_dataset_descr, get_dataset_dir
 
@@ -35,6 +39,17 @@ _IM_FILTERS_AVAILABLE_ON_SERVER = ()
 _DEFAULT_BATCH_SIZE = 100
 _DEFAULT_MAX_IMAGES = 100
 
+# maximum number of connections kept open to each host
+_MAX_POOLED_CONNECTIONS = 32
+
+# file, at the root of the neurovault data directory, indexing the metadata
+# of the downloaded collections and images
+_LOCAL_INDEX_FILE = "metadata_index.jsonl"
+
+# creating the directory of a collection and writing its metadata is done by
+# one thread at a time
+_COLLECTION_LOCK = threading.Lock()
+
 STD_AFFINE = np.array(
     [
         [3.0, 0.0, 0.0, -90.0],
@@ -62,7 +77,14 @@ _ERROR = 0
 
 def _requests_session():
     if getattr(_requests_session, "session", None) is None:
-        _requests_session.session = requests.Session()
+        session = requests.Session()
+        # concurrent downloads share the connections of the pool
+        adapter = requests.adapters.HTTPAdapter(
+            pool_maxsize=_MAX_POOLED_CONNECTIONS
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _requests_session.session = session
     return _requests_session.session
 
 
@@ -1096,7 +1118,15 @@ def _scroll_server_results(
                     yield result
 
 
-def _yield_from_url_list(url_list, verbose=3):
+def _get_batch_or_none(query, verbose=3):
+    """Get a batch, or None if it could not be downloaded or decoded."""
+    try:
+        return _get_batch(query, verbose=verbose)
+    except Exception:
+        return None
+
+
+def _yield_from_url_list(url_list, verbose=3, n_jobs=1):
     """Get metadata coming from an explicit list of URLs.
 
     This is different from ``_scroll_server_results``, which is used
@@ -1110,6 +1140,9 @@ def _yield_from_url_list(url_list, verbose=3):
     verbose : int, default=3
         An integer in [0, 1, 2, 3] to control the verbosity level.
 
+    n_jobs : int, default=1
+        Number of URLs queried concurrently.
+
     Yields
     ------
     content : dict
@@ -1119,14 +1152,36 @@ def _yield_from_url_list(url_list, verbose=3):
         Once for each URL that resulted in an error, to signify failure.
 
     """
-    for url in url_list:
-        try:
-            batch = _get_batch(url, verbose=verbose)
-        except Exception:
-            yield None
-            batch = None
-        if batch is not None:
-            yield batch["results"][0]
+    for batches in _map_in_threads(
+        _get_batch_or_none, url_list, n_jobs, verbose=verbose
+    ):
+        for batch in batches:
+            yield None if batch is None else batch["results"][0]
+
+
+def _map_in_threads(func, items, n_jobs, **kwargs):
+    """Apply a function to items, in threads, a few items at a time.
+
+    Items are consumed lazily, ``effective_n_jobs(n_jobs)`` at a time, so
+    that a consumer which stops early wastes at most one window of work.
+
+    Yields
+    ------
+    results : list
+        The results for a window of items, in the order of the items.
+
+    """
+    window_size = effective_n_jobs(n_jobs)
+    items = iter(items)
+    window = list(islice(items, window_size))
+    while window:
+        if window_size == 1:
+            yield [func(window[0], **kwargs)]
+        else:
+            yield Parallel(n_jobs=n_jobs, prefer="threads")(
+                delayed(func)(item, **kwargs) for item in window
+            )
+        window = list(islice(items, window_size))
 
 
 def _simple_download(url, target_file, temp_dir, verbose=3):
@@ -1164,21 +1219,145 @@ def _simple_download(url, target_file, temp_dir, verbose=3):
 
     """
     _print_if(f"Downloading file: {url}", _DEBUG, verbose)
+    # files downloaded concurrently can have the same name in their URL
+    download_dir = mkdtemp(dir=temp_dir)
     try:
         downloaded = fetch_single_file(
-            url, temp_dir, resume=False, overwrite=True, verbose=0
+            url,
+            download_dir,
+            resume=False,
+            overwrite=True,
+            verbose=0,
+            session=_requests_session(),
         )
+        shutil.move(downloaded, target_file)
     except Exception:
         _print_if(f"Problem downloading file from {url}", _ERROR, verbose)
         raise
-    shutil.move(downloaded, target_file)
+    finally:
+        shutil.rmtree(download_dir, ignore_errors=True)
     _print_if(
         f"Download succeeded, downloaded to: {target_file}", _DEBUG, verbose
     )
     return target_file
 
 
-def neurosynth_words_vectorized(word_files, verbose=3, **kwargs):
+# number of word files parsed before their words are added to the matrix
+_WORD_FILES_CHUNK_SIZE = 1000
+
+
+def _load_word_weights(file_name, verbose=3):
+    """Load the ``{word: weight}`` dictionary of a Neurosynth words file.
+
+    An empty dictionary is returned if the file could not be read.
+    """
+    try:
+        with open(file_name, "rb") as word_file:
+            info = json.loads(word_file.read().decode("utf-8"))
+        return info["data"]["values"]
+    except Exception:
+        _print_if(
+            (
+                f"Could not load words from file {file_name}; "
+                f"error: {traceback.format_exc()}"
+            ),
+            _ERROR,
+            verbose,
+        )
+        return {}
+
+
+def _file_stat(file_name):
+    """Return the modification time and size of a file, if it exists."""
+    try:
+        file_stat = os.stat(file_name)
+    except (OSError, TypeError):
+        return None
+    return file_stat.st_mtime_ns, file_stat.st_size
+
+
+def _vectorize_words(
+    word_files,
+    file_stats=None,
+    dtype=np.float64,
+    sort=True,
+    n_jobs=1,
+    verbose=3,
+):
+    """Build the sparse (n files, vocabulary size) word weight matrix.
+
+    Files are parsed in chunks, in parallel, and the words of each chunk
+    are added to the vocabulary and to the matrix before the next chunk
+    is parsed.
+
+    ``file_stats`` is not used but makes the cached results of this
+    function depend on the modification times of the files.
+
+    Returns
+    -------
+    frequencies : scipy.sparse.csr_matrix or None
+        The word weights, None if no word could be loaded.
+
+    vocabulary : numpy.ndarray of str or None
+        The words corresponding to the columns of `frequencies`.
+
+    """
+    vocabulary = {}
+    indptr, indices, data = [0], [], []
+    word_files = list(word_files)
+    for start in range(0, len(word_files), _WORD_FILES_CHUNK_SIZE):
+        chunk = word_files[start : start + _WORD_FILES_CHUNK_SIZE]
+        if effective_n_jobs(n_jobs) == 1:
+            weights = [
+                _load_word_weights(file_name, verbose=verbose)
+                for file_name in chunk
+            ]
+        else:
+            weights = Parallel(n_jobs=n_jobs)(
+                delayed(_load_word_weights)(file_name, verbose=verbose)
+                for file_name in chunk
+            )
+        for file_weights in weights:
+            indices.append(
+                np.fromiter(
+                    (
+                        vocabulary.setdefault(word, len(vocabulary))
+                        for word in file_weights
+                    ),
+                    dtype=np.int64,
+                    count=len(file_weights),
+                )
+            )
+            data.append(
+                np.fromiter(
+                    file_weights.values(),
+                    dtype=dtype,
+                    count=len(file_weights),
+                )
+            )
+            indptr.append(indptr[-1] + len(file_weights))
+    if not vocabulary:
+        return None, None
+    words = np.asarray(list(vocabulary))
+    indices = np.concatenate(indices)
+    if sort:
+        # renumber the columns in the alphabetical order of the words
+        order = np.argsort(words)
+        words = words[order]
+        new_columns = np.empty_like(order)
+        new_columns[order] = np.arange(len(order))
+        indices = new_columns[indices]
+    frequencies = sparse.csr_matrix(
+        (np.concatenate(data), indices, np.asarray(indptr)),
+        shape=(len(word_files), len(words)),
+    )
+    frequencies.sort_indices()
+    return frequencies, words
+
+
+def neurosynth_words_vectorized(
+    word_files, verbose=3, n_jobs=1, memory=None, **kwargs
+):
     """Load Neurosynth data from disk into an (n images, voc size) matrix.
 
     Neurosynth data is saved on disk as ``{word: weight}``
@@ -1195,56 +1374,77 @@ def neurosynth_words_vectorized(word_files, verbose=3, **kwargs):
     verbose : int, default=3
         An integer in [0, 1, 2, 3] to control the verbosity level.
 
-    Keyword arguments are passed on to
-    ``sklearn.feature_extraction.DictVectorizer``.
+    n_jobs : :obj:`int`, default=1
+        Number of processes parsing the word files.
+        `-1` means as many as there are CPUs.
+
+        .. versionadded:: 0.11.0
+
+    memory : None, instance of :class:`joblib.Memory`, :obj:`str`, or \
+             :class:`pathlib.Path`, optional
+        Used to cache the matrix and vocabulary, keyed by the paths,
+        modification times and sizes of the word files, so that they are
+        only built again when a word file is added or modified.
+        By default, no caching is done.
+
+        .. versionadded:: 0.11.0
+
+    Keyword arguments ``dtype`` (default ``numpy.float64``), ``sort``
+    (default ``True``) and ``sparse`` (default ``False``) have the same
+    meaning as for ``sklearn.feature_extraction.DictVectorizer``.
 
     Returns
     -------
-    frequencies : numpy.ndarray
+    frequencies : numpy.ndarray or scipy.sparse.csr_matrix
         An (n images, vocabulary size) array. Each row corresponds to
         an image, and each column corresponds to a word. The words are
         in the same order as in returned value `vocabulary`, so that
         `frequencies[i, j]` corresponds to the weight of
-        `vocabulary[j]` for image ``i``.  This matrix is computed by
-        an ``sklearn.feature_extraction.DictVectorizer`` instance.
+        `vocabulary[j]` for image ``i``. It is a sparse matrix if
+        ``sparse=True`` is passed.
 
-    vocabulary : list of str
-        A list of all the words encountered in the word files.
+    vocabulary : numpy.ndarray of str
+        All the words encountered in the word files.
 
     See Also
     --------
     sklearn.feature_extraction.DictVectorizer
 
     """
+    dtype = kwargs.pop("dtype", np.float64)
+    sort = kwargs.pop("sort", True)
+    sparse_output = kwargs.pop("sparse", False)
+    if kwargs:
+        raise TypeError(
+            "neurosynth_words_vectorized got unexpected keyword arguments: "
+            f"{sorted(kwargs)}"
+        )
     _print_if("Computing word features.", _INFO, verbose)
-    words = []
-    voc_empty = True
-    for file_name in word_files:
-        try:
-            with open(file_name, "rb") as word_file:
-                info = json.loads(word_file.read().decode("utf-8"))
-                words.append(info["data"]["values"])
-                if info["data"]["values"] != {}:
-                    voc_empty = False
-        except Exception:
-            _print_if(
-                (
-                    f"Could not load words from file {file_name}; "
-                    f"error: {traceback.format_exc()}"
-                ),
-                _ERROR,
-                verbose,
-            )
-            words.append({})
-    if voc_empty:
+    word_files = list(word_files)
+    memory = _check_memory(memory)
+    if memory.location is None:
+        frequencies, vocabulary = _vectorize_words(
+            word_files, dtype=dtype, sort=sort, n_jobs=n_jobs, verbose=verbose
+        )
+    else:
+        frequencies, vocabulary = cache(
+            _vectorize_words, memory, ignore=["n_jobs", "verbose"]
+        )(
+            word_files,
+            file_stats=[_file_stat(file_name) for file_name in word_files],
+            dtype=dtype,
+            sort=sort,
+            n_jobs=n_jobs,
+            verbose=verbose,
+        )
+    if vocabulary is None:
         warnings.warn(
             "No word weight could be loaded, "
             "vectorizing Neurosynth words failed."
         )
         return None, None
-    vectorizer = DictVectorizer(**kwargs)
-    frequencies = vectorizer.fit_transform(words).toarray()
-    vocabulary = np.asarray(vectorizer.feature_names_)
+    if not sparse_output:
+        frequencies = frequencies.toarray()
     _print_if(
         f"Computing word features done; vocabulary size: {vocabulary.size}",
         _INFO,
@@ -1353,9 +1553,98 @@ def _json_from_file(file_name):
     return loaded
 
 
-def _json_add_collection_dir(file_name, force=True):
+def _load_local_index(nv_data_dir):
+    """Load the index of the local metadata files.
+
+    The index is a JSON-lines file listing, for each metadata file
+    which has been read, its path relative to `nv_data_dir`, its
+    modification time and size, and its content.
+
+    Parameters
+    ----------
+    nv_data_dir : str
+        The neurovault data directory.
+
+    Returns
+    -------
+    index : dict
+        Maps the absolute paths of the metadata files to a
+        ``(mtime_ns, size, metadata)`` tuple.
+
+    """
+    index = {}
+    index_file = os.path.join(nv_data_dir, _LOCAL_INDEX_FILE)
+    if not os.path.isfile(index_file):
+        return index
+    try:
+        with open(index_file, "rb") as index_lines:
+            for line in index_lines:
+                entry = json.loads(line.decode("utf-8"))
+                index[os.path.join(nv_data_dir, entry["file"])] = (
+                    entry["mtime_ns"],
+                    entry["size"],
+                    entry["metadata"],
+                )
+    except (ValueError, KeyError):
+        # a corrupted index is rebuilt from the metadata files
+        return {}
+    return index
+
+
+def _save_local_index(nv_data_dir, index):
+    """Save the index of the local metadata files.
+
+    Entries for files which no longer exist are dropped. Nothing is
+    saved if the data directory is not writable.
+
+    """
+    index_file = os.path.join(nv_data_dir, _LOCAL_INDEX_FILE)
+    tmp_file = f"{index_file}.{uuid.uuid1()}"
+    try:
+        with open(tmp_file, "wb") as index_lines:
+            for file_name, (mtime_ns, size, metadata) in index.items():
+                if not os.path.isfile(file_name):
+                    continue
+                entry = {
+                    "file": os.path.relpath(file_name, nv_data_dir),
+                    "mtime_ns": mtime_ns,
+                    "size": size,
+                    "metadata": metadata,
+                }
+                index_lines.write(f"{json.dumps(entry)}\n".encode("utf-8"))
+        os.replace(tmp_file, index_file)
+    except OSError:
+        if os.path.isfile(tmp_file):
+            os.remove(tmp_file)
+
+
+def _indexed_json_from_file(file_name, index=None):
+    """Load a json file, from the local index if it is up to date.
+
+    If the file was modified since it was indexed, it is read again
+    and its entry in `index` is updated.
+
+    """
+    if index is None:
+        return _json_from_file(file_name)
+    file_stat = os.stat(file_name)
+    entry = index.get(file_name)
+    if entry is None or entry[:2] != (
+        file_stat.st_mtime_ns,
+        file_stat.st_size,
+    ):
+        entry = (
+            file_stat.st_mtime_ns,
+            file_stat.st_size,
+            _json_from_file(file_name),
+        )
+        index[file_name] = entry
+    return dict(entry[2])
+
+
+def _json_add_collection_dir(file_name, force=True, index=None):
     """Load a json file and add is parent dir to resulting dict."""
-    loaded = _json_from_file(file_name)
+    loaded = _indexed_json_from_file(file_name, index)
     set_func = loaded.__setitem__ if force else loaded.setdefault
     dir_path = os.path.dirname(file_name)
     set_func("absolute_path", dir_path)
@@ -1363,9 +1652,9 @@ def _json_add_collection_dir(file_name, force=True):
     return loaded
 
 
-def _json_add_im_files_paths(file_name, force=True):
+def _json_add_im_files_paths(file_name, force=True, index=None):
     """Load a json file and add image and words paths."""
-    loaded = _json_from_file(file_name)
+    loaded = _indexed_json_from_file(file_name, index)
     set_func = loaded.__setitem__ if force else loaded.setdefault
     dir_path = os.path.dirname(file_name)
     dir_relative_path = os.path.basename(dir_path)
@@ -1412,8 +1701,7 @@ def _download_collection(collection, download_params):
     )
     collection["relative_path"] = collection_name
     collection["absolute_path"] = collection_dir
-    if not os.path.isdir(collection_dir):
-        os.makedirs(collection_dir)
+    os.makedirs(collection_dir, exist_ok=True)
     metadata_file_path = os.path.join(
         collection_dir, "collection_metadata.json"
     )
@@ -1448,16 +1736,19 @@ def _fetch_collection_for_image(image_info, download_params):
     collection_absolute_path = os.path.join(
         download_params["nv_data_dir"], collection_relative_path
     )
-    if os.path.isdir(collection_absolute_path):
-        return _json_add_collection_dir(
-            os.path.join(collection_absolute_path, "collection_metadata.json")
-        )
+    with _COLLECTION_LOCK:
+        if os.path.isdir(collection_absolute_path):
+            return _json_add_collection_dir(
+                os.path.join(
+                    collection_absolute_path, "collection_metadata.json"
+                )
+            )
 
-    col_batch = _get_batch(
-        urljoin(_NEUROVAULT_COLLECTIONS_URL, str(collection_id)),
-        verbose=download_params["verbose"],
-    )
-    return _download_collection(col_batch["results"][0], download_params)
+        col_batch = _get_batch(
+            urljoin(_NEUROVAULT_COLLECTIONS_URL, str(collection_id)),
+            verbose=download_params["verbose"],
+        )
+        return _download_collection(col_batch["results"][0], download_params)
 
 
 def _download_image_nii_file(image_info, collection, download_params):
@@ -1662,7 +1953,51 @@ def _download_image(image_info, download_params):
     return image_info
 
 
-def _update_image(image_info, download_params):
+def _try_download_image(image_info, download_params):
+    """Download a Neurovault image, returning None if it failed."""
+    try:
+        return _download_image(image_info, download_params)
+    except Exception:
+        _print_if(
+            f"_scroll_collection: bad image: {image_info}",
+            _ERROR,
+            download_params["verbose"],
+            with_traceback=True,
+        )
+        return None
+
+
+def _download_images(images, download_params):
+    """Download Neurovault images, ``download_params['n_jobs']`` at a time.
+
+    Parameters
+    ----------
+    images : iterable of dict or None
+        Image metadata. ``None`` signifies a failed metadata download.
+
+    download_params : dict
+       General information about download session, containing e.g. the
+       data directory (see `_read_download_params` and
+       `_prepare_download_params for details`)
+
+    Yields
+    ------
+    image : dict or None
+        Metadata for an image, with local paths added to it, or
+        ``None`` if the image could not be downloaded. Images are
+        yielded in the order in which they were given.
+
+    """
+    for window in _map_in_threads(
+        _try_download_image,
+        images,
+        download_params["n_jobs"],
+        download_params=download_params,
+    ):
+        yield from window
+
+
+def _update_image(image_info, download_params, collection=None):
     """Update local metadata for an image.
 
     If required and necessary, download the Neurosynth tags.
@@ -1677,6 +2012,10 @@ def _update_image(image_info, download_params):
        data directory (see `_read_download_params` and
        `_prepare_download_params for details`)
 
+    collection : dict, optional
+        Corresponding collection metadata. If ``None``, it is read from
+        disk or downloaded.
+
     Returns
     -------
     image_info : dict
@@ -1686,10 +2025,17 @@ def _update_image(image_info, download_params):
     if not download_params["write_ok"]:
         return image_info
     try:
-        collection = _fetch_collection_for_image(image_info, download_params)
-        image_info, collection = _download_image_terms(
+        if collection is None:
+            collection = _fetch_collection_for_image(
+                image_info, download_params
+            )
+        updated_info, collection = _download_image_terms(
             image_info, collection, download_params
         )
+        # rewriting unchanged metadata would invalidate the local index
+        if updated_info == image_info:
+            return image_info
+        image_info = updated_info
         metadata_file_path = os.path.join(
             os.path.dirname(image_info["absolute_path"]),
             f"image_{image_info['id']}_metadata.json",
@@ -1706,7 +2052,7 @@ def _update_image(image_info, download_params):
 
 def _update(image_info, collection, download_params):
     """Update local metadata for an image and its collection."""
-    image_info = _update_image(image_info, download_params)
+    image_info = _update_image(image_info, download_params, collection)
     return image_info, collection
 
 
@@ -1728,49 +2074,62 @@ def _scroll_local(download_params):
     collection : dict
         Metadata for the corresponding collection.
 
+    Notes
+    -----
+    The metadata files are read through an index saved in the data
+    directory, so that only the files modified since the last call are
+    parsed again.
+
     """
     _print_if(
         "Reading local neurovault data.", _DEBUG, download_params["verbose"]
     )
+    nv_data_dir = download_params["nv_data_dir"]
+    index = _load_local_index(nv_data_dir)
 
     collections = glob(
-        os.path.join(
-            download_params["nv_data_dir"], "*", "collection_metadata.json"
-        )
+        os.path.join(nv_data_dir, "*", "collection_metadata.json")
     )
 
-    good_collections = (
+    good_collections = [
         col
-        for col in (_json_add_collection_dir(col) for col in collections)
+        for col in (
+            _json_add_collection_dir(col, index=index) for col in collections
+        )
         if download_params["local_collection_filter"](col)
-    )
+    ]
+    local_data = []
     for collection in good_collections:
         images = glob(
             os.path.join(collection["absolute_path"], "image_*_metadata.json")
         )
-
-        good_images = (
-            img
-            for img in (_json_add_im_files_paths(img) for img in images)
+        local_data.extend(
+            (img, collection)
+            for img in (
+                _json_add_im_files_paths(img, index=index) for img in images
+            )
             if download_params["local_image_filter"](img)
         )
-        for image in good_images:
-            image, collection = _update(image, collection, download_params)
-            if download_params["resample"]:
-                if not os.path.isfile(image["resampled_absolute_path"]):
-                    im_resampled = resample_img(
-                        img=image["absolute_path"],
-                        target_affine=STD_AFFINE,
-                        interpolation=download_params["interpolation"],
-                    )
-                    im_resampled.to_filename(image["resampled_absolute_path"])
-                download_params["visited_images"].add(image["id"])
-                download_params["visited_collections"].add(collection["id"])
-                yield image, collection
-            elif os.path.isfile(image["absolute_path"]):
-                download_params["visited_images"].add(image["id"])
-                download_params["visited_collections"].add(collection["id"])
-                yield image, collection
+    if download_params["write_ok"]:
+        _save_local_index(nv_data_dir, index)
+
+    for image, collection in local_data:
+        image, collection = _update(image, collection, download_params)
+        if download_params["resample"]:
+            if not os.path.isfile(image["resampled_absolute_path"]):
+                im_resampled = resample_img(
+                    img=image["absolute_path"],
+                    target_affine=STD_AFFINE,
+                    interpolation=download_params["interpolation"],
+                )
+                im_resampled.to_filename(image["resampled_absolute_path"])
+            download_params["visited_images"].add(image["id"])
+            download_params["visited_collections"].add(collection["id"])
+            yield image, collection
+        elif os.path.isfile(image["absolute_path"]):
+            download_params["visited_images"].add(image["id"])
+            download_params["visited_collections"].add(collection["id"])
+            yield image, collection
 
 
 def _scroll_collection(collection, download_params):
@@ -1813,23 +2172,13 @@ def _scroll_collection(collection, download_params):
         verbose=download_params["verbose"],
     )
 
-    for image in images:
+    for image in _download_images(images, download_params):
         if image is None:
-            yield None
-        try:
-            image = _download_image(image, download_params)
+            fails_in_collection += 1
+        else:
             fails_in_collection = 0
             n_im_in_collection += 1
-            yield image
-        except Exception:
-            fails_in_collection += 1
-            _print_if(
-                f"_scroll_collection: bad image: {image}",
-                _ERROR,
-                download_params["verbose"],
-                with_traceback=True,
-            )
-            yield None
+        yield image
         if fails_in_collection == download_params["max_fails_in_collection"]:
             _print_if(
                 (
@@ -1947,7 +2296,9 @@ def _scroll_collection_ids(download_params):
         )
 
     collections = _yield_from_url_list(
-        collection_urls, verbose=download_params["verbose"]
+        collection_urls,
+        verbose=download_params["verbose"],
+        n_jobs=download_params["n_jobs"],
     )
     for collection in collections:
         collection = _download_collection(collection, download_params)
@@ -1988,11 +2339,12 @@ def _scroll_image_ids(download_params):
     ]
 
     images = _yield_from_url_list(
-        image_urls, verbose=download_params["verbose"]
+        image_urls,
+        verbose=download_params["verbose"],
+        n_jobs=download_params["n_jobs"],
     )
-    for image in images:
+    for image in _download_images(images, download_params):
         try:
-            image = _download_image(image, download_params)
             collection = _json_add_collection_dir(
                 os.path.join(
                     os.path.dirname(image["absolute_path"]),
@@ -2227,6 +2579,7 @@ def _read_download_params(
     verbose=3,
     fetch_neurosynth_words=False,
     vectorize_words=True,
+    n_jobs=1,
 ):
     """Create a dictionary containing download information."""
     download_params = {"verbose": verbose}
@@ -2263,6 +2616,7 @@ def _read_download_params(
         download_params["nv_data_dir"], os.W_OK
     )
     download_params["vectorize_words"] = vectorize_words
+    download_params["n_jobs"] = n_jobs
     return download_params
 
 
@@ -2379,6 +2733,7 @@ def _result_list_to_bunch(result_list, download_params):
         ) = neurosynth_words_vectorized(
             [meta.get("ns_words_absolute_path") for meta in images_meta],
             verbose=download_params["verbose"],
+            n_jobs=download_params["n_jobs"],
         )
     return result
 
@@ -2405,6 +2760,7 @@ def _fetch_neurovault_implementation(
     interpolation="continuous",
     vectorize_words=True,
     verbose=3,
+    n_jobs=1,
     **kwarg_image_filters,
 ):
     """Download data from neurovault.org and neurosynth.org."""
@@ -2437,6 +2793,7 @@ def _fetch_neurovault_implementation(
         verbose=verbose,
         fetch_neurosynth_words=fetch_neurosynth_words,
         vectorize_words=vectorize_words,
+        n_jobs=n_jobs,
     )
     download_params = _prepare_download_params(download_params)
 
@@ -2459,6 +2816,7 @@ def fetch_neurovault(
     resample=False,
     vectorize_words=True,
     verbose=3,
+    n_jobs=1,
     **kwarg_image_filters,
 ):
     """Download data from neurovault.org that match certain criteria.
@@ -2539,6 +2897,14 @@ def fetch_neurovault(
     verbose : int, default=3
         An integer in [0, 1, 2, 3] to control the verbosity level.
 
+    n_jobs : :obj:`int`, default=1
+        Number of images downloaded concurrently, in threads sharing a
+        pool of connections. `-1` means as many as there are CPUs.
+        Images are still returned in the order in which they are listed
+        by the server.
+
+        .. versionadded:: 0.11.0
+
     kwarg_image_filters
         Keyword arguments are understood to be filter terms for
         images, so for example ``map_type='Z map'`` means only
@@ -2576,6 +2942,9 @@ def fetch_neurovault(
     Notes
     -----
     Images and collections from disk are fetched before remote data.
+    The metadata of the local collections and images is read through an
+    index, saved in the data directory, so that it is only parsed again
+    when it is modified.
 
     Some helpers are provided in the ``neurovault`` module to express
     filtering criteria more concisely:
@@ -2682,6 +3051,7 @@ def fetch_neurovault(
         resample=resample,
         vectorize_words=vectorize_words,
         verbose=verbose,
+        n_jobs=n_jobs,
         **kwarg_image_filters,
     )
 
@@ -2695,6 +3065,7 @@ def fetch_neurovault_ids(
     resample=False,
     vectorize_words=True,
     verbose=3,
+    n_jobs=1,
 ):
     """Download specific images and collections from neurovault.org.
 
@@ -2745,6 +3116,14 @@ def fetch_neurovault_ids(
     verbose : int, default=3
         An integer in [0, 1, 2, 3] to control the verbosity level.
 
+    n_jobs : :obj:`int`, default=1
+        Number of images downloaded concurrently, in threads sharing a
+        pool of connections. `-1` means as many as there are CPUs.
+        Images are still returned in the order in which they are listed
+        by the server.
+
+        .. versionadded:: 0.11.0
+
     Returns
     -------
     Bunch
@@ -2797,6 +3176,7 @@ def fetch_neurovault_ids(
         resample=resample,
         vectorize_words=vectorize_words,
         verbose=verbose,
+        n_jobs=n_jobs,
     )
 
 
@@ -1,6 +1,5 @@
 """Downloading NeuroImaging datasets: structural datasets."""
 
-import functools
 import os
 import warnings
 from pathlib import Path
@@ -11,6 +10,7 @@ from scipy.ndimage import binary_closing
 from sklearn.utils import Bunch
 
 from .._utils import check_niimg, fill_doc
+from .._utils.cache_mixin import _lru_cache, clear_in_memory_caches
 from ..image import get_data, new_img_like, resampling
 from ._utils import fetch_files, get_dataset_descr, get_dataset_dir
 
@@ -169,7 +169,7 @@ def fetch_icbm152_2009(data_dir=None, url=None, resume=True, verbose=1):
     return Bunch(**params)
 
 
-@functools.lru_cache(maxsize=3)
+@_lru_cache(maxsize=3)
 def load_mni152_template(resolution=None):
     """Load the MNI152 skullstripped T1 template.
 
@@ -230,6 +230,7 @@ def load_mni152_template(resolution=None):
     return new_brain_template
 
 
+@_lru_cache(maxsize=3)
 def load_mni152_gm_template(resolution=None):
     """Load the MNI152 grey-matter template.
 
@@ -280,6 +281,7 @@ def load_mni152_gm_template(resolution=None):
     return new_gm_template
 
 
+@_lru_cache(maxsize=3)
 def load_mni152_wm_template(resolution=None):
     """Load the MNI152 white-matter template.
 
@@ -331,6 +333,36 @@ def load_mni152_wm_template(resolution=None):
     return new_wm_template
 
 
+def clear_template_cache():
+    """Empty the in-memory caches of templates, meshes and backgrounds.
+
+    Nilearn keeps in memory, so that many calls (e.g. to plot many
+    images) only load or compute them once:
+
+    - the MNI152 templates loaded with a given resolution,
+    - the surface meshes read from mesh files,
+    - the backgrounds of the plotting functions,
+    - the operators projecting images on surfaces in
+      :func:`~nilearn.surface.vol_to_surf`,
+    - the indexes of the directories of the last :term:`BIDS` datasets
+      queried.
+
+    Each of these caches holds a few items at most, and is shared with
+    the processes forked after it was filled. This function empties all
+    of them and releases the memory they use.
+
+    .. versionadded:: 0.11.0
+
+    See Also
+    --------
+    nilearn.datasets.load_mni152_template
+    nilearn.surface.load_surf_mesh
+    nilearn.surface.vol_to_surf
+
+    """
+    clear_in_memory_caches()
+
+
 def load_mni152_brain_mask(resolution=None, threshold=0.2):
     """Load the MNI152 whole-brain mask.
 
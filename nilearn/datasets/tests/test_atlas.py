@@ -731,6 +731,28 @@ def test_fetch_atlas_talairach(tmp_path, request_mocker):
         atlas.fetch_atlas_talairach("bad_level")
 
 
+def test_fetch_atlas_talairach_reads_data_before_cleanup(
+    tmp_path, request_mocker, monkeypatch
+):
+    """The downloaded atlas is removed after its levels are separated, so \
+    its data must be read while the file exists."""
+    request_mocker.url_mapping["*talairach.nii"] = _get_small_fake_talairach()
+    temp_dirs = []
+    mkdtemp = atlas.mkdtemp
+
+    def recording_mkdtemp(*args, **kwargs):
+        temp_dirs.append(mkdtemp(*args, **kwargs))
+        return temp_dirs[-1]
+
+    monkeypatch.setattr(atlas, "mkdtemp", recording_mkdtemp)
+
+    talairach = atlas.fetch_atlas_talairach("gyrus", data_dir=tmp_path)
+
+    assert len(temp_dirs) == 1
+    assert not Path(temp_dirs[0]).exists()
+    assert get_data(talairach.maps).shape == (3, 9, 9)
+
+
 def test_fetch_atlas_pauli_2017(tmp_path, request_mocker):
     labels = pd.DataFrame({"label": [f"label_{i}" for i in range(16)]}).to_csv(
         sep="\t", header=False
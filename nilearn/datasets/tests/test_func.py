@@ -17,7 +17,7 @@ import pandas as pd
 import pytest
 from sklearn.utils import Bunch
 
-from nilearn.datasets import func
+from nilearn.datasets import _utils, func
 from nilearn.datasets._utils import get_dataset_dir
 from nilearn.datasets.tests._testing import dict_to_archive, list_to_archive
 from nilearn.image import load_img
@@ -620,14 +620,55 @@ def test_fetch_development_fmri_participants(tmp_path, request_mocker):
     assert participants.shape == (5,)
 
 
-def test_fetch_development_fmri_functional(tmp_path):
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_fetch_development_fmri_functional(tmp_path, n_jobs):
     mock_participants = _mock_participants_data(n_ids=8)
     funcs, confounds = func._fetch_development_fmri_functional(
-        mock_participants, data_dir=tmp_path, url=None, resume=True, verbose=1
+        mock_participants,
+        data_dir=tmp_path,
+        url=None,
+        resume=True,
+        verbose=1,
+        n_jobs=n_jobs,
     )
 
     assert len(funcs) == 8
     assert len(confounds) == 8
+    for participant_id, func_, confound in zip(
+        mock_participants["participant_id"], funcs, confounds
+    ):
+        assert os.path.basename(func_).startswith(participant_id)
+        assert func_.endswith("_bold.nii.gz")
+        assert os.path.basename(confound).startswith(participant_id)
+        assert confound.endswith("_regressors.tsv")
+
+
+@pytest.mark.parametrize("n_jobs, n_batches", [(1, 8), (3, 3)])
+def test_fetch_development_fmri_functional_batches(
+    tmp_path, monkeypatch, n_jobs, n_batches
+):
+    # the files are moved to data_dir after each batch of participants
+    batches = []
+
+    def fetch_files(data_dir, files, **kwargs):
+        batches.append(files)
+        return _utils.fetch_files(data_dir, files, **kwargs)
+
+    monkeypatch.setattr(func, "fetch_files", fetch_files)
+    mock_participants = _mock_participants_data(n_ids=8)
+    func._fetch_development_fmri_functional(
+        mock_participants,
+        data_dir=tmp_path,
+        url=None,
+        resume=True,
+        verbose=0,
+        n_jobs=n_jobs,
+    )
+
+    assert len(batches) == n_batches
+    assert [len(files) for files in batches[:-1]] == [2 * n_jobs] * (
+        n_batches - 1
+    )
 
 
 def test_fetch_development_fmri(tmp_path, request_mocker):
@@ -13,6 +13,8 @@ import numpy as np
 import pandas as pd
 import pytest
 import requests
+from scipy import sparse
+from sklearn.feature_extraction import DictVectorizer
 
 from nilearn._utils.data_gen import generate_fake_fmri
 from nilearn.conftest import _rng
@@ -563,6 +565,77 @@ def test_neurosynth_words_vectorized(tmp_path):
     assert (freq.sum(axis=0) == np.ones(n_im)).all()
 
 
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_neurosynth_words_vectorized_matches_dict_vectorizer(
+    tmp_path, monkeypatch, n_jobs
+):
+    rng = _rng()
+    vocabulary = np.asarray(["b", "c", "a", "e", "d"])
+    weights = []
+    words_files = []
+    for i in range(7):
+        words = rng.choice(vocabulary, size=rng.integers(1, 5), replace=False)
+        weights.append(dict(zip(words, rng.random(len(words)))))
+        words_files.append(tmp_path / f"words_for_image_{i}.json")
+        with open(words_files[-1], "wb") as words_file:
+            words_file.write(
+                json.dumps({"data": {"values": weights[-1]}}).encode("utf-8")
+            )
+    words_files.append(tmp_path / "missing.json")
+    weights.append({})
+    monkeypatch.setattr(neurovault, "_WORD_FILES_CHUNK_SIZE", 3)
+
+    freq, voc = neurovault.neurosynth_words_vectorized(
+        words_files, n_jobs=n_jobs, sparse=True
+    )
+    vectorizer = DictVectorizer()
+    expected = vectorizer.fit_transform(weights).toarray()
+
+    assert sparse.isspmatrix_csr(freq)
+    assert list(voc) == vectorizer.feature_names_
+    np.testing.assert_array_equal(freq.toarray(), expected)
+
+    freq, voc = neurovault.neurosynth_words_vectorized(
+        words_files, sort=False, dtype="float32"
+    )
+
+    assert freq.dtype == np.float32
+    np.testing.assert_allclose(freq[:, np.argsort(voc)], expected, rtol=1e-6)
+
+
+def test_neurosynth_words_vectorized_cache(tmp_path):
+    words_file = tmp_path / "words_for_image_0.json"
+    words_file.write_text(json.dumps({"data": {"values": {"a": 1.0}}}))
+    memory = tmp_path / "cache"
+
+    _, voc = neurovault.neurosynth_words_vectorized(
+        [words_file], memory=memory
+    )
+    # n_jobs and verbose do not change the result
+    _, voc_cached = neurovault.neurosynth_words_vectorized(
+        [words_file], memory=memory, n_jobs=2, verbose=0
+    )
+
+    assert list(voc) == list(voc_cached) == ["a"]
+    assert len(list(memory.glob("**/_vectorize_words/*/output.pkl"))) == 1
+
+    # modifying a file invalidates the cache
+    words_file.write_text(
+        json.dumps({"data": {"values": {"a": 1.0, "bb": 2.0}}})
+    )
+    freq, voc = neurovault.neurosynth_words_vectorized(
+        [words_file], memory=memory
+    )
+
+    assert list(voc) == ["a", "bb"]
+    np.testing.assert_array_equal(freq, [[1.0, 2.0]])
+
+
+def test_neurosynth_words_vectorized_unexpected_kwargs(tmp_path):
+    with pytest.raises(TypeError, match="separator"):
+        neurovault.neurosynth_words_vectorized([], separator=":")
+
+
 def test_neurosynth_words_vectorized_warning(tmp_path):
     with pytest.warns(UserWarning):
         neurovault.neurosynth_words_vectorized(
@@ -647,6 +720,39 @@ def test_json_add_im_files_paths(tmp_path):
     assert loaded.get("neurosynth_words_relative_path") is None
 
 
+def test_local_index(tmp_path, monkeypatch):
+    coll_dir = tmp_path / "collection_1"
+    coll_dir.mkdir()
+    im_file_name = str(coll_dir / "image_1_metadata.json")
+    neurovault._write_metadata({"id": 1}, im_file_name)
+    index = neurovault._load_local_index(str(tmp_path))
+
+    assert index == {}
+    assert neurovault._indexed_json_from_file(im_file_name, index) == {"id": 1}
+
+    neurovault._save_local_index(str(tmp_path), index)
+    index = neurovault._load_local_index(str(tmp_path))
+
+    assert index[im_file_name][2] == {"id": 1}
+
+    # up to date entries are not read from the metadata files
+    with monkeypatch.context() as m:
+        m.setattr(neurovault, "_json_from_file", None)
+        loaded = neurovault._json_add_im_files_paths(im_file_name, index=index)
+
+    assert loaded["id"] == 1
+    assert loaded["relative_path"] == os.path.join(
+        "collection_1", "image_1.nii.gz"
+    )
+
+    neurovault._write_metadata({"id": 1, "a": "b"}, im_file_name)
+
+    assert neurovault._indexed_json_from_file(im_file_name, index) == {
+        "id": 1,
+        "a": "b",
+    }
+
+
 def test_split_terms():
     terms, server_terms = neurovault._split_terms(
         {
@@ -782,6 +888,37 @@ def test_fetch_neurovault(tmp_path):
         neurovault.fetch_neurovault(data_dir=tmp_path)
 
 
+def test_fetch_neurovault_n_jobs(tmp_path, monkeypatch):
+    data = neurovault.fetch_neurovault(
+        max_images=11, data_dir=tmp_path / "sequential"
+    )
+    data_parallel = neurovault.fetch_neurovault(
+        max_images=11, data_dir=tmp_path / "parallel", n_jobs=3
+    )
+
+    assert len(data_parallel.images) == 11
+    assert [meta["id"] for meta in data_parallel.images_meta] == [
+        meta["id"] for meta in data.images_meta
+    ]
+    assert os.path.isfile(
+        tmp_path / "parallel" / "neurovault" / neurovault._LOCAL_INDEX_FILE
+    )
+
+    # local metadata is indexed when it is first read, and then read from
+    # the index
+    neurovault.fetch_neurovault(
+        max_images=None, data_dir=tmp_path / "parallel", mode="offline"
+    )
+    monkeypatch.setattr(neurovault, "_json_from_file", None)
+    data_local = neurovault.fetch_neurovault(
+        max_images=None, data_dir=tmp_path / "parallel", mode="offline"
+    )
+
+    assert {meta["id"] for meta in data_local.images_meta} >= {
+        meta["id"] for meta in data.images_meta
+    }
+
+
 def test_fetch_neurovault_errors(capsys, request_mocker):
     """Test that errors are logged when the server returns an error code.
 
@@ -825,6 +962,17 @@ def test_fetch_neurovault_ids(tmp_path):
         == data["collections_meta"][0]["absolute_path"]
     )
 
+    data_parallel = neurovault.fetch_neurovault_ids(
+        image_ids=img_ids,
+        collection_ids=col_ids,
+        data_dir=tmp_path / "parallel",
+        n_jobs=2,
+    )
+
+    assert [img["id"] for img in data_parallel["images_meta"]] == [
+        img["id"] for img in data["images_meta"]
+    ]
+
     # check image can be loaded again from disk
     data = neurovault.fetch_neurovault_ids(
         image_ids=[img_ids[0]], data_dir=tmp_path, mode="offline"
@@ -117,6 +117,16 @@ def test_load_mni152(func, resolution):
     assert img.header.get_zooms() == expected_zooms
 
 
+def test_clear_template_cache():
+    img = struct.load_mni152_template(resolution=2)
+
+    assert struct.load_mni152_template(resolution=2) is img
+
+    struct.clear_template_cache()
+
+    assert struct.load_mni152_template(resolution=2) is not img
+
+
 def test_fetch_icbm152_brain_gm_mask(tmp_path):
     dataset = struct.fetch_icbm152_2009(data_dir=str(tmp_path), verbose=0)
     struct.load_mni152_template(resolution=2).to_filename(dataset.gm)
@@ -4,9 +4,13 @@
 
 import contextlib
 import gzip
+import hashlib
+import http.server
 import os
+import pickle
 import shutil
 import tarfile
+import threading
 import urllib
 import zipfile
 from tempfile import mkdtemp, mkstemp
@@ -18,6 +22,10 @@ import requests
 
 from nilearn.datasets import _utils
 
+# the autouse request_mocker fixture replaces it, keep the original to
+# test downloads from a local server
+_SESSION_SEND = requests.sessions.Session.send
+
 currdir = os.path.dirname(os.path.abspath(__file__))
 datadir = os.path.join(currdir, "data")
 
@@ -506,6 +514,160 @@ def test_fetch_files_overwrite(
         assert fp.read() == ""
 
 
+def test_fetch_files_parallel(tmp_path, request_mocker):
+    contents = {f"{i}.txt": f"content {i}".encode() for i in range(6)}
+    for name, content in contents.items():
+        request_mocker.url_mapping[f"*/{name}"] = content
+    files = [
+        (
+            name,
+            f"http://foo/{name}",
+            {"md5sum": hashlib.md5(content).hexdigest()},
+        )
+        for name, content in contents.items()
+    ]
+    progress = []
+
+    fil = _utils.fetch_files(
+        data_dir=str(tmp_path),
+        files=files,
+        verbose=0,
+        n_jobs=3,
+        progress_hook=lambda *args: progress.append(args),
+    )
+
+    assert request_mocker.url_count == 6
+    for path, content in zip(fil, contents.values()):
+        with open(path, "rb") as fp:
+            assert fp.read() == content
+    assert {url for url, *_ in progress} == {url for _, url, _ in files}
+    # the sandbox has been moved to data_dir
+    assert sorted(os.listdir(tmp_path)) == sorted(contents)
+
+    # files already on disk are not downloaded again
+    _utils.fetch_files(data_dir=str(tmp_path), files=files, n_jobs=3)
+
+    assert request_mocker.url_count == 6
+
+
+def test_fetch_files_parallel_same_basename(tmp_path, request_mocker):
+    # osf urls all end with "download"
+    request_mocker.url_mapping["*/a/download"] = b"content a"
+    request_mocker.url_mapping["*/b/download"] = b"content b"
+    request_mocker.url_mapping["*/c.txt"] = b"content c"
+    files = [
+        ("a.txt", "http://foo/a/download", {"move": "a.txt"}),
+        ("b.txt", "http://foo/b/download", {"move": "b.txt"}),
+        ("c.txt", "http://foo/c.txt", {}),
+    ]
+
+    fil = _utils.fetch_files(
+        data_dir=str(tmp_path), files=files, verbose=0, n_jobs=3
+    )
+
+    assert request_mocker.url_count == 3
+    for path, content in zip(fil, [b"content a", b"content b", b"content c"]):
+        with open(path, "rb") as fp:
+            assert fp.read() == content
+    assert sorted(os.listdir(tmp_path)) == ["a.txt", "b.txt", "c.txt"]
+
+
+def test_fetch_files_parallel_md5_error(tmp_path, request_mocker):
+    files = [
+        ("1.txt", "http://foo/1.txt", {}),
+        ("2.txt", "http://foo/2.txt", {"md5sum": "0" * 32}),
+    ]
+
+    with pytest.raises(ValueError, match="checksum verification"):
+        _utils.fetch_files(
+            data_dir=str(tmp_path), files=files, verbose=0, n_jobs=2
+        )
+
+    assert not (tmp_path / "1.txt").exists()
+
+
+class _RangeRequestHandler(http.server.BaseHTTPRequestHandler):
+    """Serve the same content at all paths, honoring Range headers."""
+
+    content = bytes(range(256)) * 64
+
+    def do_GET(self):
+        start = 0
+        range_ = self.headers.get("Range")
+        if range_ is not None:
+            start = int(range_[len("bytes=") : -1])
+            self.send_response(206)
+            self.send_header(
+                "Content-Range",
+                f"bytes {start}-{len(self.content) - 1}/{len(self.content)}",
+            )
+        else:
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(self.content) - start))
+        self.end_headers()
+        self.wfile.write(self.content[start:])
+        self.server.requested_ranges.append(range_)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_http_server(monkeypatch):
+    """Run a local HTTP server and let requests reach the network."""
+    monkeypatch.setattr("requests.sessions.Session.send", _SESSION_SEND)
+    server = http.server.ThreadingHTTPServer(
+        ("127.0.0.1", 0), _RangeRequestHandler
+    )
+    server.requested_ranges = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_fetch_files_parallel_resume(tmp_path, local_http_server):
+    port = local_http_server.server_address[1]
+    content = _RangeRequestHandler.content
+    files = [
+        (f"{i}.bin", f"http://127.0.0.1:{port}/{i}.bin", {}) for i in range(4)
+    ]
+    # a previous call was interrupted while downloading 0.bin
+    temp_dir = (
+        tmp_path
+        / hashlib.md5(
+            pickle.dumps([(file_, url) for file_, url, _ in files])
+        ).hexdigest()
+    )
+    temp_dir.mkdir()
+    (temp_dir / "0.bin.part").write_bytes(content[:1000])
+    progress = []
+
+    fil = _utils.fetch_files(
+        data_dir=str(tmp_path),
+        files=files,
+        verbose=0,
+        n_jobs=4,
+        progress_hook=lambda *args: progress.append(args),
+    )
+
+    for path in fil:
+        with open(path, "rb") as fp:
+            assert fp.read() == content
+    # only the missing part of the interrupted download was requested
+    assert sorted(local_http_server.requested_ranges, key=str) == [
+        None,
+        None,
+        None,
+        "bytes=1000-",
+    ]
+    assert not temp_dir.exists()
+    url, bytes_so_far, total_size, elapsed = progress[-1]
+    assert bytes_so_far == total_size == len(content)
+    assert elapsed >= 0
+
+
 def test_naive_ftp_adapter():
     sender = _utils._NaiveFTPAdapter()
     resp = sender.send(requests.Request("GET", "ftp://example.com").prepare())
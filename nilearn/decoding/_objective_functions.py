@@ -123,7 +123,7 @@ def tv_l1_from_gradient(spatial_grad):
     return l1_term + tv_term
 
 
-def divergence_id(grad, l1_ratio=0.5):
+def divergence_id(grad, l1_ratio=0.5, out=None):
     """Compute divergence + id of image gradient + id.
 
     Parameters
@@ -135,6 +135,10 @@ def divergence_id(grad, l1_ratio=0.5):
     l1_ratio : float in the interval [0, 1]; optional (default .5)
         Constant that mixes L1 and spatial prior terms in the penalization.
 
+    out : ndarray, shape (nx, ny, nz, ...), optional (default None)
+        Array in which to write the result, instead of a new float64
+        array.
+
     Returns
     -------
     res : ndarray, shape (nx, ny, nz, ...)
@@ -150,7 +154,11 @@ def divergence_id(grad, l1_ratio=0.5):
             f"l1_ratio must be in the interval [0, 1]; got {l1_ratio}"
         )
 
-    res = np.zeros(grad.shape[1:])
+    if out is None:
+        res = np.zeros(grad.shape[1:])
+    else:
+        res = out
+        res.fill(0.0)
 
     # the divergence part
     for d in range(grad.shape[0] - 1):
@@ -169,7 +177,7 @@ def divergence_id(grad, l1_ratio=0.5):
     return res
 
 
-def gradient_id(img, l1_ratio=0.5):
+def gradient_id(img, l1_ratio=0.5, out=None):
     """Compute gradient + id of an image.
 
     Parameters
@@ -180,6 +188,10 @@ def gradient_id(img, l1_ratio=0.5):
     l1_ratio : float in the interval [0, 1]; optional (default .5)
         Constant that mixes L1 and spatial prior terms in the penalization.
 
+    out : ndarray, shape (4, nx, ny, nz, ...), optional (default None)
+        Array in which to write the result, instead of a new float64
+        array.
+
     Returns
     -------
     gradient : ndarray, shape (4, nx, ny, nz, ...).
@@ -196,21 +208,24 @@ def gradient_id(img, l1_ratio=0.5):
             f"l1_ratio must be in the interval [0, 1]; got {l1_ratio}"
         )
 
-    shape = [img.ndim + 1] + list(img.shape)
-    gradient = np.zeros(shape, dtype=np.float64)
+    if out is None:
+        shape = [img.ndim + 1] + list(img.shape)
+        gradient = np.empty(shape, dtype=np.float64)
+    else:
+        gradient = out
 
-    # the gradient part: 'Clever' code to have a view of the gradient
-    # with dimension i stop at -1
-    slice_all = [0, slice(None, -1)]
+    # the gradient part, computed in place in a view of the gradient
+    # along each axis, whose last slice is 0
     for d in range(img.ndim):
-        gradient[tuple(slice_all)] = np.diff(img, axis=d)
-        slice_all[0] = d + 1
-        slice_all.insert(1, slice(None))
+        this_grad = np.moveaxis(gradient[d], d, 0)
+        this_img = np.moveaxis(img, d, 0)
+        np.subtract(this_img[1:], this_img[:-1], out=this_grad[:-1])
+        this_grad[-1] = 0.0
 
     gradient[:-1] *= 1.0 - l1_ratio
 
     # the identity part
-    gradient[-1] = l1_ratio * img
+    np.multiply(img, l1_ratio, out=gradient[-1])
 
     return gradient
 
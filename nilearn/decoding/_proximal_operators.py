@@ -57,13 +57,18 @@ def _projector_on_tvl1_dual(grad, l1_ratio):
     return grad
 
 
-def _dual_gap_prox_tvl1(input_img_norm, new, gap, weight, l1_ratio=1.0):
+def _dual_gap_prox_tvl1(
+    input_img_norm, new, gap, weight, l1_ratio=1.0, gradient_buffer=None
+):
     """Compute dual gap of total variation denoising.
 
     See "Total variation regularization for fMRI-based prediction of behavior",
-    by Michel et al. (2011) for a derivation of the dual gap
+    by Michel et al. (2011) for a derivation of the dual gap.
+    The gradient of `new` is computed in `gradient_buffer` if given.
     """
-    tv_new = tv_l1_from_gradient(gradient_id(new, l1_ratio=l1_ratio))
+    tv_new = tv_l1_from_gradient(
+        gradient_id(new, l1_ratio=l1_ratio, out=gradient_buffer)
+    )
     gap = gap.ravel()
     d_gap = (
         np.dot(gap, gap)
@@ -177,9 +182,14 @@ def prox_tvl1(
     input_img_norm = np.dot(input_img_flat, input_img_flat)
     if not input_img.dtype.kind == "f":
         input_img = input_img.astype(np.float64)
+    # float32 images are denoised in float32
+    dtype = input_img.dtype
     shape = [len(input_img.shape) + 1] + list(input_img.shape)
-    grad_im = np.zeros(shape)
-    grad_aux = np.zeros(shape)
+    # The buffers of the loop are allocated once and updated in place
+    grad_im = np.zeros(shape, dtype=dtype)
+    grad_aux = np.zeros(shape, dtype=dtype)
+    grad_tmp = np.empty(shape, dtype=dtype)
+    gap = np.empty(input_img.shape, dtype=dtype)
     t = 1.0
     i = 0
     lipschitz_constant = 1.1 * (
@@ -188,7 +198,8 @@ def prox_tvl1(
 
     # negated_output is the negated primal variable in the optimization
     # loop
-    negated_output = -input_img if init is None else -init
+    negated_output = np.negative(input_img if init is None else init)
+    negated_output = negated_output.astype(dtype, copy=False)
 
     # Clipping values for the inner loop
     negated_val_min = np.inf
@@ -200,36 +211,43 @@ def prox_tvl1(
     # With bound constraints, the stopping criterion is on the
     # evolution of the output
     negated_output_old = negated_output.copy()
-    grad_tmp = None
     old_dgap = np.inf
     dgap = np.inf
 
     # A boolean to control if we are going to do a fista step
     fista_step = fista
+    # Whether the previous step was an ISTA step, after which the dual
+    # variable is not extrapolated
+    previous_ista_step = False
 
     while i < max_iter:
-        grad_tmp = gradient_id(negated_output, l1_ratio=l1_ratio)
+        gradient_id(negated_output, l1_ratio=l1_ratio, out=grad_tmp)
         grad_tmp *= 1.0 / (lipschitz_constant * weight)
         grad_aux += grad_tmp
-        grad_tmp = _projector_on_tvl1_dual(grad_aux, l1_ratio)
+        # projection of the dual variable, in place
+        _projector_on_tvl1_dual(grad_aux, l1_ratio)
 
-        # Careful, in the next few lines, grad_tmp and grad_aux are a
-        # view on the same array, as _projector_on_tvl1_dual returns a view
-        # on the input array
         t_new = 0.5 * (1.0 + sqrt(1.0 + 4.0 * t * t))
         t_factor = (t - 1.0) / t_new
-        if fista_step:
-            grad_aux = (1 + t_factor) * grad_tmp - t_factor * grad_im
+        if fista_step and not previous_ista_step:
+            # extrapolated dual variable: grad_aux + t_factor * (grad_aux -
+            # grad_im), written in the buffer of grad_im, which then takes
+            # the projected dual variable of grad_aux
+            np.subtract(grad_aux, grad_im, out=grad_tmp)
+            grad_tmp *= t_factor
+            np.add(grad_aux, grad_tmp, out=grad_im)
+            grad_im, grad_aux = grad_aux, grad_im
         else:
-            grad_aux = grad_tmp
-        grad_im = grad_tmp
+            grad_im[...] = grad_aux
+        previous_ista_step = not fista_step
         t = t_new
-        gap = weight * divergence_id(grad_aux, l1_ratio=l1_ratio)
+        divergence_id(grad_aux, l1_ratio=l1_ratio, out=gap)
+        gap *= weight
 
         # Compute the primal variable
-        negated_output = gap - input_img
+        np.subtract(gap, input_img, out=negated_output)
         if val_min is not None or val_max is not None:
-            negated_output = negated_output.clip(
+            negated_output.clip(
                 negated_val_max, negated_val_min, out=negated_output
             )
         if (i % check_gap_frequency) == 0:
@@ -237,7 +255,7 @@ def prox_tvl1(
                 # Stopping criterion based on the dual gap
                 if val_min is not None or val_max is not None:
                     # We need to recompute the dual variable
-                    gap = negated_output + input_img
+                    np.add(negated_output, input_img, out=gap)
                 old_dgap = dgap
                 dgap = _dual_gap_prox_tvl1(
                     input_img_norm,
@@ -245,6 +263,7 @@ def prox_tvl1(
                     gap,
                     weight,
                     l1_ratio=l1_ratio,
+                    gradient_buffer=grad_tmp,
                 )
                 if verbose:
                     print(
@@ -274,12 +293,14 @@ def prox_tvl1(
                     )
                 if diff < x_tol:
                     break
-                negated_output_old = negated_output
+                negated_output_old[...] = negated_output
         i += 1
 
     # Compute the primal variable, however, here we must use the ista
     # value, not the fista one
-    output = input_img - weight * divergence_id(grad_im, l1_ratio=l1_ratio)
+    output = input_img - weight * divergence_id(
+        grad_im, l1_ratio=l1_ratio, out=gap
+    )
     if val_min is not None or val_max is not None:
         output = output.clip(val_min, val_max, out=output)
     return output, dict(converged=(i < max_iter))
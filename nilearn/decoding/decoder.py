@@ -333,6 +333,34 @@ def _check_estimator(estimator):
     return estimator
 
 
+def _fold_clustering(X, train, test, mask_img, clustering_percentile):
+    """Reduce the data of a fold with a ReNA clustering.
+
+    The clustering does not depend on the target, so it is fitted once per
+    fold and shared by all the problems of a multiclass classification.
+
+    Returns
+    -------
+    clustering : ReNA
+        The clustering fitted on the train samples of the fold.
+
+    X_train, X_test : :class:`numpy.ndarray`
+        The reduced train and test samples.
+    """
+    X_train = X[train]
+    n_clusters = int(X_train.shape[1] * clustering_percentile / 100.0)
+    clustering = ReNA(
+        mask_img,
+        n_clusters=n_clusters,
+        n_iter=20,
+        threshold=1e-7,
+        scaling=False,
+    )
+    X_train = clustering.fit_transform(X_train)
+    X_test = clustering.transform(X[test])
+    return clustering, X_train, X_test
+
+
 def _parallel_fit(
     estimator,
     X,
@@ -346,6 +374,7 @@ def _parallel_fit(
     mask_img,
     class_index,
     clustering_percentile,
+    fold_clustering=None,
 ):
     """Find the best estimator for a fold within a job.
 
@@ -355,24 +384,22 @@ def _parallel_fit(
     Fit may be performed after some preprocessing step :
     * clustering with ReNA if clustering_percentile < 100
     * feature screening if screening_percentile < 100
+
+    If given, ``fold_clustering`` is the output of :func:`_fold_clustering`
+    for this fold, whose reduced samples are used instead of ``X``.
     """
-    X_train, y_train = X[train], y[train]
-    X_test, y_test = X[test], y[test]
+    y_train, y_test = y[train], y[test]
 
     # for FREM Classifier and Regressor : start by doing a quick ReNA
     # clustering to reduce the number of feature by agglomerating similar ones
-
-    if clustering_percentile < 100:
-        n_clusters = int(X_train.shape[1] * clustering_percentile / 100.0)
-        clustering = ReNA(
-            mask_img,
-            n_clusters=n_clusters,
-            n_iter=20,
-            threshold=1e-7,
-            scaling=False,
+    if fold_clustering is not None:
+        clustering, X_train, X_test = fold_clustering
+    elif clustering_percentile < 100:
+        clustering, X_train, X_test = _fold_clustering(
+            X, train, test, mask_img, clustering_percentile
         )
-        X_train = clustering.fit_transform(X_train)
-        X_test = clustering.transform(X_test)
+    else:
+        X_train, X_test = X[train], X[test]
 
     do_screening = (X_train.shape[1] > 100) and selector is not None
 
@@ -767,10 +794,29 @@ class _BaseDecoder(CacheMixin, BaseEstimator):
 
         parallel = Parallel(n_jobs=self.n_jobs, verbose=2 * self.verbose)
 
+        # The clustering of each fold is shared by all the problems: the
+        # jobs of the problems then only receive the reduced samples, that
+        # joblib memory maps like X.
+        if self.clustering_percentile < 100:
+            folds_clustering = parallel(
+                delayed(self._cache(_fold_clustering))(
+                    X,
+                    train,
+                    test,
+                    self.mask_img_,
+                    self.clustering_percentile,
+                )
+                for train, test in self.cv_
+            )
+            X_problems = None
+        else:
+            folds_clustering = [None] * len(self.cv_)
+            X_problems = X
+
         parallel_fit_outputs = parallel(
             delayed(self._cache(_parallel_fit))(
                 estimator=self.estimator,
-                X=X,
+                X=X_problems,
                 y=y[:, c],
                 train=train,
                 test=test,
@@ -781,9 +827,10 @@ class _BaseDecoder(CacheMixin, BaseEstimator):
                 mask_img=self.mask_img_,
                 class_index=c,
                 clustering_percentile=self.clustering_percentile,
+                fold_clustering=fold_clustering,
             )
-            for c, (train, test) in itertools.product(
-                range(n_problems), self.cv_
+            for c, ((train, test), fold_clustering) in itertools.product(
+                range(n_problems), zip(self.cv_, folds_clustering)
             )
         )
 
@@ -62,6 +62,32 @@ def _check_lipschitz_continuous(
                 raise RuntimeError(f"Counter example: ({x}, {y})")
 
 
+# Maximum number of halvings of the initial stepsize by backtracking
+_MAX_HALVINGS = 30
+
+
+def _sufficient_decrease(f1, f1_z, gradient, w, z, stepsize):
+    """Check the sufficient decrease condition of backtracking.
+
+    This is the condition of Beck and Teboulle (2009) under which the
+    stepsize is small enough for the quadratic upper bound of the smooth
+    part of the energy around `z` to hold at `w`. Near convergence, both
+    sides differ by rounding errors only, so the condition is checked up
+    to a tolerance relative to the energy.
+    """
+    diff = w - z
+    if not np.any(diff):
+        return True
+    f1_w = f1(w)
+    rtol = max(1e-10, 100 * np.finfo(np.result_type(w.dtype, f1_w)).eps)
+    return f1_w <= (
+        f1_z
+        + np.dot(gradient, diff)
+        + 0.5 * np.dot(diff, diff) / stepsize
+        + rtol * max(abs(f1_w), abs(f1_z))
+    )
+
+
 def mfista(
     f1_grad,
     f2_prox,
@@ -76,6 +102,11 @@ def mfista(
     dgap_factor=None,
     callback=None,
     verbose=2,
+    restart=False,
+    backtracking=False,
+    f1=None,
+    check_energy_frequency=1,
+    dtype=np.float64,
 ):
     """Solve FISTA in a generic way.
 
@@ -132,6 +163,33 @@ def mfista(
     verbose : integer, default=2
         Indicate the level of verbosity.
 
+    restart : boolean, default=False
+        If True, the momentum is reset whenever it points away from the
+        last gradient step (gradient scheme of the adaptive restart of
+        O'Donoghue and Candes, 2015).
+
+    backtracking : boolean, default=False
+        If True, the stepsize, which starts at `1 / lipschitz_constant`,
+        is halved until the sufficient decrease condition of Beck and
+        Teboulle holds, so that `lipschitz_constant` may be an
+        underestimate. Requires `f1`. The stepsize is not decreased
+        below `2 ** -30 / lipschitz_constant`.
+
+    f1 : callable(w) -> float, optional
+        Smooth part of energy. Only used with `backtracking`.
+
+    check_energy_frequency : int, default=1
+        Number of iterations between two computations of the total energy.
+        The monotone check and the convergence check on the energy then
+        compare the energy to the one of the previous check, and the
+        iterations since the previous check are rewound when the energy
+        increased.
+
+    dtype : numpy dtype, default=np.float64
+        Data type of the solution, if not initialized from `init`.
+        With np.float32, `f1_grad` and `f2_prox` should also work in
+        float32.
+
     Returns
     -------
     w : ndarray, shape (w_size,)
@@ -153,10 +211,18 @@ def mfista(
     Jun 2014, Tubingen, Germany. IEEE
 
     """
+    if backtracking and f1 is None:
+        raise ValueError("f1 must be given to use backtracking.")
+    if check_energy_frequency < 1:
+        raise ValueError(
+            "check_energy_frequency must be a positive integer; "
+            f"got {check_energy_frequency}."
+        )
+
     # initialization
     if init is None:
         init = {}
-    w = init.get("w", np.zeros(w_size))
+    w = init.get("w", np.zeros(w_size, dtype=dtype))
     z = init.get("z", w.copy())
     t = init.get("t", 1.0)
     stepsize = init.get("stepsize", 1.0 / lipschitz_constant)
@@ -180,8 +246,11 @@ def mfista(
     best_t = t
     prox_info = dict(converged=True)
     stepsize = 1.0 / lipschitz_constant
+    min_stepsize = stepsize * 0.5**_MAX_HALVINGS
     history = []
     w_old = w.copy()
+    # last iterate at which the energy was computed
+    w_checked = w.copy()
 
     # FISTA loop
     for i in range(max_iter):
@@ -203,15 +272,39 @@ def mfista(
 
         # forward (gradient) step
         gradient_buffer = f1_grad(z)
+        if backtracking:
+            f1_z = f1(z)
+
+        # the energy of the ISTA steps is always checked, to ensure they
+        # are monotone
+        check_energy = (
+            ista_step
+            or (i + 1) % check_energy_frequency == 0
+            or i == max_iter - 1
+        )
 
         # backward (prox) step
         for _ in range(10):
-            w, prox_info = f2_prox(
-                z - stepsize * gradient_buffer,
-                stepsize,
-                dgap_factor * dgap_tol,
-                init=w,
-            )
+            while True:
+                w, prox_info = f2_prox(
+                    z - stepsize * gradient_buffer,
+                    stepsize,
+                    dgap_factor * dgap_tol,
+                    init=w,
+                )
+                if (
+                    not backtracking
+                    or stepsize <= min_stepsize
+                    or _sufficient_decrease(
+                        f1, f1_z, gradient_buffer, w, z, stepsize
+                    )
+                ):
+                    break
+                stepsize = max(0.5 * stepsize, min_stepsize)
+                if verbose:
+                    print(f"\tdecreased stepsize to {stepsize:.4e}")
+            if not check_energy:
+                break
             energy = total_energy(w)
             if (
                 not ista_step
@@ -228,6 +321,18 @@ def mfista(
 
             if verbose:
                 print("decreased dgap_tol")
+
+        if not check_energy:
+            # no energy house-keeping until the next check
+            if restart and np.dot(z - w, w - w_old) > 0.0:
+                t = 1.0
+                z = w.copy()
+            else:
+                t0 = t
+                t = 0.5 * (1.0 + sqrt(1.0 + 4.0 * t * t))
+                z = w + ((t0 - 1.0) / t) * (w - w_old)
+            continue
+
         # energy house-keeping
         energy_delta = old_energy - energy
         old_energy = energy
@@ -235,19 +340,26 @@ def mfista(
         # z update
         if energy_delta < 0.0:
             # M-FISTA strategy: rewind and switch temporarily to an ISTA step
-            z[:] = w_old
-            w[:] = w_old
+            z[:] = w_checked
+            w[:] = w_checked
             ista_step = True
             if verbose:
                 print("Monotonous FISTA: Switching to ISTA")
         else:
             if ista_step:
                 z = w
+            elif restart and np.dot(z - w, w - w_old) > 0.0:
+                # the momentum points away from the gradient step
+                t = 1.0
+                z = w.copy()
+                if verbose:
+                    print("FISTA: Restarting momentum")
             else:
                 t0 = t
                 t = 0.5 * (1.0 + sqrt(1.0 + 4.0 * t * t))
                 z = w + ((t0 - 1.0) / t) * (w - w_old)
             ista_step = False
+        w_checked[:] = w
 
         # misc
         if energy_delta != 0.0:
@@ -339,6 +339,7 @@ def graph_net_squared_loss(
         max_iter=max_iter,
         verbose=verbose,
         init=init,
+        restart=True,
     )
 
 
@@ -425,6 +426,7 @@ def graph_net_logistic(
         max_iter=max_iter,
         verbose=verbose,
         init=init,
+        restart=True,
     )
 
 
@@ -640,6 +642,7 @@ def tvl1_solver(
         verbose=verbose,
         max_iter=max_iter,
         callback=callback,
+        restart=True,
     )
 
     return w, obj, init
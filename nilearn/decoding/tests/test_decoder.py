@@ -48,6 +48,7 @@ from sklearn.svm import SVR, LinearSVC
 from nilearn._utils import compare_version
 from nilearn._utils.param_validation import check_feature_screening
 from nilearn.conftest import _rng
+from nilearn.decoding import decoder
 from nilearn.decoding.decoder import (
     Decoder,
     DecoderRegressor,
@@ -56,6 +57,7 @@ from nilearn.decoding.decoder import (
     _BaseDecoder,
     _check_estimator,
     _check_param_grid,
+    _fold_clustering,
     _parallel_fit,
     _wrap_param_grid,
 )
@@ -889,6 +891,63 @@ def test_decoder_multiclass_classification_clustering(
     assert accuracy_score(y, y_pred) > 0.9
 
 
+def test_frem_clustering_once_per_fold(multiclass_data, monkeypatch):
+    """Check that the clustering of a fold is shared by all the classes."""
+    X, y, mask = multiclass_data
+    n_fits = []
+    fit = decoder.ReNA.fit
+
+    def counting_fit(self, *args, **kwargs):
+        n_fits.append(1)
+        return fit(self, *args, **kwargs)
+
+    monkeypatch.setattr(decoder.ReNA, "fit", counting_fit)
+    model = FREMClassifier(
+        estimator="svc_l2",
+        mask=mask,
+        clustering_percentile=50,
+        screening_percentile=90,
+        cv=3,
+    )
+    model.fit(X, y)
+
+    assert len(n_fits) == 3
+    assert len(model.coef_) == 4
+    assert all(len(scores) == 3 for scores in model.cv_scores_.values())
+
+
+def test_parallel_fit_fold_clustering(multiclass_data):
+    """Check that a shared clustering gives the results of a new one."""
+    X, y, mask = multiclass_data
+    masker = NiftiMasker(mask_img=mask).fit()
+    X = masker.transform(X)
+    y = (y == 0).astype(int)
+    train, test = np.arange(0, len(y), 2), np.arange(1, len(y), 2)
+    kwargs = dict(
+        estimator=RidgeClassifierCV(),
+        X=X,
+        y=y,
+        train=train,
+        test=test,
+        param_grid=None,
+        is_classification=True,
+        selector=None,
+        scorer=check_scoring(RidgeClassifierCV(), "accuracy"),
+        mask_img=masker.mask_img_,
+        class_index=0,
+        clustering_percentile=50,
+    )
+
+    expected = _parallel_fit(**kwargs)
+    fold_clustering = _fold_clustering(X, train, test, masker.mask_img_, 50)
+    kwargs["X"] = None
+    shared = _parallel_fit(fold_clustering=fold_clustering, **kwargs)
+
+    assert_array_almost_equal(shared[1], expected[1])
+    assert shared[1].shape == (1, X.shape[1])
+    assert shared[4] == expected[4]
+
+
 @pytest.mark.parametrize("cv", [KFold(n_splits=5), LeaveOneGroupOut()])
 def test_decoder_multiclass_classification_cross_validation(
     multiclass_data, cv
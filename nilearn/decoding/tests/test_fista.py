@@ -9,7 +9,11 @@ from nilearn.decoding._objective_functions import (
     squared_loss_grad,
 )
 from nilearn.decoding._proximal_operators import prox_l1
-from nilearn.decoding.fista import _check_lipschitz_continuous, mfista
+from nilearn.decoding.fista import (
+    _check_lipschitz_continuous,
+    _sufficient_decrease,
+    mfista,
+)
 
 
 @pytest.mark.parametrize("scaling", list(np.logspace(-3, 3, num=7)))
@@ -84,3 +88,125 @@ def test_input_args_and_kwargs(cb_retval, verbose, dgap_factor, rng):
     assert isinstance(init, dict)
     for key in ["w", "t", "dgap_tol", "stepsize"]:
         assert key in init
+
+
+def _lasso_problem(rng, n_samples=100, p=125, alpha=0.01):
+    X = rng.standard_normal((n_samples, p))
+    sig = np.zeros(p)
+    sig[[0, 2, 13, 4, 25, 32, 80, 89, 91, 93, -1]] = 1
+    y = X @ sig + 1e-1 * rng.standard_normal(n_samples)
+    l1_weight = alpha * X.shape[0]
+
+    def f1(w):
+        return squared_loss(X, y, w, compute_grad=False)
+
+    def f1_grad(w):
+        return squared_loss(X, y, w, compute_grad=True, compute_energy=False)
+
+    def f2_prox(w, step_size, *args, **kwargs):
+        return prox_l1(w, step_size * l1_weight), dict(converged=True)
+
+    def total_energy(w):
+        return f1(w) + l1_weight * np.sum(np.abs(w))
+
+    return f1, f1_grad, f2_prox, total_energy, spectral_norm_squared(X)
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        dict(restart=True),
+        dict(check_energy_frequency=5),
+        dict(check_energy_frequency=3, restart=True),
+        dict(backtracking=True),
+    ],
+)
+def test_mfista_options_converge(rng, params):
+    f1, f1_grad, f2_prox, total_energy, lipschitz_constant = _lasso_problem(
+        rng
+    )
+    args = (f1_grad, f2_prox, total_energy, lipschitz_constant, 125)
+    kwargs = dict(tol=1e-10, max_iter=1000, verbose=0)
+    expected, _, _ = mfista(*args, **kwargs)
+
+    if params.get("backtracking"):
+        # the stepsize must be decreased from an underestimated constant
+        args = (f1_grad, f2_prox, total_energy, lipschitz_constant / 20, 125)
+        params["f1"] = f1
+    w, objective, init = mfista(*args, **params, **kwargs)
+
+    np.testing.assert_allclose(w, expected, atol=1e-4)
+    assert total_energy(w) <= total_energy(expected) + 1e-6
+    if params.get("backtracking"):
+        assert 1.0 / lipschitz_constant <= init["stepsize"]
+        assert init["stepsize"] < 20.0 / lipschitz_constant
+
+
+def test_mfista_backtracking_past_convergence(rng):
+    # with tol=0 the iterations go on after convergence, when the sufficient
+    # decrease condition only differs by rounding errors
+    f1, f1_grad, f2_prox, total_energy, lipschitz_constant = _lasso_problem(
+        rng
+    )
+    w, objective, init = mfista(
+        f1_grad,
+        f2_prox,
+        total_energy,
+        lipschitz_constant / 20,
+        125,
+        tol=0,
+        max_iter=1000,
+        verbose=0,
+        backtracking=True,
+        f1=f1,
+    )
+
+    assert len(objective) == 1000
+    assert np.all(np.isfinite(w))
+    assert 1.0 / lipschitz_constant <= init["stepsize"]
+    assert init["stepsize"] < 20.0 / lipschitz_constant
+
+
+def test_sufficient_decrease_no_step():
+    # no division by a vanishing stepsize when the prox step does not move
+    w = np.ones(3)
+
+    assert _sufficient_decrease(np.sum, 3.0, w, w, w.copy(), 0.0)
+
+
+def test_mfista_restart_fewer_iterations(rng):
+    # restarts help most on strongly convex problems
+    f1, f1_grad, f2_prox, total_energy, lipschitz_constant = _lasso_problem(
+        rng, n_samples=300, alpha=0.001
+    )
+    args = (f1_grad, f2_prox, total_energy, lipschitz_constant, 125)
+    _, objective, _ = mfista(*args, tol=1e-8, verbose=0)
+    _, objective_restart, _ = mfista(*args, tol=1e-8, verbose=0, restart=True)
+
+    assert len(objective_restart) < len(objective)
+
+
+def test_mfista_float32(rng):
+    _, f1_grad, f2_prox, total_energy, lipschitz_constant = _lasso_problem(rng)
+
+    def f1_grad_32(w):
+        return f1_grad(w).astype(np.float32)
+
+    w, _, _ = mfista(
+        f1_grad_32,
+        f2_prox,
+        total_energy,
+        lipschitz_constant,
+        125,
+        verbose=0,
+        dtype=np.float32,
+    )
+
+    assert w.dtype == np.float32
+
+
+def test_mfista_errors():
+    with pytest.raises(ValueError, match="f1 must be given"):
+        mfista(None, None, None, 1.0, 2, backtracking=True)
+    with pytest.raises(ValueError, match="check_energy_frequency"):
+        mfista(None, None, None, 1.0, 2, check_energy_frequency=0)
@@ -45,3 +45,14 @@ def test_prox_tvl1_approximates_prox_l1_for_lasso(
 
     # results should be close in l-infinity norm
     assert_almost_equal(np.abs(a - b).max(), 0.0, decimal=decimal)
+
+
+@pytest.mark.parametrize("l1_ratio", [0.0, 0.5, 1.0])
+def test_prox_tvl1_float32(rng, l1_ratio):
+    img = rng.standard_normal((10, 11, 12))
+
+    expected, _ = prox_tvl1(img, weight=0.5, l1_ratio=l1_ratio)
+    out, _ = prox_tvl1(img.astype(np.float32), weight=0.5, l1_ratio=l1_ratio)
+
+    assert out.dtype == np.float32
+    np.testing.assert_allclose(out, expected, atol=1e-3)
@@ -5,10 +5,11 @@ Utilities for masking and dimension reduction of group data
 
 import glob
 import itertools
+import tempfile
 from math import ceil
 
 import numpy as np
-from joblib import Memory, Parallel, delayed
+from joblib import Memory, Parallel, delayed, effective_n_jobs
 from scipy import linalg
 from sklearn.base import BaseEstimator, TransformerMixin
 from sklearn.linear_model import LinearRegression
@@ -96,6 +97,7 @@ def _mask_and_reduce(
     memory_level=0,
     memory=None,
     n_jobs=1,
+    temp_folder=None,
 ):
     """Mask and reduce provided 4D images with given masker.
 
@@ -141,6 +143,12 @@ def _mask_and_reduce(
         The number of CPUs to use to do the computation. -1 means
         'all CPUs', -2 'all CPUs but one', and so on.
 
+    temp_folder : str or pathlib.Path, optional
+        If given, the reduced data of the images is written, a few images
+        at a time, to a temporary file in this folder, and returned as a
+        memorymap on this file. The file is deleted when the memorymap
+        is released. Otherwise, the reduced data is held in memory.
+
     Returns
     -------
     data : ndarray or memorymap
@@ -178,16 +186,21 @@ def _mask_and_reduce(
         # samples based on the reduction_ratio
         n_samples = None
 
+    reduce_kwargs = dict(
+        reduction_ratio=reduction_ratio,
+        n_samples=n_samples,
+        memory=memory,
+        memory_level=memory_level,
+        random_state=random_state,
+    )
+    if temp_folder is not None:
+        return _mask_and_reduce_to_memmap(
+            masker, imgs, confounds, temp_folder, n_jobs, **reduce_kwargs
+        )
+
     data_list = Parallel(n_jobs=n_jobs)(
         delayed(_mask_and_reduce_single)(
-            masker,
-            img,
-            confound,
-            reduction_ratio=reduction_ratio,
-            n_samples=n_samples,
-            memory=memory,
-            memory_level=memory_level,
-            random_state=random_state,
+            masker, img, confound, **reduce_kwargs
         )
         for img, confound in zip(imgs, confounds)
     )
@@ -209,6 +222,50 @@ def _mask_and_reduce(
     return data
 
 
+def _mask_and_reduce_to_memmap(
+    masker, imgs, confounds, temp_folder, n_jobs, **reduce_kwargs
+):
+    """Mask and reduce the images a batch at a time, appending the reduced \
+    data of each image to a temporary file, and memory map this file.
+
+    Only the reduced data of one batch of images, with one image per job,
+    is held in memory at a time.
+    """
+    n_voxels = int(np.sum(safe_get_data(masker.mask_img_)))
+    batch_size = effective_n_jobs(n_jobs)
+    imgs_and_confounds = zip(imgs, confounds)
+    n_samples = 0
+    dtype = None
+    with tempfile.TemporaryFile(dir=temp_folder) as data_file:
+        while True:
+            batch = list(itertools.islice(imgs_and_confounds, batch_size))
+            if not batch:
+                break
+            data_list = Parallel(n_jobs=n_jobs)(
+                delayed(_mask_and_reduce_single)(
+                    masker, img, confound, **reduce_kwargs
+                )
+                for img, confound in batch
+            )
+            if dtype is None:
+                dtype = (
+                    np.float64
+                    if data_list[0].dtype.type is np.float64
+                    else np.float32
+                )
+            for subject_data in data_list:
+                # The rows of each subject are appended in C order
+                subject_data.astype(dtype, copy=False).tofile(data_file)
+                n_samples += subject_data.shape[0]
+            del data_list
+        data_file.flush()
+        # The memorymap keeps the (unlinked) file open until it is released
+        data = np.memmap(
+            data_file, dtype=dtype, mode="r+", shape=(n_samples, n_voxels)
+        )
+    return data
+
+
 def _mask_and_reduce_single(
     masker,
     img,
@@ -450,6 +507,8 @@ class _BaseDecomposition(BaseEstimator, CacheMixin, TransformerMixin):
             memory=self.memory,
             memory_level=max(0, self.memory_level + 1),
             n_jobs=self.n_jobs,
+            # only set by the estimators able to fit out of core
+            temp_folder=getattr(self, "temp_folder", None),
         )
         self._raw_fit(data)
 
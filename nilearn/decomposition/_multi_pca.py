@@ -8,6 +8,7 @@ from joblib import Memory
 from sklearn.utils.extmath import randomized_svd
 
 from nilearn._utils import fill_doc
+from nilearn.signal import row_sum_of_squares
 
 from ._base import _BaseDecomposition
 
@@ -187,7 +188,8 @@ class _MultiPCA(_BaseDecomposition):
     def _raw_fit(self, data):
         """Process unmasked data directly."""
         if self.do_cca:
-            S = np.sqrt(np.sum(data**2, axis=1))
+            # computed by batches of rows, for memory mapped data
+            S = np.sqrt(row_sum_of_squares(data.T)).astype(data.dtype)
             S[S == 0] = 1
             data /= S[:, np.newaxis]
         components_, self.variance_, _ = self._cache(
@@ -141,3 +141,29 @@ def test_mask_reducer_reduced_reproducible(data_for_mask_and_reduce, masker):
     )
 
     assert_array_almost_equal(np.tile(data1, (2, 1)), data2)
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_mask_reducer_temp_folder(
+    data_for_mask_and_reduce, masker, tmp_path, n_jobs
+):
+    """Check that the reduced data written to a memory map in a \
+    temporary folder are the same as in memory."""
+    data = _mask_and_reduce(
+        masker, data_for_mask_and_reduce, n_components=3, random_state=0
+    )
+    data_memmap = _mask_and_reduce(
+        masker,
+        data_for_mask_and_reduce,
+        n_components=3,
+        random_state=0,
+        n_jobs=n_jobs,
+        temp_folder=tmp_path,
+    )
+
+    assert isinstance(data_memmap, np.memmap)
+    assert data_memmap.shape == data.shape
+    assert data_memmap.dtype == data.dtype
+    assert_array_almost_equal(data_memmap, data)
+    # the temporary file is not visible in the folder
+    assert not list(tmp_path.iterdir())
@@ -7,6 +7,7 @@ from typing import Any
 import numpy as np
 import pandas as pd
 from joblib import Memory
+from scipy import sparse
 from sklearn.base import BaseEstimator, TransformerMixin
 
 from nilearn import signal
@@ -160,7 +161,13 @@ class SurfaceMasker(BaseEstimator, TransformerMixin, CacheMixin):
         assert self.mask_img_ is not None
         assert self.output_dimension_ is not None
         check_same_n_vertices(self.mask_img_.mesh, img.mesh)
-        output = np.empty((*img.shape[:-1], self.output_dimension_))
+        # float32 data stays in float32, anything else is cast to float64
+        dtype = np.result_type(
+            *(part.dtype for part in img.data.values()), np.float32
+        )
+        output = np.empty(
+            (*img.shape[:-1], self.output_dimension_), dtype=dtype
+        )
         for part_name, (start, stop) in self.slices.items():
             mask = self.mask_img_.data[part_name]
             assert isinstance(mask, np.ndarray)
@@ -246,7 +253,7 @@ class SurfaceMasker(BaseEstimator, TransformerMixin, CacheMixin):
         return SurfaceImage(mesh=self.mask_img_.mesh, data=data)
 
 
-class SurfaceLabelsMasker:
+class SurfaceLabelsMasker(BaseEstimator, TransformerMixin, CacheMixin):
     """Extract data from a SurfaceImage, averaging over atlas regions.
 
     Parameters
@@ -257,6 +264,17 @@ class SurfaceLabelsMasker:
     label_names : :obj:`list` of :obj:`str`, default=None
         Full labels corresponding to the labels image.
 
+    standardize, standardize_confounds, detrend, high_variance_confounds, \
+    low_pass, high_pass, t_r : optional
+        Parameters of the cleaning of the region signals, passed to
+        :func:`nilearn.signal.clean`. By default the signals are not cleaned.
+
+    memory_level : :obj:`int`, default=1
+        Rough estimator of the amount of memory used by caching.
+
+    memory : :obj:`joblib.Memory` or :obj:`str`, default=None
+        Used to cache the cleaning of the signals.
+
     Attributes
     ----------
     labels_data_ : :obj:`numpy.ndarray`
@@ -279,9 +297,36 @@ class SurfaceLabelsMasker:
         self,
         labels_img: SurfaceImage,
         label_names: dict[Any, str] | None = None,
+        standardize=False,
+        standardize_confounds=True,
+        detrend=False,
+        high_variance_confounds=False,
+        low_pass=None,
+        high_pass=None,
+        t_r=None,
+        memory_level=1,
+        memory=None,
+        **kwargs,
     ) -> None:
+        if memory is None:
+            memory = Memory(location=None)
         self.labels_img = labels_img
         self.label_names = label_names
+        self.standardize = standardize
+        self.standardize_confounds = standardize_confounds
+        self.high_variance_confounds = high_variance_confounds
+        self.detrend = detrend
+        self.low_pass = low_pass
+        self.high_pass = high_pass
+        self.t_r = t_r
+
+        self.memory = memory
+        self.memory_level = memory_level
+        self._shelving = False
+        self.clean_kwargs = {
+            k[7:]: v for k, v in kwargs.items() if k.startswith("clean__")
+        }
+
         self.labels_data_ = np.concatenate(list(labels_img.data.values()))
         all_labels = set(self.labels_data_.ravel())
         all_labels.discard(0)
@@ -314,9 +359,40 @@ class SurfaceLabelsMasker:
         SurfaceLabelsMasker object
         """
         del img, y
+        # position of the label of each vertex in labels_; vertices in the
+        # background get len(labels_)
+        n_labels = len(self.labels_)
+        self._label_indices = np.full(self.labels_data_.shape, n_labels)
+        in_region = self.labels_data_ != 0
+        if n_labels:
+            sorter = np.argsort(self.labels_)
+            self._label_indices[in_region] = sorter[
+                np.searchsorted(
+                    self.labels_, self.labels_data_[in_region], sorter=sorter
+                )
+            ]
+        # sparse matrix averaging the vertices of each region
+        region_sizes = np.bincount(
+            self._label_indices[in_region], minlength=n_labels
+        )
+        self._averaging_matrix = sparse.csr_matrix(
+            (
+                1.0 / region_sizes[self._label_indices[in_region]],
+                (
+                    self._label_indices[in_region],
+                    np.flatnonzero(in_region),
+                ),
+            ),
+            shape=(n_labels, len(self.labels_data_)),
+        )
         return self
 
-    def transform(self, img: SurfaceImage) -> np.ndarray:
+    def transform(
+        self,
+        img: SurfaceImage,
+        confounds: pd.DataFrame | None = None,
+        sample_mask: np.ndarray | None = None,
+    ) -> np.ndarray:
         """Extract signals from fitted surface object.
 
         Parameters
@@ -324,22 +400,65 @@ class SurfaceLabelsMasker:
         img : SurfaceImage object
             Mesh and data for both hemispheres.
 
+        confounds : :class:`pandas.DataFrame`, default=None
+            Confounds to remove from the region signals.
+
+        sample_mask : :obj:`numpy.ndarray`, default=None
+            Indices of the samples to keep.
+
         Returns
         -------
         output : numpy.ndarray
-            Signal for each element.
-            shape: (img data shape, total number of vertices)
+            Signal for each region.
+            shape: (img data shape, number of regions)
         """
+        parameters = get_params(
+            self.__class__,
+            self,
+            ignore=["labels_img", "label_names"],
+        )
+        parameters["clean_kwargs"] = self.clean_kwargs
+
+        # the regions are known from __init__, so fitting is optional
+        if not hasattr(self, "_averaging_matrix"):
+            self.fit()
         check_same_n_vertices(self.labels_img.mesh, img.mesh)
         img_data = np.concatenate(list(img.data.values()), axis=-1)
-        output = np.empty((*img_data.shape[:-1], len(self.labels_)))
-        for i, label in enumerate(self.labels_):
-            output[..., i] = img_data[..., self.labels_data_ == label].mean(
-                axis=-1
-            )
+        # float32 data is averaged in float32, anything else in float64
+        dtype = np.result_type(img_data.dtype, np.float32)
+        averaging_matrix = self._averaging_matrix.astype(dtype, copy=False)
+        flat_data = img_data.reshape((-1, img_data.shape[-1]))
+        output = averaging_matrix.dot(flat_data.T.astype(dtype, copy=False))
+        output = output.T.reshape((*img_data.shape[:-1], len(self.labels_)))
+
+        # signal cleaning here
+        output = cache(
+            signal.clean,
+            memory=self.memory,
+            func_memory_level=2,
+            memory_level=self.memory_level,
+            shelve=self._shelving,
+        )(
+            output,
+            detrend=parameters["detrend"],
+            standardize=parameters["standardize"],
+            standardize_confounds=parameters["standardize_confounds"],
+            t_r=parameters["t_r"],
+            low_pass=parameters["low_pass"],
+            high_pass=parameters["high_pass"],
+            confounds=confounds,
+            sample_mask=sample_mask,
+            **parameters["clean_kwargs"],
+        )
         return output
 
-    def fit_transform(self, img: SurfaceImage, y: Any = None) -> np.ndarray:
+    def fit_transform(
+        self,
+        img: SurfaceImage,
+        y: Any = None,
+        confounds: pd.DataFrame | None = None,
+        sample_mask: np.ndarray | None = None,
+    ) -> np.ndarray:
         """Prepare and perform signal extraction from regions.
 
         Parameters
@@ -351,14 +470,20 @@ class SurfaceLabelsMasker:
             This parameter is unused. It is solely included for scikit-learn
             compatibility.
 
+        confounds : :class:`pandas.DataFrame`, default=None
+            Confounds to remove from the region signals.
+
+        sample_mask : :obj:`numpy.ndarray`, default=None
+            Indices of the samples to keep.
+
         Returns
         -------
         numpy.ndarray
-            Signal for each element.
-            shape: (img data shape, total number of vertices)
+            Signal for each region.
+            shape: (img data shape, number of regions)
         """
         del y
-        return self.fit(img).transform(img)
+        return self.fit(img).transform(img, confounds, sample_mask)
 
     def inverse_transform(self, masked_img: np.ndarray) -> SurfaceImage:
         """Transform extracted signal back to surface object.
@@ -373,14 +498,16 @@ class SurfaceLabelsMasker:
         SurfaceImage object
             Mesh and data for both hemispheres.
         """
+        if not hasattr(self, "_label_indices"):
+            self.fit()
+        # the last column is the value of the background
+        padded = np.concatenate(
+            [masked_img, np.zeros((*masked_img.shape[:-1], 1))], axis=-1
+        ).astype(masked_img.dtype, copy=False)
         data = {}
+        start = 0
         for part_name, labels_part in self.labels_img.data.items():
-            data[part_name] = np.zeros(
-                (*masked_img.shape[:-1], labels_part.shape[0]),
-                dtype=masked_img.dtype,
-            )
-            for label_idx, label in enumerate(self.labels_):
-                data[part_name][..., labels_part == label] = masked_img[
-                    ..., label_idx
-                ]
+            stop = start + labels_part.shape[0]
+            data[part_name] = padded[..., self._label_indices[start:stop]]
+            start = stop
         return SurfaceImage(mesh=self.labels_img.mesh, data=data)
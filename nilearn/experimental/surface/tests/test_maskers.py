@@ -1,7 +1,12 @@
 import numpy as np
+import pandas as pd
 import pytest
 
-from nilearn.experimental.surface import SurfaceImage, SurfaceMasker
+from nilearn.experimental.surface import (
+    SurfaceImage,
+    SurfaceLabelsMasker,
+    SurfaceMasker,
+)
 
 
 def test_mask_img_fit_shape_mismatch(
@@ -85,3 +90,69 @@ def test_transform_inverse_transform_with_mask(
         v[..., 0] = 0.0
     expected_img = SurfaceImage(img.mesh, expected_data)
     assert_img_equal(expected_img, unmasked_img)
+
+
+@pytest.fixture
+def mini_labels_img(mini_mesh) -> SurfaceImage:
+    data = {
+        "left_hemisphere": np.asarray([0, 5, 5, 2]),
+        "right_hemisphere": np.asarray([2, 2, 0, 9, 5]),
+    }
+    return SurfaceImage(mini_mesh, data)
+
+
+@pytest.mark.parametrize("shape", [(), (1,), (3,)])
+def test_surface_labels_masker_transform(
+    shape, make_mini_img, mini_labels_img
+):
+    img = make_mini_img(shape)
+    masker = SurfaceLabelsMasker(mini_labels_img).fit()
+    signals = masker.transform(img)
+
+    assert signals.shape == shape + (3,)
+    img_data = np.concatenate(list(img.data.values()), axis=-1)
+    for i, label in enumerate(masker.labels_):
+        assert np.allclose(
+            signals[..., i],
+            img_data[..., masker.labels_data_ == label].mean(axis=-1),
+        )
+
+    unmasked_img = masker.inverse_transform(signals)
+    for part_name, labels_part in mini_labels_img.data.items():
+        unmasked = unmasked_img.data[part_name]
+        assert unmasked.shape == img.data[part_name].shape
+        assert (unmasked[..., labels_part == 0] == 0).all()
+        for i, label in enumerate(masker.labels_):
+            assert np.allclose(
+                unmasked[..., labels_part == label],
+                signals[..., i : i + 1],
+            )
+
+
+def test_surface_labels_masker_float32(make_mini_img, mini_labels_img):
+    img = make_mini_img((3,))
+    img = SurfaceImage(
+        img.mesh, {k: v.astype("float32") for k, v in img.data.items()}
+    )
+    signals = SurfaceLabelsMasker(mini_labels_img).fit_transform(img)
+
+    assert signals.dtype == np.float32
+    assert SurfaceMasker().fit_transform(img).dtype == np.float32
+
+
+def test_surface_labels_masker_confounds(rng, mini_mesh, mini_labels_img):
+    n_samples = 20
+    data = {
+        k: rng.standard_normal((n_samples, v.n_vertices))
+        for k, v in mini_mesh.items()
+    }
+    img = SurfaceImage(mini_mesh, data)
+    confounds = pd.DataFrame(rng.standard_normal((n_samples, 2)))
+    masker = SurfaceLabelsMasker(mini_labels_img).fit()
+
+    signals = masker.transform(img, confounds=confounds)
+
+    assert signals.shape == (n_samples, 3)
+    # the signals are orthogonal to the (centered) confounds
+    assert np.allclose((confounds - confounds.mean()).values.T @ signals, 0)
+    assert not np.allclose(signals, masker.transform(img))
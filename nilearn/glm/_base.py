@@ -68,6 +68,8 @@ class BaseGLM(BaseEstimator, TransformerMixin, CacheMixin):
         plot_type="slice",
         display_mode=None,
         report_dims=(1600, 800),
+        image_format="svg",
+        n_jobs=1,
     ):
         """Return a :class:`~nilearn.reporting.HTMLReport` \
         which shows all important aspects of a fitted :term:`GLM`.
@@ -171,6 +173,19 @@ class BaseGLM(BaseEstimator, TransformerMixin, CacheMixin):
             Can be set after report creation using ``report.width``,
             ``report.height``.
 
+        image_format : {'svg', 'png'}, default='svg'
+            Format of the figures embedded in the report.
+            PNG figures are compressed rasters, which make much lighter
+            reports than SVG for large images or many contrasts.
+
+            .. versionadded:: 0.11.0
+
+        n_jobs : :obj:`int`, default=1
+            Number of processes used to make the figures and cluster tables
+            of the contrasts. -1 means 'all CPUs'.
+
+            .. versionadded:: 0.11.0
+
         Returns
         -------
         report_text : :class:`~nilearn.reporting.HTMLReport`
@@ -192,4 +207,6 @@ class BaseGLM(BaseEstimator, TransformerMixin, CacheMixin):
             plot_type=plot_type,
             display_mode=display_mode,
             report_dims=report_dims,
+            image_format=image_format,
+            n_jobs=n_jobs,
         )
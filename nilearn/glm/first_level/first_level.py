@@ -19,8 +19,10 @@ import numpy as np
 import pandas as pd
 from joblib import Memory, Parallel, delayed
 from nibabel import Nifti1Image
+from scipy.fft import irfft, next_fast_len, rfft
 from sklearn.base import clone
-from sklearn.cluster import KMeans
+from sklearn.cluster import MiniBatchKMeans
+from sklearn.utils import check_random_state
 
 from nilearn._utils import fill_doc, stringify_path
 from nilearn._utils.niimg_conversions import check_niimg
@@ -42,12 +44,17 @@ from nilearn.glm.regression import (
 from nilearn.image import get_data
 from nilearn.interfaces.bids import get_bids_files, parse_bids_filename
 from nilearn.interfaces.bids.query import (
+    _get_bids_index,
+    _save_bids_index,
     infer_repetition_time_from_dataset,
     infer_slice_timing_start_time_from_dataset,
 )
 from nilearn.interfaces.bids.utils import bids_entities, check_bids_label
 from nilearn.interfaces.fmriprep.load_confounds import load_confounds
 
+# Maximum number of voxels on which the AR(N) coefficients are clustered
+_AR_CLUSTERING_N_SAMPLES = 10000
+
 
 def mean_scaling(Y, axis=0):
     """Scaling of the data to have percent of baseline change \
@@ -89,13 +96,71 @@ def _ar_model_fit(X, val, Y):
     return ARModel(X, val).fit(Y)
 
 
+def _autocovariance(y, order):
+    """Compute the autocovariance sums of the rows of y up to a lag.
+
+    For lags of a few time points, the products of the shifted rows are
+    summed for each lag. For higher lags, the autocovariance is computed
+    for all lags at once with a FFT, zero-padded not to wrap around.
+
+    Returns
+    -------
+    r : array of shape (n_rows, order + 1)
+        ``r[i, k]`` is the sum over time of ``y[i, t] * y[i, t + k]``.
+    """
+    n_times = y.shape[-1]
+    if order + 1 <= 2 * np.log2(n_times):
+        r = np.empty((y.shape[0], order + 1))
+        for k in range(order + 1):
+            r[:, k] = np.einsum("ij,ij->i", y[:, : n_times - k], y[:, k:])
+        return r
+    n_fft = next_fast_len(n_times + order, real=True)
+    y_fft = rfft(y, n=n_fft, axis=-1)
+    power = y_fft.real**2 + y_fft.imag**2
+    return irfft(power, n=n_fft, axis=-1)[:, : order + 1]
+
+
+def _levinson_durbin(r, order):
+    """Solve the Yule-Walker equations of each row of r.
+
+    The Levinson-Durbin recursion solves the Toeplitz systems of all the
+    rows at once, in O(order ** 2) operations per row. Coefficients of
+    rows with no variance are set to 0.
+
+    Parameters
+    ----------
+    r : array of shape (n_rows, order + 1)
+        Autocovariance of each row from lag 0 to lag ``order``.
+
+    Returns
+    -------
+    rho : array of shape (n_rows, order)
+        AR coefficients of each row.
+    """
+    rho = np.zeros((r.shape[0], order))
+    error = r[:, 0].copy()
+    for k in range(order):
+        # reflection coefficient of order k + 1
+        residual = r[:, k + 1] - np.einsum(
+            "ij,ij->i", rho[:, :k], r[:, k:0:-1]
+        )
+        reflection = np.divide(
+            residual,
+            error,
+            out=np.zeros_like(residual),
+            where=error != 0,
+        )
+        rho[:, :k] -= reflection[:, np.newaxis] * rho[:, k - 1 :: -1][:, :k]
+        rho[:, k] = reflection
+        error *= 1 - reflection**2
+    return rho
+
+
 def _yule_walker(x, order):
     """Compute Yule-Walker (adapted from MNE and statsmodels).
 
     Operates along the last axis of x.
     """
-    from scipy.linalg import toeplitz
-
     if order < 1:
         raise ValueError("AR order must be positive")
     if type(order) is not int:
@@ -105,19 +170,12 @@ def _yule_walker(x, order):
 
     denom = x.shape[-1] - np.arange(order + 1)
     n = np.prod(np.array(x.shape[:-1], int))
-    r = np.zeros((n, order + 1), np.float64)
     y = x - x.mean()
     y.shape = (n, x.shape[-1])  # inplace
-    r[:, 0] += (y[:, np.newaxis, :] @ y[:, :, np.newaxis])[:, 0, 0]
-    for k in range(1, order + 1):
-        r[:, k] += (y[:, np.newaxis, 0:-k] @ y[:, k:, np.newaxis])[:, 0, 0]
+    r = _autocovariance(y, order)
     r /= denom * x.shape[-1]
-    rt = np.array([toeplitz(rr[:-1]) for rr in r], np.float64)
 
-    # extra dimension added to r for compatibility with numpy <2 and >2
-    # see https://numpy.org/devdocs/release/2.0.0-notes.html
-    # section removed-ambiguity-when-broadcasting-in-np-solve
-    rho = np.linalg.solve(rt, r[:, 1:, None])[..., 0]
+    rho = _levinson_durbin(r, order)
 
     rho.shape = x.shape[:-1] + (order,)
     return rho
@@ -146,7 +204,8 @@ def run_glm(
         Maximum number of discrete bins for the AR coef histogram.
         If an autoregressive model with order greater than one is specified
         then adaptive quantification is performed and the coefficients
-        will be clustered via K-means with `bins` number of clusters.
+        will be clustered via mini-batch K-means with `bins` number of
+        clusters, learned on a random subsample of at most 10000 voxels.
 
     n_jobs : int, default=1
         The number of CPUs to use to do the computation. -1 means
@@ -156,7 +215,8 @@ def run_glm(
         The verbosity level.
 
     random_state : int or numpy.random.RandomState, default=None
-        Random state seed to sklearn.cluster.KMeans for autoregressive models
+        Random state seed to sklearn.cluster.MiniBatchKMeans and to the
+        subsampling of the voxels for autoregressive models
         of order at least 2 ('ar(N)' with n >= 2).
 
         .. versionadded:: 0.9.1
@@ -207,34 +267,49 @@ def run_glm(
 
         # Either bin the AR1 coefs or cluster ARN coefs
         if ar_order == 1:
-            for idx in range(len(ar_coef_)):
-                ar_coef_[idx] = (ar_coef_[idx] * bins).astype(int) * 1.0 / bins
-            labels = np.array([str(val) for val in ar_coef_])
+            ar_coef_ = (ar_coef_ * bins).astype(int) * 1.0 / bins
+            # format each bin once
+            bin_values, bin_index = np.unique(ar_coef_, return_inverse=True)
+            labels = np.array([str(val) for val in bin_values])[bin_index]
         else:  # AR(N>1) case
             n_clusters = np.min([bins, Y.shape[1]])
-            kmeans = KMeans(
-                n_clusters=n_clusters, n_init=10, random_state=random_state
-            ).fit(ar_coef_)
-            ar_coef_ = kmeans.cluster_centers_[kmeans.labels_]
+            # the clusters are learned on a subsample of the voxels, to
+            # which all the voxels are then assigned
+            sample = np.arange(len(ar_coef_))
+            n_samples = max(_AR_CLUSTERING_N_SAMPLES, n_clusters)
+            if len(sample) > n_samples:
+                sample = check_random_state(random_state).choice(
+                    sample, n_samples, replace=False
+                )
+            kmeans = MiniBatchKMeans(
+                n_clusters=n_clusters, n_init=3, random_state=random_state
+            ).fit(ar_coef_[sample])
+            cluster_index = kmeans.predict(ar_coef_)
+            ar_coef_ = kmeans.cluster_centers_[cluster_index]
 
             # Create a set of rounded values for the labels with _ between
             # each coefficient
-            cluster_labels = kmeans.cluster_centers_.copy()
             cluster_labels = np.array(
-                ["_".join(map(str, np.round(a, 2))) for a in cluster_labels]
+                [
+                    "_".join(map(str, np.round(a, 2)))
+                    for a in kmeans.cluster_centers_
+                ]
             )
-            # Create labels and coef per voxel
-            labels = np.array([cluster_labels[i] for i in kmeans.labels_])
-
-        unique_labels = np.unique(labels)
+            # Create labels per voxel
+            labels = cluster_labels[cluster_index]
+
+        # voxels of each label, in increasing order
+        unique_labels, label_index = np.unique(labels, return_inverse=True)
+        label_voxels = np.split(
+            np.argsort(label_index, kind="stable"),
+            np.cumsum(np.bincount(label_index))[:-1],
+        )
         results = {}
 
         # Fit the AR model according to current AR(N) estimates
         ar_result = Parallel(n_jobs=n_jobs, verbose=verbose)(
-            delayed(_ar_model_fit)(
-                X, ar_coef_[labels == val][0], Y[:, labels == val]
-            )
-            for val in unique_labels
+            delayed(_ar_model_fit)(X, ar_coef_[voxels[0]], Y[:, voxels])
+            for voxels in label_voxels
         )
 
         # Converting the key to a string is required for AR(N>1) cases
@@ -385,7 +460,7 @@ class FirstLevelModel(BaseGLM):
         a `SecondLevelModel` object.
 
     random_state : int or numpy.random.RandomState, default=None.
-        Random state seed to sklearn.cluster.KMeans
+        Random state seed to sklearn.cluster.MiniBatchKMeans
         for autoregressive models
         of order at least 2 ('ar(N)' with n >= 2).
 
@@ -1124,6 +1199,11 @@ def first_level_from_bids(
     The subject label of the model will be determined directly
     from the :term:`BIDS` dataset.
 
+    The files of the dataset are indexed the first time they are searched.
+    If ``memory`` points to a cache directory, this index is saved there
+    and reused by later calls on the same dataset,
+    only listing again the folders modified since.
+
     Parameters
     ----------
     dataset_path : :obj:`str` or :obj:`pathlib.Path`
@@ -1312,6 +1392,16 @@ def first_level_from_bids(
     derivatives_path = Path(dataset_path) / derivatives_folder
     derivatives_path = derivatives_path.absolute()
 
+    # Load the index of the files of the dataset
+    # if it was saved in the cache directory.
+    if isinstance(memory, (str, Path)):
+        index_cache_dir = memory
+    else:
+        index_cache_dir = memory.location
+    if index_cache_dir is not None:
+        for path in (dataset_path, derivatives_path):
+            _get_bids_index(path, cache_dir=index_cache_dir)
+
     # Get metadata for models.
     #
     # We do it once and assume all subjects and runs
@@ -1484,6 +1574,10 @@ def first_level_from_bids(
         )
         models_confounds.append(confounds)
 
+    if index_cache_dir is not None:
+        for path in (dataset_path, derivatives_path):
+            _save_bids_index(path, cache_dir=index_cache_dir)
+
     return models, models_run_imgs, models_events, models_confounds
 
 
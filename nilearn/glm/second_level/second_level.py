@@ -207,6 +207,42 @@ def _check_input_as_nifti_images(second_level_input, none_design_matrix):
         )
 
 
+def _check_input_as_dict(second_level_input, none_design_matrix):
+    """Check second_level_input given as a mapping of lists of niimgs.
+
+    All lists must contain the same number of maps,
+    as they are all fitted with the same design matrix.
+    """
+    if len(second_level_input) == 0:
+        raise ValueError("second_level_input dictionary is empty.")
+    n_maps = None
+    for name, maps in second_level_input.items():
+        if not isinstance(maps, (list, pd.Series)):
+            raise TypeError(
+                "The values of a second_level_input dictionary "
+                "must be lists of Niimg-like objects. "
+                f"Got {type(maps)} for key {name!r}."
+            )
+        if isinstance(maps, pd.Series):
+            maps = maps.to_list()
+        if _check_input_type_when_list(maps) != "nii_object":
+            raise TypeError(
+                "The values of a second_level_input dictionary "
+                "must be lists of Niimg-like objects. "
+                f"Got {_return_type(maps)} for key {name!r}."
+            )
+        _check_input_as_nifti_images(maps, none_design_matrix)
+        if n_maps is None:
+            n_maps = len(maps)
+        elif len(maps) != n_maps:
+            raise ValueError(
+                "All the lists of a second_level_input dictionary "
+                "must contain the same number of maps. "
+                f"Got {len(maps)} maps for key {name!r} "
+                f"instead of {n_maps}."
+            )
+
+
 def _check_confounds(confounds):
     """Check confounds type."""
     if confounds is not None:
@@ -243,6 +279,18 @@ def _check_first_level_contrast(second_level_input, first_level_contrast):
         )
 
 
+def _check_first_level_contrast_in_dict(
+    second_level_input, first_level_contrast
+):
+    if first_level_contrast not in second_level_input:
+        raise ValueError(
+            "If second_level_input was a dictionary, "
+            "then first_level_contrast must be one of its keys: "
+            f"{list(second_level_input)}. "
+            f"Got {first_level_contrast!r} instead."
+        )
+
+
 def _check_output_type(output_type, valid_types):
     if output_type not in valid_types:
         raise ValueError(f"output_type must be one of {valid_types}")
@@ -365,6 +413,43 @@ def _process_second_level_input_as_firstlevelmodels(second_level_input):
     return sample_map, labels
 
 
+def _split_regression_results(result, n_splits):
+    """Split the columns of a regression result in ``n_splits`` \
+    consecutive blocks of equal size.
+
+    Parameters
+    ----------
+    result : :class:`~nilearn.glm.regression.RegressionResults`
+        Result of a model fitted on horizontally stacked targets.
+
+    n_splits : :obj:`int`
+        Number of stacked targets.
+
+    Returns
+    -------
+    results : :obj:`list` of \
+              :class:`~nilearn.glm.regression.RegressionResults`
+        One result per target, sharing the fitted model.
+
+    """
+    n_columns = result.theta.shape[1] // n_splits
+    results = []
+    for idx in range(n_splits):
+        columns = slice(idx * n_columns, (idx + 1) * n_columns)
+        results.append(
+            RegressionResults(
+                result.theta[:, columns],
+                result.Y[:, columns],
+                result.model,
+                result.whitened_Y[:, columns],
+                result.whitened_residuals[:, columns],
+                cov=result.cov,
+                dispersion=result.dispersion[columns],
+            )
+        )
+    return results
+
+
 @fill_doc
 class SecondLevelModel(BaseGLM):
     """Implement the :term:`General Linear Model<GLM>` for multiple \
@@ -433,6 +518,7 @@ class SecondLevelModel(BaseGLM):
         self.confounds_ = None
         self.labels_ = None
         self.results_ = None
+        self._batch_results = None
 
     @fill_doc
     def fit(self, second_level_input, confounds=None, design_matrix=None):
@@ -445,6 +531,18 @@ class SecondLevelModel(BaseGLM):
         Parameters
         ----------
         %(second_level_input)s
+            Alternatively, a :obj:`dict` mapping first level contrast names
+            to :obj:`list` of Niimg-like objects can be given
+            to fit several targets sharing the same ``design_matrix``
+            in a single pass: the mask is learned once
+            and all the targets are solved as one stacked least-squares
+            problem.
+            The results of each target are then obtained
+            by passing its name as ``first_level_contrast``
+            to :meth:`compute_contrast`.
+
+            .. versionadded:: 0.11.0
+
         confounds : :class:`pandas.DataFrame`, optional
             Must contain a ``subject_label`` column. All other columns are
             considered as confounds and included in the model. If
@@ -463,9 +561,12 @@ class SecondLevelModel(BaseGLM):
 
         """
         # check second_level_input
-        _check_second_level_input(
-            second_level_input, design_matrix, confounds=confounds
-        )
+        if isinstance(second_level_input, dict):
+            _check_input_as_dict(second_level_input, design_matrix is None)
+        else:
+            _check_second_level_input(
+                second_level_input, design_matrix, confounds=confounds
+            )
 
         # check confounds
         _check_confounds(confounds)
@@ -477,9 +578,14 @@ class SecondLevelModel(BaseGLM):
             second_level_input = _sort_input_dataframe(second_level_input)
         self.second_level_input_ = second_level_input
         self.confounds_ = confounds
-        sample_map, subjects_label = _process_second_level_input(
-            second_level_input
-        )
+        self._batch_results = None
+        if isinstance(second_level_input, dict):
+            sample_map = mean_img(list(second_level_input.values())[0])
+            subjects_label = None
+        else:
+            sample_map, subjects_label = _process_second_level_input(
+                second_level_input
+            )
 
         # Report progress
         t0 = time.time()
@@ -517,6 +623,9 @@ class SecondLevelModel(BaseGLM):
                 setattr(self.masker_, param_name, our_param)
         self.masker_.fit(sample_map)
 
+        if isinstance(second_level_input, dict):
+            self._batch_results = self._fit_batch(second_level_input)
+
         # Report progress
         if self.verbose > 0:
             sys.stderr.write(
@@ -526,6 +635,58 @@ class SecondLevelModel(BaseGLM):
 
         return self
 
+    def _fit_batch(self, second_level_input):
+        """Fit an :term:`OLS` model to all the targets at once.
+
+        The maps of all the targets are masked in a single call,
+        stacked horizontally into a (n_subjects, n_targets * n_voxels)
+        matrix, and regressed on the design matrix,
+        so that its pseudo-inverse is computed only once.
+
+        Returns
+        -------
+        batch_results : :obj:`dict`
+            Mapping of each target name to its (labels, results) pair,
+            as returned by :func:`~nilearn.glm.first_level.run_glm`.
+
+        """
+        names = list(second_level_input)
+        effect_maps = []
+        for name in names:
+            effect_maps.extend(list(second_level_input[name]))
+        # Check design matrix X and effect maps Y agree on number of rows
+        _check_effect_maps(
+            list(second_level_input[names[0]]), self.design_matrix_
+        )
+
+        Y = self.masker_.transform(effect_maps)
+        n_voxels = Y.shape[1]
+        Y = (
+            Y.reshape(len(names), -1, n_voxels)
+            .transpose(1, 0, 2)
+            .reshape(-1, len(names) * n_voxels)
+        )
+        if self.memory:
+            mem_glm = self.memory.cache(run_glm, ignore=["n_jobs"])
+        else:
+            mem_glm = run_glm
+        _, results = mem_glm(
+            Y,
+            self.design_matrix_.values,
+            n_jobs=self.n_jobs,
+            noise_model="ols",
+        )
+        del Y
+
+        batch_results = {}
+        for name, result in zip(
+            names, _split_regression_results(results[0.0], len(names))
+        ):
+            if self.minimize_memory:
+                result = SimpleRegressionResults(result)
+            batch_results[name] = (np.zeros(n_voxels), {0.0: result})
+        return batch_results
+
     @fill_doc
     def compute_contrast(
         self,
@@ -554,6 +715,8 @@ class SecondLevelModel(BaseGLM):
               ``second_level_input`` this is the map name to extract from the
               :class:`~pandas.DataFrame` ``map_name`` column. It has to be
               a 't' contrast.
+            - In case a :obj:`dict` was provided as ``second_level_input``
+              this is the key of the target to use.
 
         second_level_stat_type : {'t', 'F'} or None, default=None
             Type of the second level contrast.
@@ -574,9 +737,14 @@ class SecondLevelModel(BaseGLM):
             raise ValueError("The model has not been fit yet.")
 
         # check first_level_contrast
-        _check_first_level_contrast(
-            self.second_level_input_, first_level_contrast
-        )
+        if isinstance(self.second_level_input_, dict):
+            _check_first_level_contrast_in_dict(
+                self.second_level_input_, first_level_contrast
+            )
+        else:
+            _check_first_level_contrast(
+                self.second_level_input_, first_level_contrast
+            )
 
         # check contrast and obtain con_val
         con_val = _get_con_val(second_level_contrast, self.design_matrix_)
@@ -594,30 +762,35 @@ class SecondLevelModel(BaseGLM):
         ]
         _check_output_type(output_type, valid_types)
 
-        # Get effect_maps appropriate for chosen contrast
-        effect_maps = _infer_effect_maps(
-            self.second_level_input_, first_level_contrast
-        )
-        # Check design matrix X and effect maps Y agree on number of rows
-        _check_effect_maps(effect_maps, self.design_matrix_)
-
-        # Fit an Ordinary Least Squares regression for parametric statistics
-        Y = self.masker_.transform(effect_maps)
-        if self.memory:
-            mem_glm = self.memory.cache(run_glm, ignore=["n_jobs"])
+        if self._batch_results is not None:
+            # The model was already fitted for all targets
+            labels, results = self._batch_results[first_level_contrast]
         else:
-            mem_glm = run_glm
-        labels, results = mem_glm(
-            Y,
-            self.design_matrix_.values,
-            n_jobs=self.n_jobs,
-            noise_model="ols",
-        )
+            # Get effect_maps appropriate for chosen contrast
+            effect_maps = _infer_effect_maps(
+                self.second_level_input_, first_level_contrast
+            )
+            # Check design matrix X and effect maps Y agree on number of rows
+            _check_effect_maps(effect_maps, self.design_matrix_)
+
+            # Fit an Ordinary Least Squares regression
+            # for parametric statistics
+            Y = self.masker_.transform(effect_maps)
+            if self.memory:
+                mem_glm = self.memory.cache(run_glm, ignore=["n_jobs"])
+            else:
+                mem_glm = run_glm
+            labels, results = mem_glm(
+                Y,
+                self.design_matrix_.values,
+                n_jobs=self.n_jobs,
+                noise_model="ols",
+            )
 
-        # We save memory if inspecting model details is not necessary
-        if self.minimize_memory:
-            for key in results:
-                results[key] = SimpleRegressionResults(results[key])
+            # We save memory if inspecting model details is not necessary
+            if self.minimize_memory:
+                for key in results:
+                    results[key] = SimpleRegressionResults(results[key])
         self.labels_ = labels
         self.results_ = results
 
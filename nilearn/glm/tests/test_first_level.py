@@ -16,7 +16,7 @@ from numpy.testing import (
     assert_array_equal,
     assert_array_less,
 )
-from sklearn.cluster import KMeans
+from sklearn.cluster import MiniBatchKMeans
 
 from nilearn._utils.data_gen import (
     add_metadata_to_bids_dataset,
@@ -28,6 +28,7 @@ from nilearn._utils.data_gen import (
 from nilearn.glm.contrasts import compute_fixed_effects
 from nilearn.glm.first_level import (
     FirstLevelModel,
+    first_level,
     first_level_from_bids,
     mean_scaling,
     run_glm,
@@ -37,6 +38,7 @@ from nilearn.glm.first_level.design_matrix import (
     make_first_level_design_matrix,
 )
 from nilearn.glm.first_level.first_level import (
+    _autocovariance,
     _check_and_load_tables,
     _check_list_length_match,
     _check_run_tables,
@@ -493,6 +495,53 @@ def test_glm_AR_estimates(rng, ar_vals):
     assert_almost_equal(yw[0], ar_vals, decimal=1)
 
 
+@pytest.mark.parametrize("order", [1, 3, 6, 30])
+def test_yule_walker_levinson_durbin(rng, order):
+    """Check the AR coefficients against the solution of the Toeplitz \
+    systems, with the autocovariance computed by lags or by FFT."""
+    from scipy.linalg import toeplitz
+
+    x = rng.standard_normal((5, 7, 60))
+    y = (x - x.mean()).reshape(-1, 60)
+    r = np.array(
+        [
+            [np.dot(row[: 60 - k], row[k:]) for k in range(order + 1)]
+            for row in y
+        ]
+    )
+    assert_almost_equal(_autocovariance(y, order), r)
+
+    r /= (60 - np.arange(order + 1)) * 60
+    expected = np.array(
+        [np.linalg.solve(toeplitz(row[:-1]), row[1:]) for row in r]
+    )
+
+    rho = _yule_walker(x, order)
+
+    assert rho.shape == (5, 7, order)
+    assert_almost_equal(rho.reshape(-1, order), expected)
+
+
+def test_run_glm_ar3_cluster_subsample(rng, monkeypatch):
+    """Check that all voxels are assigned to clusters learned on a \
+    subsample of the voxels."""
+    monkeypatch.setattr(
+        first_level, "_AR_CLUSTERING_N_SAMPLES", 20, raising=True
+    )
+    n, p, q = 50, 80, 10
+    X, Y = rng.standard_normal(size=(p, q)), rng.standard_normal(size=(p, n))
+
+    labels, results = run_glm(Y, X, "ar3", bins=5, random_state=0)
+
+    assert len(labels) == n
+    assert 1 < len(results) <= 5
+    assert sum(val.theta.shape[1] for val in results.values()) == n
+    for label, result in results.items():
+        assert_almost_equal(
+            result.model.rho, [float(val) for val in label.split("_")], 2
+        )
+
+
 def test_glm_AR_estimates_errors(rng):
     """Test Yule-Walker errors."""
     (n, p) = (1, 500)
@@ -515,10 +564,10 @@ def test_glm_random_state(random_state):
     X, Y = rng.standard_normal(size=(p, q)), rng.standard_normal(size=(p, n))
 
     with unittest.mock.patch.object(
-        KMeans,
+        MiniBatchKMeans,
         "__init__",
         autospec=True,
-        side_effect=KMeans.__init__,
+        side_effect=MiniBatchKMeans.__init__,
     ) as spy_kmeans:
         run_glm(Y, X, "ar3", random_state=random_state)
         spy_kmeans.assert_called_once_with(
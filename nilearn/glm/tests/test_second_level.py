@@ -1075,6 +1075,73 @@ def test_second_level_contrast_computation(tmp_path, rng):
     model.compute_contrast(second_level_contrast="r1 - r2")
 
 
+def test_second_level_batch_fit(rng, affine_eye):
+    """Check that fitting several targets at once gives the same results \
+    as fitting them one by one."""
+    shape = SHAPE[:3]
+    mask = Nifti1Image(np.ones(shape, dtype="int8"), affine_eye)
+    second_level_input = {
+        name: [
+            Nifti1Image(rng.standard_normal(shape), affine_eye)
+            for _ in range(5)
+        ]
+        for name in ["a", "b", "c"]
+    }
+    X = pd.DataFrame(rng.uniform(size=(5, 2)), columns=["r1", "r2"])
+
+    batch_model = SecondLevelModel(mask_img=mask).fit(
+        second_level_input, design_matrix=X
+    )
+
+    for name, maps in second_level_input.items():
+        model = SecondLevelModel(mask_img=mask).fit(maps, design_matrix=X)
+        expected = model.compute_contrast("r1 - r2", output_type="all")
+        outputs = batch_model.compute_contrast(
+            "r1 - r2", first_level_contrast=name, output_type="all"
+        )
+        for output_type, img in expected.items():
+            assert_array_almost_equal(
+                get_data(outputs[output_type]), get_data(img)
+            )
+
+
+def test_second_level_batch_fit_voxelwise_attribute(rng, affine_eye):
+    shape = SHAPE[:3]
+    mask = Nifti1Image(np.ones(shape, dtype="int8"), affine_eye)
+    maps = [Nifti1Image(rng.standard_normal(shape), affine_eye)] * 4
+    X = pd.DataFrame([[1]] * 4, columns=["intercept"])
+
+    model = SecondLevelModel(mask_img=mask, minimize_memory=False)
+    model.fit({"a": maps, "b": maps}, design_matrix=X)
+    model.compute_contrast(first_level_contrast="b")
+
+    assert model.residuals.shape == (*shape, 4)
+    assert_array_almost_equal(
+        model.masker_.transform(model.residuals).mean(0), 0
+    )
+
+
+def test_second_level_batch_fit_errors(rng, affine_eye):
+    shape = SHAPE[:3]
+    mask = Nifti1Image(np.ones(shape, dtype="int8"), affine_eye)
+    maps = [Nifti1Image(rng.standard_normal(shape), affine_eye)] * 4
+    X = pd.DataFrame([[1]] * 4, columns=["intercept"])
+    model = SecondLevelModel(mask_img=mask)
+
+    with pytest.raises(ValueError, match="dictionary is empty"):
+        model.fit({}, design_matrix=X)
+    with pytest.raises(ValueError, match="same number of maps"):
+        model.fit({"a": maps, "b": maps[:3]}, design_matrix=X)
+    with pytest.raises(ValueError, match="require a design matrix"):
+        model.fit({"a": maps})
+    with pytest.raises(TypeError, match="must be lists of Niimg-like"):
+        model.fit({"a": maps[0]}, design_matrix=X)
+
+    model.fit({"a": maps, "b": maps}, design_matrix=X)
+    with pytest.raises(ValueError, match="must be one of its keys"):
+        model.compute_contrast(first_level_contrast="c")
+
+
 def test_second_level_contrast_computation_errors(tmp_path, rng):
     func_img, mask = fake_fmri_data(file_path=tmp_path)
 
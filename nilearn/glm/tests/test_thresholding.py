@@ -12,7 +12,11 @@ from nilearn.glm import (
     fdr_threshold,
     threshold_stats_img,
 )
-from nilearn.glm.thresholding import _compute_hommel_value
+from nilearn.glm.thresholding import (
+    _compute_hommel_value,
+    _true_positive_fraction,
+    _true_positive_fractions,
+)
 from nilearn.image import get_data
 
 
@@ -225,6 +229,32 @@ def test_all_resolution_inference(data_norm_isf, affine_eye):
     )
 
 
+def test_true_positive_fractions(rng):
+    """Check the vectorized TDP against the per-cluster computation."""
+    stats = rng.standard_normal(500) * 2
+    labels = rng.integers(0, 20, size=500)
+    labels[labels == 7] = 0  # a label with no voxel
+    hommel_value = _compute_hommel_value(stats, alpha=0.05)
+
+    proportions = _true_positive_fractions(
+        norm.sf(stats),
+        labels,
+        np.argsort(-stats, kind="stable"),
+        hommel_value,
+        alpha=0.05,
+    )
+
+    assert proportions[0] == 0
+    assert proportions[7] == 0
+    for label_ in set(np.unique(labels)) - {0}:
+        assert_almost_equal(
+            proportions[label_],
+            _true_positive_fraction(
+                stats[labels == label_], hommel_value, 0.05
+            ),
+        )
+
+
 def test_all_resolution_inference_with_mask(
     img_3d_ones_eye, affine_eye, data_norm_isf
 ):
@@ -12,7 +12,7 @@ import numpy as np
 from scipy.ndimage import label
 from scipy.stats import norm
 
-from nilearn.image import get_data, math_img, threshold_img
+from nilearn.image import get_data, threshold_img
 from nilearn.maskers import NiftiMasker
 
 
@@ -80,6 +80,61 @@ def _true_positive_fraction(z_vals, hommel_value, alpha):
     return proportion_true_discoveries
 
 
+def _true_positive_fractions(p_vals, labels, order, hommel_value, alpha):
+    """Compute the true positive fraction of all clusters at once.
+
+    This is a vectorized equivalent of calling
+    :func:`_true_positive_fraction` on each cluster in turn.
+
+    Parameters
+    ----------
+    p_vals : 1D array
+        p-values of all the voxels.
+
+    labels : 1D array of int
+        Cluster label of each voxel; 0 for voxels outside any cluster.
+
+    order : 1D array of int
+        Indices sorting ``p_vals`` in increasing order.
+
+    hommel_value: int
+        The Hommel value, used in the computations.
+
+    alpha : float
+        The desired FDR control.
+
+    Returns
+    -------
+    proportions : 1D array
+        True positive fraction of each cluster, indexed by label.
+        ``proportions[0]`` is always 0.
+
+    """
+    n_labels = labels.max() if labels.size else 0
+    proportions = np.zeros(n_labels + 1)
+    if n_labels == 0:
+        return proportions
+
+    # group voxels by cluster, keeping p-values sorted within each cluster
+    order = order[labels[order] > 0]
+    order = order[np.argsort(labels[order], kind="stable")]
+    sorted_labels = labels[order]
+    sizes = np.bincount(sorted_labels, minlength=n_labels + 1)[1:]
+    starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+
+    # rank of each voxel within its cluster
+    ranks = np.arange(order.size) - np.repeat(starts, sizes)
+    c = np.ceil((hommel_value * p_vals[order]) / alpha)
+    # the criterion is maximal at the last voxel of each value of c,
+    # so its maximum over unique values is its maximum over all voxels
+    criterion = ranks + 2 - c
+
+    present = sizes > 0
+    maxima = np.maximum.reduceat(criterion, starts[present])
+    proportions[1:][present] = np.maximum(0, maxima / sizes[present])
+    return proportions
+
+
 def fdr_threshold(z_vals, alpha):
     """Return the Benjamini-Hochberg FDR threshold for the input z_vals.
 
@@ -156,24 +211,25 @@ def cluster_level_inference(
 
     # embed it back to 3D grid
     stat_map = get_data(masker.inverse_transform(stats))
+    mask = get_data(masker.mask_img_) > 0
 
-    # Extract connected components above threshold
-    proportion_true_discoveries_img = math_img("0. * img", img=stat_img)
-    proportion_true_discoveries = masker.transform(
-        proportion_true_discoveries_img
-    ).ravel()
+    # sort the p-values once for all thresholds
+    p_vals = norm.sf(stats)
+    order = np.argsort(-stats, kind="stable")
+
+    proportion_true_discoveries = np.zeros_like(stats, dtype="float64")
 
+    # Extract connected components above threshold
     for threshold_ in sorted(threshold):
-        label_map, n_labels = label(stat_map > threshold_)
-        labels = label_map[get_data(masker.mask_img_) > 0]
-
-        for label_ in range(1, n_labels + 1):
-            # get the z-vals in the cluster
-            cluster_vals = stats[labels == label_]
-            proportion = _true_positive_fraction(
-                cluster_vals, hommel_value, alpha
-            )
-            proportion_true_discoveries[labels == label_] = proportion
+        label_map, _ = label(stat_map > threshold_)
+        labels = label_map[mask]
+        proportions = _true_positive_fractions(
+            p_vals, labels, order, hommel_value, alpha
+        )
+        in_cluster = labels > 0
+        proportion_true_discoveries[in_cluster] = proportions[
+            labels[in_cluster]
+        ]
 
     proportion_true_discoveries_img = masker.inverse_transform(
         proportion_true_discoveries
@@ -14,7 +14,7 @@ import warnings
 import nibabel
 import numpy as np
 from joblib import Memory, Parallel, delayed
-from scipy.ndimage import gaussian_filter1d, generate_binary_structure, label
+from scipy.ndimage import gaussian_filter1d
 from scipy.stats import scoreatpercentile
 
 from .. import signal
@@ -28,8 +28,10 @@ from .._utils import (
 )
 from .._utils.exceptions import DimensionError
 from .._utils.helpers import rename_parameters, stringify_path
-from .._utils.niimg import _get_data, safe_get_data
+from .._utils.ndimage import threshold_cluster_size
+from .._utils.niimg import _get_data, _iter_volume_chunks, safe_get_data
 from .._utils.niimg_conversions import (
+    _check_niimg_in_list,
     _index_img,
     check_same_fov,
     iter_check_niimg,
@@ -37,6 +39,9 @@ from .._utils.niimg_conversions import (
 from .._utils.param_validation import check_threshold
 from .._utils.path_finding import resolve_globbing
 
+# Size of the image data read at once to compute the mean of a 4D image
+_MEAN_CHUNK_NBYTES = 2**27
+
 
 def get_data(img):
     """Get the image data as a :class:`numpy.ndarray`.
@@ -455,25 +460,58 @@ def _pad_array(array, pad_sizes):
     return padded
 
 
+def _mean_over_time(img):
+    """Compute the mean of a 4D image over time, a few volumes at a time.
+
+    If the data of the image is not in memory, its file is read once,
+    and only :data:`_MEAN_CHUNK_NBYTES` of data are loaded at a time.
+    The sum is accumulated in float64, and the mean has the dtype that
+    :func:`numpy.mean` would give.
+    """
+    n_volumes = img.shape[3]
+    volume_nbytes = 8 * np.prod(img.shape[:3])
+    chunk_size = int(max(1, _MEAN_CHUNK_NBYTES // volume_nbytes))
+    total = np.zeros(img.shape[:3])
+    dtype = None
+    for _, chunk in _iter_volume_chunks(img, chunk_size):
+        if dtype is None:
+            dtype = np.mean(chunk[:1, :1, :1, :1]).dtype
+        total += chunk.sum(axis=-1, dtype=np.float64)
+    return (total / n_volumes).astype(dtype, copy=False)
+
+
+def _smooth_mean(mean_data, smooth):
+    """Smooth a mean image with a FWHM of ``smooth`` voxels, keeping NaNs."""
+    nan_mask = np.isnan(mean_data)
+    mean_data = smooth_array(
+        mean_data,
+        affine=np.eye(4),
+        fwhm=smooth,
+        ensure_finite=True,
+        copy=False,
+    )
+    mean_data[nan_mask] = np.nan
+    return mean_data
+
+
 def _compute_mean(imgs, target_affine=None, target_shape=None, smooth=False):
     from . import resampling
 
     input_repr = _repr_niimgs(imgs, shorten=True)
 
     imgs = check_niimg(imgs)
-    mean_data = safe_get_data(imgs)
     affine = imgs.affine
-    # Free memory ASAP
-    del imgs
-    if mean_data.ndim not in (3, 4):
+    if len(imgs.shape) not in (3, 4):
         raise ValueError(
             "Computation expects 3D or 4D images, "
-            f"but {mean_data.ndim} dimensions were given ({input_repr})"
+            f"but {len(imgs.shape)} dimensions were given ({input_repr})"
         )
-    if mean_data.ndim == 4:
-        mean_data = mean_data.mean(axis=-1)
+    if len(imgs.shape) == 4:
+        mean_data = _mean_over_time(imgs)
     else:
-        mean_data = mean_data.copy()
+        mean_data = safe_get_data(imgs).copy()
+    # Free memory ASAP
+    del imgs
     mean_data = resampling.resample_img(
         nibabel.Nifti1Image(mean_data, affine),
         target_affine=target_affine,
@@ -484,15 +522,7 @@ def _compute_mean(imgs, target_affine=None, target_shape=None, smooth=False):
     mean_data = get_data(mean_data)
 
     if smooth:
-        nan_mask = np.isnan(mean_data)
-        mean_data = smooth_array(
-            mean_data,
-            affine=np.eye(4),
-            fwhm=smooth,
-            ensure_finite=True,
-            copy=False,
-        )
-        mean_data[nan_mask] = np.nan
+        mean_data = _smooth_mean(mean_data, smooth)
 
     return mean_data, affine
 
@@ -841,24 +871,7 @@ def _apply_cluster_size_threshold(arr, cluster_threshold, copy=True):
     """
     assert arr.ndim == 3
 
-    if copy:
-        arr = arr.copy()
-
-    # Define array for 6-connectivity, aka NN1 or "faces"
-    bin_struct = generate_binary_structure(3, 1)
-
-    for sign in np.unique(np.sign(arr)):
-        # Binarize using one-sided cluster-defining threshold
-        binarized = ((arr * sign) > 0).astype(int)
-
-        # Apply cluster threshold
-        label_map = label(binarized, bin_struct)[0]
-        clust_ids = sorted(list(np.unique(label_map)[1:]))
-        for c_val in clust_ids:
-            if np.sum(label_map == c_val) < cluster_threshold:
-                arr[label_map == c_val] = 0
-
-    return arr
+    return threshold_cluster_size(arr, cluster_threshold, copy=copy)
 
 
 def threshold_img(
@@ -1400,6 +1413,7 @@ def concat_imgs(
     memory_level=0,
     auto_resample=False,
     verbose=0,
+    n_jobs=1,
 ):
     """Concatenate a list of 3D/4D niimgs of varying lengths.
 
@@ -1436,11 +1450,22 @@ def concat_imgs(
         Rough estimator of the amount of memory used by caching. Higher value
         means more memory for caching.
 
+    n_jobs : integer, default=1
+        Number of threads used to load (e.g. decompress) and resample the
+        images. Each image is written directly in the concatenated data.
+
+        .. versionadded:: 0.11.0
+
     Returns
     -------
     concatenated : nibabel.Nifti1Image
         A single image.
 
+    Notes
+    -----
+    Only the headers of the images are read to check their dimensions, so
+    the data of each image is loaded only once.
+
     See Also
     --------
     nilearn.image.index_img
@@ -1500,6 +1525,32 @@ def concat_imgs(
     if dtype is None:
         dtype = _get_data(first_niimg).dtype
     data = np.ndarray(target_shape + (sum(lengths),), order="F", dtype=dtype)
+
+    if n_jobs != 1:
+        # reuse the first image, the data of which may already be loaded
+        niimgs = itertools.chain(
+            [first_niimg], itertools.islice(iterator, 1, None)
+        )
+        starts = np.cumsum([0] + lengths[:-1])
+        Parallel(n_jobs=n_jobs, prefer="threads")(
+            delayed(_load_concatenated_img)(
+                data[..., start : start + size],
+                niimg,
+                index,
+                ref_fov=(first_niimg.affine, target_shape),
+                resample=auto_resample,
+                memory=memory,
+                memory_level=memory_level,
+                verbose=verbose,
+            )
+            for index, (start, size, niimg) in enumerate(
+                zip(starts, lengths, niimgs)
+            )
+        )
+        return new_img_like(
+            first_niimg, data, first_niimg.affine, copy_header=True
+        )
+
     cur_4d_index = 0
     for index, (size, niimg) in enumerate(
         zip(
@@ -1529,6 +1580,30 @@ def concat_imgs(
     )
 
 
+def _load_concatenated_img(
+    out, niimg, index, ref_fov, resample, memory, memory_level, verbose
+):
+    """Check, resample if needed and load image #index of concat_imgs \
+    into out."""
+    if verbose > 0:
+        nii_str = (
+            f"image {niimg}" if isinstance(niimg, str) else f"image #{index}"
+        )
+        print(f"Concatenating {index + 1}: {nii_str}")
+    niimg = _check_niimg_in_list(
+        niimg,
+        index,
+        ensure_ndim=4,
+        atleast_4d=True,
+        ref_fov=ref_fov,
+        resample=resample,
+        warn_resample=True,
+        memory=memory,
+        memory_level=memory_level,
+    )
+    out[...] = _get_data(niimg)
+
+
 def largest_connected_component_img(imgs):
     """Return the largest connected component of an image or list of images.
 
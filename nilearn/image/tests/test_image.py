@@ -442,6 +442,21 @@ def test_mean_img(images_to_mean, tmp_path):
         )
 
 
+@pytest.mark.parametrize("dtype", ["float32", "int16"])
+def test_mean_img_chunks(rng, affine_eye, tmp_path, monkeypatch, dtype):
+    """The mean of a 4D image file is computed a few volumes at a time."""
+    data = (100 * rng.uniform(size=(5, 6, 7, 11))).astype(dtype)
+    Nifti1Image(data, affine_eye).to_filename(tmp_path / "img.nii.gz")
+    # chunks of 3 volumes, the last one shorter
+    monkeypatch.setattr(image, "_MEAN_CHUNK_NBYTES", 3 * 8 * 5 * 6 * 7)
+
+    mean_img = image.mean_img(tmp_path / "img.nii.gz")
+
+    expected = data.mean(axis=-1)
+    assert get_data(mean_img).dtype == expected.dtype
+    assert_allclose(get_data(mean_img), expected, rtol=1e-5)
+
+
 def test_mean_img_resample(rng):
     # Test resampling in mean_img with a permutation of the axes
     data = rng.uniform(size=(5, 6, 7, 40))
@@ -1174,6 +1189,41 @@ def test_concat_niimgs(affine_eye, tmp_path):
     assert_array_equal(get_data(concatenated)[..., 1], get_data(img2))
 
 
+@pytest.mark.parametrize("auto_resample", [False, True])
+def test_concat_niimgs_n_jobs(auto_resample, affine_eye, rng, tmp_path):
+    shape = (10, 11, 12)
+    filenames = []
+    for i, n_scans in enumerate([1, 3, 1, 2]):
+        filenames.append(tmp_path / f"{i}.nii.gz")
+        nibabel.save(
+            Nifti1Image(rng.random(shape + (n_scans,)), affine_eye),
+            filenames[-1],
+        )
+
+    expected = concat_imgs(filenames, auto_resample=auto_resample)
+    concatenated = concat_imgs(
+        filenames, auto_resample=auto_resample, n_jobs=2
+    )
+
+    assert concatenated.shape == shape + (7,)
+    assert_array_equal(get_data(concatenated), get_data(expected))
+    assert_array_equal(concatenated.affine, expected.affine)
+
+
+def test_concat_niimgs_n_jobs_errors(affine_eye):
+    img = Nifti1Image(np.ones((10, 11, 12)), affine_eye)
+    other_img = Nifti1Image(np.ones((12, 11, 10)), affine_eye)
+
+    with pytest.raises(ValueError, match="Field of view of image #1"):
+        concat_imgs([img, other_img], n_jobs=2)
+
+    with pytest.warns(UserWarning, match="Affine is different"):
+        concatenated = concat_imgs(
+            [img, other_img], auto_resample=True, n_jobs=2
+        )
+    assert concatenated.shape == (10, 11, 12, 2)
+
+
 def test_concat_niimg_dtype(affine_eye):
     shape = [2, 3, 4]
     vols = [
@@ -2,12 +2,22 @@
 
 from __future__ import annotations
 
-import glob
+import fnmatch
+import hashlib
 import json
 import os
+from collections import OrderedDict
 from pathlib import Path
 from warnings import warn
 
+from nilearn._utils.cache_mixin import _register_in_memory_cache
+
+# In-process index of the BIDS datasets last scanned.
+# Maps the absolute path of a dataset to the listing of its directories.
+_BIDS_INDEXES = OrderedDict()
+_BIDS_INDEXES_SIZE = 8
+_register_in_memory_cache(_BIDS_INDEXES.clear)
+
 
 def _get_metadata_from_bids(
     field,
@@ -225,38 +235,200 @@ def get_bids_files(
         List of file paths found.
 
     """
+    index = _get_bids_index(main_path)
     if sub_folder:
         ses_level = ""
-        files = os.path.join(main_path, "sub-*", "ses-*")
-        session_folder_exists = glob.glob(files)
+        session_folder_exists = _match_bids_index(
+            index, main_path, ["sub-*", "ses-*"]
+        )
         if session_folder_exists:
             ses_level = "ses-*"
 
-        files = os.path.join(
-            main_path,
+        pattern = [
             f"sub-{sub_label}",
             ses_level,
             modality_folder,
             f"sub-{sub_label}*_{file_tag}.{file_type}",
-        )
+        ]
     else:
-        files = os.path.join(main_path, f"*{file_tag}.{file_type}")
+        pattern = [f"*{file_tag}.{file_type}"]
 
-    files = glob.glob(files)
-    files.sort()
+    matches = _match_bids_index(index, main_path, pattern)
+    matches.sort(key=lambda x: x[0])
 
     filters = filters or []
     if filters:
-        files = [parse_bids_filename(file_) for file_ in files]
-        for key, value in filters:
-            files = [
-                file_
-                for file_ in files
-                if (key in file_ and file_[key] == value)
-            ]
-        return [ref_file["file_path"] for ref_file in files]
-
-    return files
+        files = []
+        for file_, entities in matches:
+            if entities is None:
+                # same error as parse_bids_filename would raise
+                entities = parse_bids_filename(file_)
+            if all(
+                key in entities and entities[key] == value
+                for key, value in filters
+            ):
+                files.append(file_)
+        return files
+
+    return [file_ for file_, _ in matches]
+
+
+def _bids_index_file(main_path, cache_dir):
+    """Return the path of the on-disk index of a dataset."""
+    key = hashlib.md5(os.path.abspath(main_path).encode()).hexdigest()
+    return Path(cache_dir) / "nilearn_bids_index" / f"{key}.json"
+
+
+def _get_bids_index(main_path, cache_dir=None):
+    """Return the in-memory index of a :term:`BIDS` dataset.
+
+    The index maps each directory of the dataset visited so far,
+    relative to ``main_path``, to its modification time,
+    its sub-directories and its files
+    along with the entities parsed from their names.
+    Each directory is listed only once and listed again
+    only when its modification time changes.
+    The indexes of the last few datasets are kept in memory.
+
+    Parameters
+    ----------
+    main_path : :obj:`str` or :obj:`pathlib.Path`
+        Directory of the :term:`BIDS` dataset.
+
+    cache_dir : :obj:`str` or :obj:`pathlib.Path`, optional
+        Directory where the index may have been saved
+        by :func:`_save_bids_index`.
+        It is loaded if the dataset is not indexed in memory yet.
+
+    Returns
+    -------
+    index : :obj:`dict`
+
+    """
+    key = os.path.abspath(main_path)
+    if key in _BIDS_INDEXES:
+        _BIDS_INDEXES.move_to_end(key)
+        return _BIDS_INDEXES[key]
+    index = {}
+    if cache_dir is not None:
+        index_file = _bids_index_file(main_path, cache_dir)
+        if index_file.exists():
+            with open(index_file) as f:
+                index = json.load(f)
+    _BIDS_INDEXES[key] = index
+    while len(_BIDS_INDEXES) > _BIDS_INDEXES_SIZE:
+        _BIDS_INDEXES.popitem(last=False)
+    return index
+
+
+def _save_bids_index(main_path, cache_dir):
+    """Save the in-memory index of a :term:`BIDS` dataset to disk.
+
+    The saved index is loaded back by :func:`_get_bids_index`
+    when given the same ``cache_dir``,
+    and each directory is listed again only if it changed since.
+    """
+    index_file = _bids_index_file(main_path, cache_dir)
+    index_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(index_file, "w") as f:
+        json.dump(_get_bids_index(main_path), f)
+
+
+def _list_bids_dir(index, main_path, rel_dir):
+    """List a directory of the dataset, using the index if up to date.
+
+    Returns None if the directory does not exist.
+    """
+    path = os.path.join(main_path, rel_dir)
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        index.pop(rel_dir, None)
+        return None
+    listing = index.get(rel_dir)
+    if listing is not None and listing["mtime"] == mtime:
+        return listing
+
+    dirs, files = [], {}
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                dirs.append(entry.name)
+                continue
+            try:
+                entities = parse_bids_filename(entry.name)
+                del entities["file_path"]
+            except ValueError:
+                entities = None
+            files[entry.name] = entities
+    listing = {"mtime": mtime, "dirs": sorted(dirs), "files": files}
+    index[rel_dir] = listing
+    return listing
+
+
+def _match_name(name, pattern):
+    """Match a file name against a pattern with the rules of glob."""
+    # glob wildcards do not match hidden files
+    if name.startswith(".") and not pattern.startswith("."):
+        return False
+    return fnmatch.fnmatch(name, pattern)
+
+
+def _match_bids_index(index, main_path, pattern):
+    """Find the paths of a dataset matching a pattern.
+
+    This is equivalent to ``glob.glob(os.path.join(main_path, *pattern))``
+    but answered from the index.
+
+    Parameters
+    ----------
+    index : :obj:`dict`
+        Index returned by :func:`_get_bids_index`.
+
+    main_path : :obj:`str` or :obj:`pathlib.Path`
+        Directory of the :term:`BIDS` dataset.
+
+    pattern : :obj:`list` of :obj:`str`
+        Glob patterns of each level of the path.
+        Empty strings are ignored.
+
+    Returns
+    -------
+    matches : :obj:`list` of :obj:`tuple` (:obj:`str`, :obj:`dict` or None)
+        Path of each match and, for files,
+        the entities parsed from their name.
+
+    """
+    pattern = [level for level in pattern if level]
+    rel_dirs = [""]
+    for level in pattern[:-1]:
+        matched_dirs = []
+        for rel_dir in rel_dirs:
+            listing = _list_bids_dir(index, main_path, rel_dir)
+            if listing is None:
+                continue
+            matched_dirs.extend(
+                os.path.join(rel_dir, name)
+                for name in listing["dirs"]
+                if _match_name(name, level)
+            )
+        rel_dirs = matched_dirs
+
+    matches = []
+    for rel_dir in rel_dirs:
+        listing = _list_bids_dir(index, main_path, rel_dir)
+        if listing is None:
+            continue
+        for name in listing["dirs"]:
+            if _match_name(name, pattern[-1]):
+                matches.append((os.path.join(main_path, rel_dir, name), None))
+        for name, entities in listing["files"].items():
+            if _match_name(name, pattern[-1]):
+                file_path = os.path.join(main_path, rel_dir, name)
+                if entities is not None:
+                    entities = {"file_path": file_path, **entities}
+                matches.append((file_path, entities))
+    return matches
 
 
 def parse_bids_filename(img_path):
@@ -7,6 +7,9 @@ Michael W. Weiss, Steven Meisler, Thibault Piront.
 import warnings
 
 import pandas as pd
+from joblib import Parallel, delayed
+
+from nilearn._utils.cache_mixin import _check_memory
 
 from . import load_confounds_components as components
 from .load_confounds_utils import (
@@ -105,6 +108,8 @@ def load_confounds(
     n_compcor="all",
     ica_aroma="full",
     demean=True,
+    n_jobs=1,
+    memory=None,
 ):
     """
     Use confounds from :term:`fMRIPrep`.
@@ -264,6 +269,25 @@ def load_confounds(
         When `sample_mask` is not None, the mean is calculated on retained
         volumes.
 
+    n_jobs : :obj:`int`, default=1
+        The number of image files to process in parallel.
+        -1 means 'all CPUs'.
+
+        .. versionadded:: 0.11.0
+
+    memory : None, instance of :class:`joblib.Memory`, :obj:`str`, or \
+             :class:`pathlib.Path`, default=None
+        Used to cache the content of the confounds tsv and json files,
+        keyed by the hash of each file.
+        All the columns of the tsv files are cached,
+        so that loading the same files with another strategy
+        does not parse them again.
+        By default, no caching is done and only the columns
+        required by the strategy are read.
+        If a :obj:`str` is given, it is the path to the caching directory.
+
+        .. versionadded:: 0.11.0
+
     Returns
     -------
     confounds : :class:`pandas.DataFrame`, or :obj:`list` of \
@@ -329,15 +353,15 @@ def load_confounds(
             message=std_dvars_threshold_default,
             stacklevel=2,
         )
+    memory = _check_memory(memory)
     # load confounds per image provided
     img_files, flag_single = sanitize_confounds(img_files)
-    confounds_out = []
-    sample_mask_out = []
-    for file in img_files:
-        sample_mask, conf = _load_confounds_for_single_image_file(
+    outputs = Parallel(n_jobs=n_jobs)(
+        delayed(_load_confounds_for_single_image_file)(
             file,
             strategy,
             demean,
+            memory=memory,
             motion=motion,
             scrub=scrub,
             fd_threshold=fd_threshold,
@@ -348,8 +372,10 @@ def load_confounds(
             n_compcor=n_compcor,
             ica_aroma=ica_aroma,
         )
-        confounds_out.append(conf)
-        sample_mask_out.append(sample_mask)
+        for file in img_files
+    )
+    sample_mask_out = [sample_mask for sample_mask, _ in outputs]
+    confounds_out = [conf for _, conf in outputs]
 
     # If a single input was provided,
     # send back a single output instead of a list
@@ -360,7 +386,7 @@ def load_confounds(
 
 
 def _load_confounds_for_single_image_file(
-    image_file, strategy, demean, **kwargs
+    image_file, strategy, demean, memory=None, **kwargs
 ):
     """Load confounds for a single image file.
 
@@ -375,6 +401,9 @@ def _load_confounds_for_single_image_file(
     demean : :obj:`bool`, default=True
         See :func:`nilearn.interfaces.fmriprep.load_confounds` for details.
 
+    memory : instance of :class:`joblib.Memory`, optional
+        See :func:`nilearn.interfaces.fmriprep.load_confounds` for details.
+
     kwargs : :obj:`dict`
         Extra relevant parameters for the given `strategy`.
         See :func:`nilearn.interfaces.fmriprep.load_confounds` for details.
@@ -404,12 +433,18 @@ def _load_confounds_for_single_image_file(
         strategy=strategy,
         demean=demean,
         confounds_json_file=confounds_json_file,
+        memory=memory,
         **kwargs,
     )
 
 
 def _load_single_confounds_file(
-    confounds_file, strategy, demean=True, confounds_json_file=None, **kwargs
+    confounds_file,
+    strategy,
+    demean=True,
+    confounds_json_file=None,
+    memory=None,
+    **kwargs,
 ):
     """Load and extract specified confounds from the confounds file.
 
@@ -427,6 +462,9 @@ def _load_single_confounds_file(
     confounds_json_file : :obj:`str`, default=None
         Path to confounds json file.
 
+    memory : instance of :class:`joblib.Memory`, optional
+        See :func:`nilearn.interfaces.fmriprep.load_confounds` for details.
+
     kwargs : :obj:`dict`
         Extra relevant parameters for the given `strategy`.
         See :func:`nilearn.interfaces.fmriprep.load_confounds` for details.
@@ -445,15 +483,23 @@ def _load_single_confounds_file(
     flag_acompcor = ("compcor" in strategy) and (
         "anat" in kwargs.get("compcor")
     )
-    # Convert tsv file to pandas dataframe
-    confounds_all = load_confounds_file_as_dataframe(confounds_file)
-
     if confounds_json_file is None:
         confounds_json_file = get_json(confounds_file)
 
     # Read the associated json file
     meta_json = load_confounds_json(
-        confounds_json_file, flag_acompcor=flag_acompcor
+        confounds_json_file, flag_acompcor=flag_acompcor, memory=memory
+    )
+
+    # Convert tsv file to pandas dataframe,
+    # only loading the columns required by the strategy
+    def select_columns(confounds_header):
+        return _find_required_columns(
+            confounds_header, strategy, meta_json=meta_json, **kwargs
+        )
+
+    confounds_all = load_confounds_file_as_dataframe(
+        confounds_file, select_columns=select_columns, memory=memory
     )
 
     missing = {"confounds": [], "keywords": []}
@@ -477,6 +523,46 @@ def _load_single_confounds_file(
     return prepare_output(confounds_select, demean)
 
 
+def _find_required_columns(confounds_header, strategy, **kwargs):
+    """Find the columns of the confounds file used by a strategy.
+
+    Each noise component is loaded from the header of the confounds file
+    to know which columns it selects.
+    If some confounds are missing, all the columns are required,
+    so that the missing confounds are reported as when loading the full file.
+
+    Parameters
+    ----------
+    confounds_header : :class:`pandas.DataFrame`
+        The confounds file with no rows.
+
+    strategy : :obj:`tuple` or :obj:`list` of :obj:`str`.
+        See :func:`nilearn.interfaces.fmriprep.load_confounds` for details.
+
+    kwargs : :obj:`dict`
+        Extra relevant parameters for the given `strategy`.
+        See :func:`nilearn.interfaces.fmriprep.load_confounds` for details.
+
+    Returns
+    -------
+    columns : :obj:`list` of :obj:`str`
+        The required columns, in the order of the confounds file.
+    """
+    required = set()
+    if "scrub" in strategy:
+        # used to detect outliers but not returned
+        required.update(["framewise_displacement", "std_dvars"])
+    missing = {"confounds": [], "keywords": []}
+    for component in ["non_steady_state", *strategy]:
+        loaded_confounds, missing = _load_noise_component(
+            confounds_header, component, missing, **kwargs
+        )
+        required.update(loaded_confounds.columns)
+    if missing["confounds"] or missing["keywords"]:
+        return list(confounds_header.columns)
+    return [col for col in confounds_header.columns if col in required]
+
+
 def _load_noise_component(confounds_raw, component, missing, **kargs):
     """Load confound of a single noise component.
 
@@ -119,6 +119,9 @@ def load_confounds_strategy(img_files, denoise_strategy="simple", **kwargs):
         See additional parameters associated with `denoise_strategy` in
         Notes and refer to the documentation of
         :func:`nilearn.interfaces.fmriprep.load_confounds`.
+        The parameters `n_jobs` and `memory` of
+        :func:`nilearn.interfaces.fmriprep.load_confounds`
+        are accepted for all strategies.
 
     Returns
     -------
@@ -213,6 +216,11 @@ def load_confounds_strategy(img_files, denoise_strategy="simple", **kwargs):
     if "ica_aroma" in default_parameters:
         check_parameters.remove("ica_aroma")
 
+    # parameters applicable to all strategies
+    loading_parameters = {
+        key: kwargs.pop(key) for key in ["n_jobs", "memory"] if key in kwargs
+    }
+
     user_parameters, not_needed = _update_user_inputs(
         kwargs, default_parameters, check_parameters
     )
@@ -224,7 +232,7 @@ def load_confounds_strategy(img_files, denoise_strategy="simple", **kwargs):
             f"selected strategy '{denoise_strategy}': {not_needed}; "
             f"parameters accepted: {check_parameters}"
         )
-    return load_confounds(img_files, **user_parameters)
+    return load_confounds(img_files, **user_parameters, **loading_parameters)
 
 
 def _update_user_inputs(kwargs, default_parameters, check_parameters):
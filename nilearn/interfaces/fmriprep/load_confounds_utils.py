@@ -1,5 +1,6 @@
 """Helper functions for the manipulation of fmriprep output confounds."""
 
+import hashlib
 import itertools
 import json
 import os
@@ -9,6 +10,7 @@ import numpy as np
 import pandas as pd
 from sklearn.preprocessing import scale
 
+from nilearn._utils.cache_mixin import cache
 from nilearn._utils.fmriprep_confounds import flag_single_gifti, is_camel_case
 from nilearn.interfaces.bids import parse_bids_filename
 
@@ -275,7 +277,42 @@ def get_json(confounds_raw_path):
     return confounds_raw_path.replace("tsv", "json")
 
 
-def load_confounds_json(confounds_json, flag_acompcor):
+def _caching_enabled(memory):
+    """Check if a joblib.Memory object caches to disk."""
+    return memory is not None and memory.location is not None
+
+
+def _get_file_hash(file_path):
+    """Return the md5 hash of the content of a file."""
+    md5 = hashlib.md5()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            md5.update(chunk)
+    return md5.hexdigest()
+
+
+def _read_json(json_file, file_hash=None):
+    """Read a json file.
+
+    ``file_hash`` is not used but makes the cached results
+    of this function depend on the content of the file.
+    """
+    with open(json_file, "rb") as f:
+        return json.load(f)
+
+
+def _read_tsv(tsv_file, file_hash=None, usecols=None):
+    """Read a tsv file as a pandas.DataFrame.
+
+    ``file_hash`` is not used but makes the cached results
+    of this function depend on the content of the file.
+    """
+    return pd.read_csv(
+        tsv_file, delimiter="\t", encoding="utf-8", usecols=usecols
+    )
+
+
+def load_confounds_json(confounds_json, flag_acompcor, memory=None):
     """Load json data companion to the confounds tsv file.
 
     Parameters
@@ -287,6 +324,10 @@ def load_confounds_json(confounds_json, flag_acompcor):
         True if user selected anatomical compcor for denoising strategy,
         False otherwise.
 
+    memory : instance of joblib.Memory, optional
+        Used to cache the content of the json file,
+        keyed by the hash of the file.
+
     Returns
     -------
     confounds_json : dict
@@ -299,8 +340,12 @@ def load_confounds_json(confounds_json, flag_acompcor):
         fMRIprep >= 1.4.0.
     """
     try:
-        with open(confounds_json, "rb") as f:
-            confounds_json = json.load(f)
+        if _caching_enabled(memory):
+            confounds_json = cache(_read_json, memory)(
+                confounds_json, file_hash=_get_file_hash(confounds_json)
+            )
+        else:
+            confounds_json = _read_json(confounds_json)
     except OSError:
         if flag_acompcor:
             raise ValueError(
@@ -312,7 +357,9 @@ def load_confounds_json(confounds_json, flag_acompcor):
     return confounds_json
 
 
-def load_confounds_file_as_dataframe(confounds_raw_path):
+def load_confounds_file_as_dataframe(
+    confounds_raw_path, select_columns=None, memory=None
+):
     """Load raw confounds as a pandas DataFrame.
 
     Meanwhile detect if the fMRIPrep version is supported.
@@ -322,28 +369,50 @@ def load_confounds_file_as_dataframe(confounds_raw_path):
     confounds_raw_path : str
         Path to the confounds file.
 
+    select_columns : callable, optional
+        Function called with the header of the confounds file,
+        as a pandas.DataFrame with no rows,
+        and returning the list of columns to load.
+        If None, all columns are loaded.
+
+    memory : instance of joblib.Memory, optional
+        Used to cache the content of the confounds file,
+        keyed by the hash of the file.
+        All the columns are then cached, so that any selection of columns
+        is loaded from the cache.
+
     Returns
     -------
     confounds_raw : pandas.DataFrame
         Raw confounds loaded from the confounds file.
     """
-    confounds_raw = pd.read_csv(
-        confounds_raw_path, delimiter="\t", encoding="utf-8"
-    )
+    if _caching_enabled(memory):
+        confounds_raw = cache(_read_tsv, memory)(
+            confounds_raw_path, file_hash=_get_file_hash(confounds_raw_path)
+        )
+        header = confounds_raw.iloc[:0]
+    elif select_columns is None:
+        confounds_raw = _read_tsv(confounds_raw_path)
+        header = confounds_raw.iloc[:0]
+    else:
+        confounds_raw = None
+        header = pd.read_csv(
+            confounds_raw_path, delimiter="\t", encoding="utf-8", nrows=0
+        )
 
     # check if the version of fMRIprep (>=1.2.0) is supported based on
     # header format. 1.0.x and 1.1.x series uses camel case
-    if any(is_camel_case(col_name) for col_name in confounds_raw.columns):
+    if any(is_camel_case(col_name) for col_name in header.columns):
         raise ValueError(
             "The confound file contains header in camel case. "
             "This is likely the output from 1.0.x and 1.1.x series. "
             "We only support fmriprep outputs >= 1.2.0."
-            f"{confounds_raw.columns}"
+            f"{header.columns}"
         )
 
     # even old version with no header will have the first row as header
     try:
-        too_old = float(confounds_raw.columns[0])
+        too_old = float(header.columns[0])
     except ValueError:
         too_old = False
 
@@ -356,7 +425,14 @@ def load_confounds_file_as_dataframe(confounds_raw_path):
             "Is this an old version fMRIprep output?"
             f"{bad_file.head()}"
         )
-    return confounds_raw
+
+    if select_columns is None:
+        return confounds_raw
+    columns = select_columns(header)
+    if confounds_raw is not None:
+        return confounds_raw[columns]
+    # Only parse the selected columns
+    return _read_tsv(confounds_raw_path, usecols=columns)
 
 
 def _ext_validator(image_file, ext):
@@ -724,6 +724,45 @@ def test_inputs(tmp_path, image_type):
     assert len(conf) == 2
 
 
+@pytest.mark.parametrize(
+    "strategy",
+    [
+        ("motion", "high_pass", "wm_csf"),
+        ("high_pass", "motion", "compcor", "scrub"),
+    ],
+)
+def test_load_confounds_parallel_and_cached(tmp_path, strategy):
+    """Check that loading confounds in parallel and through the cache \
+    gives the same confounds as the default loading."""
+    files = []
+    for i in range(3):
+        nii, _ = create_tmp_filepath(
+            tmp_path,
+            bids_fields={"entities": {"sub": f"test{i + 1}"}},
+            copy_confounds=True,
+            copy_json=True,
+        )
+        files.append(nii)
+    kwargs = {"strategy": strategy, "compcor": "temporal"}
+
+    expected, expected_mask = load_confounds(files, **kwargs)
+
+    cache_dir = tmp_path / "cache"
+    for _ in range(2):  # write then read the cache
+        confounds, sample_mask = load_confounds(
+            files, n_jobs=2, memory=cache_dir, **kwargs
+        )
+        for conf, mask, exp_conf, exp_mask in zip(
+            confounds, sample_mask, expected, expected_mask
+        ):
+            pd.testing.assert_frame_equal(conf, exp_conf)
+            if exp_mask is None:
+                assert mask is None
+            else:
+                np.testing.assert_array_equal(mask, exp_mask)
+    assert any(cache_dir.iterdir())
+
+
 def test_load_confounds_for_gifti(tmp_path):
     """Ensure that confounds are found for gifti files.
 
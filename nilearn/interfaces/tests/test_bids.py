@@ -7,6 +7,7 @@ import numpy as np
 import pandas as pd
 import pytest
 
+from nilearn._utils.cache_mixin import clear_in_memory_caches
 from nilearn._utils.data_gen import (
     add_metadata_to_bids_dataset,
     create_fake_bids_dataset,
@@ -20,7 +21,11 @@ from nilearn.interfaces.bids import (
     save_glm_to_bids,
 )
 from nilearn.interfaces.bids.query import (
+    _BIDS_INDEXES,
+    _BIDS_INDEXES_SIZE,
+    _get_bids_index,
     _get_metadata_from_bids,
+    _save_bids_index,
     infer_repetition_time_from_dataset,
     infer_slice_timing_start_time_from_dataset,
 )
@@ -288,6 +293,63 @@ def test_get_bids_files(tmp_path):
     assert len(selection) == 160
 
 
+def test_get_bids_files_index_updated(tmp_path):
+    """Check that files added after indexing a dataset are found."""
+    bids_path = create_fake_bids_dataset(
+        base_dir=tmp_path, n_sub=2, n_ses=1, tasks=["main"], n_runs=[1]
+    )
+    selection = get_bids_files(bids_path, file_tag="bold", file_type="json")
+    assert len(selection) == 2
+    assert str(bids_path.absolute()) in _BIDS_INDEXES
+
+    new_file = add_metadata_to_bids_dataset(
+        bids_path=bids_path,
+        metadata={"RepetitionTime": 1.5},
+        json_file="sub-01/ses-01/func/sub-01_ses-01_task-new_bold.json",
+    )
+    selection = get_bids_files(bids_path, file_tag="bold", file_type="json")
+    assert len(selection) == 3
+    assert str(new_file) in selection
+
+    new_file.unlink()
+    selection = get_bids_files(bids_path, file_tag="bold", file_type="json")
+    assert len(selection) == 2
+
+
+def test_bids_index_saved_to_disk(tmp_path):
+    bids_path = create_fake_bids_dataset(
+        base_dir=tmp_path, n_sub=2, n_ses=1, tasks=["main"], n_runs=[1]
+    )
+    cache_dir = tmp_path / "cache"
+    expected = get_bids_files(bids_path, filters=[("task", "main")])
+    _save_bids_index(bids_path, cache_dir)
+    assert len(list((cache_dir / "nilearn_bids_index").glob("*.json"))) == 1
+
+    # load the index saved on disk in a fresh process
+    saved_index = _BIDS_INDEXES.pop(str(bids_path.absolute()))
+    assert _get_bids_index(bids_path, cache_dir=cache_dir) == saved_index
+    assert get_bids_files(bids_path, filters=[("task", "main")]) == expected
+
+
+def test_bids_indexes_bounded(tmp_path):
+    """Check that only the indexes of the last datasets are kept."""
+    paths = [tmp_path / str(i) for i in range(_BIDS_INDEXES_SIZE + 2)]
+    for path in paths:
+        path.mkdir()
+        get_bids_files(path)
+    assert len(_BIDS_INDEXES) == _BIDS_INDEXES_SIZE
+    assert str(paths[0].absolute()) not in _BIDS_INDEXES
+
+    # the index used most recently is kept
+    get_bids_files(paths[2])
+    get_bids_files(paths[0])
+    assert str(paths[2].absolute()) in _BIDS_INDEXES
+    assert str(paths[3].absolute()) not in _BIDS_INDEXES
+
+    clear_in_memory_caches()
+    assert len(_BIDS_INDEXES) == 0
+
+
 def test_parse_bids_filename():
     fields = ["sub", "ses", "task", "lolo"]
     labels = ["01", "01", "langloc", "lala"]
@@ -1,24 +1,34 @@
 """Utilities to compute and operate on brain masks."""
 
 # Authors: Gael Varoquaux, Alexandre Abraham, Philippe Gervais, Ana Luisa Pinho
+import itertools
 import numbers
 import warnings
+from pathlib import Path
 
+import nibabel
 import numpy as np
-from joblib import Parallel, delayed
+from joblib import Parallel, delayed, effective_n_jobs
 from scipy.ndimage import binary_dilation, binary_erosion
 
 from . import _utils
 from ._utils import fill_doc
 from ._utils.cache_mixin import cache
 from ._utils.ndimage import get_border_data, largest_connected_component
-from ._utils.niimg import safe_get_data
+from ._utils.niimg import _iter_volume_chunks, safe_get_data
 from .datasets import (
     load_mni152_gm_template,
     load_mni152_template,
     load_mni152_wm_template,
 )
 from .image import get_data, new_img_like, resampling
+from .image.image import _downcast_from_int64_if_possible
+
+# Maximum size in bytes of the chunks of 4D images masked at once
+_CHUNK_NBYTES = 2**27
+
+# Offset of the data in the NIfTI files written by unmask
+_NIFTI_DATA_OFFSET = 352
 
 __all__ = [
     "apply_mask",
@@ -159,40 +169,85 @@ def intersect_masks(mask_imgs, threshold=0.5, connected=True):
     """
     if len(mask_imgs) == 0:
         raise ValueError("No mask provided for intersection")
-    grp_mask = None
-    first_mask, ref_affine = load_mask_img(mask_imgs[0], allow_empty=True)
-    ref_shape = first_mask.shape
+    _check_intersection_threshold(threshold)
+    mask_count = _MaskCount()
+    for this_mask in mask_imgs:
+        mask_count.add(this_mask)
+    return mask_count.intersection(threshold, connected)
+
+
+def _check_intersection_threshold(threshold):
     if threshold > 1:
         raise ValueError("The threshold should be smaller than 1")
     if threshold < 0:
         raise ValueError("The threshold should be greater than 0")
-    threshold = min(threshold, 1 - 1.0e-7)
 
-    for this_mask in mask_imgs:
-        mask, affine = load_mask_img(this_mask, allow_empty=True)
-        if np.any(affine != ref_affine):
-            raise ValueError("All masks should have the same affine")
-        if np.any(mask.shape != ref_shape):
-            raise ValueError("All masks should have the same shape")
 
-        if grp_mask is None:
+class _MaskCount:
+    """Count, for each voxel, the masks that contain it.
+
+    Masks are added one at a time, so that only the integer count image
+    is kept in memory, and :meth:`intersection` thresholds the count as
+    :func:`intersect_masks`.
+    """
+
+    def __init__(self):
+        self.count = None
+        self.n_masks = 0
+
+    def add(self, mask_img):
+        mask, affine = load_mask_img(mask_img, allow_empty=True)
+        if self.count is None:
+            self.ref_img = _utils.check_niimg_3d(mask_img)
+            self.ref_affine = affine
             # We use int here because there may be a lot of masks to merge
-            grp_mask = _utils.as_ndarray(mask, dtype=int)
+            self.count = _utils.as_ndarray(mask, dtype=int)
         else:
-            # If this_mask is floating point and grp_mask is integer, numpy 2
+            if np.any(affine != self.ref_affine):
+                raise ValueError("All masks should have the same affine")
+            if np.any(mask.shape != self.count.shape):
+                raise ValueError("All masks should have the same shape")
+            # If mask is floating point and count is integer, numpy 2
             # casting rules raise an error for in-place addition. Hence we do
             # it long-hand.
             # XXX should the masks be coerced to int before addition?
-            grp_mask += mask
+            self.count += mask
+        self.n_masks += 1
 
-    grp_mask = grp_mask > (threshold * len(list(mask_imgs)))
+    def intersection(self, threshold, connected):
+        threshold = min(threshold, 1 - 1.0e-7)
+        grp_mask = self.count > (threshold * self.n_masks)
 
-    if np.any(grp_mask > 0) and connected:
-        grp_mask = largest_connected_component(grp_mask)
-    grp_mask = _utils.as_ndarray(grp_mask, dtype=np.int8)
-    return new_img_like(
-        _utils.check_niimg_3d(mask_imgs[0]), grp_mask, ref_affine
-    )
+        if np.any(grp_mask > 0) and connected:
+            grp_mask = largest_connected_component(grp_mask)
+        grp_mask = _utils.as_ndarray(grp_mask, dtype=np.int8)
+        return new_img_like(self.ref_img, grp_mask, self.ref_affine)
+
+
+def _compute_multi_mask(
+    compute_mask, imgs, threshold, connected, n_jobs, verbose, **kwargs
+):
+    """Compute the mask of each image with ``compute_mask`` and the \
+    intersection of these masks.
+
+    The masks are computed in parallel a batch of ``n_jobs`` images at a
+    time and added to the count of a :class:`_MaskCount`, so that the
+    masks of all the images are never held in memory at once.
+    """
+    _check_intersection_threshold(threshold)
+    batch_size = effective_n_jobs(n_jobs)
+    imgs = iter(imgs)
+    mask_count = _MaskCount()
+    while True:
+        batch = list(itertools.islice(imgs, batch_size))
+        if not batch:
+            break
+        for mask in Parallel(n_jobs=n_jobs, verbose=verbose)(
+            delayed(compute_mask)(img, connected=connected, **kwargs)
+            for img in batch
+        ):
+            mask_count.add(mask)
+    return mask_count.intersection(threshold, connected)
 
 
 def _post_process_mask(
@@ -295,14 +350,18 @@ def compute_epi_mask(
         print("EPI mask computation")
 
     # Delayed import to avoid circular imports
-    from .image.image import _compute_mean
+    from .image.image import _compute_mean, _smooth_mean
 
+    # The mean image is cached before smoothing, to be shared with the
+    # other masking strategies
     mean_epi, affine = cache(_compute_mean, memory)(
         epi_img,
         target_affine=target_affine,
         target_shape=target_shape,
-        smooth=(1 if opening else False),
+        smooth=False,
     )
+    if opening:
+        mean_epi = _smooth_mean(_utils.as_ndarray(mean_epi, copy=True), 1)
 
     if ensure_finite:
         # Get rid of memmapping
@@ -413,24 +472,22 @@ def compute_multi_epi_mask(
             f"An empty object - {epi_imgs:r} - was passed instead of an "
             "image or a list of images"
         )
-    masks = Parallel(n_jobs=n_jobs, verbose=verbose)(
-        delayed(compute_epi_mask)(
-            epi_img,
-            lower_cutoff=lower_cutoff,
-            upper_cutoff=upper_cutoff,
-            connected=connected,
-            opening=opening,
-            exclude_zeros=exclude_zeros,
-            target_affine=target_affine,
-            target_shape=target_shape,
-            memory=memory,
-        )
-        for epi_img in epi_imgs
+    return _compute_multi_mask(
+        compute_epi_mask,
+        epi_imgs,
+        threshold,
+        connected,
+        n_jobs,
+        verbose,
+        lower_cutoff=lower_cutoff,
+        upper_cutoff=upper_cutoff,
+        opening=opening,
+        exclude_zeros=exclude_zeros,
+        target_affine=target_affine,
+        target_shape=target_shape,
+        memory=memory,
     )
 
-    mask = intersect_masks(masks, connected=connected, threshold=threshold)
-    return mask
-
 
 @_utils.fill_doc
 def compute_background_mask(
@@ -483,11 +540,11 @@ def compute_background_mask(
     if verbose > 0:
         print("Background mask computation")
 
-    data_imgs = _utils.check_niimg(data_imgs)
-
     # Delayed import to avoid circular imports
     from .image.image import _compute_mean
 
+    # The images are given as is to the cached function, to share the mean
+    # image with the other masking strategies
     data, affine = cache(_compute_mean, memory)(
         data_imgs,
         target_affine=target_affine,
@@ -577,22 +634,20 @@ def compute_multi_background_mask(
             f"An empty object - {data_imgs:r} - was passed instead of an "
             "image or a list of images"
         )
-    masks = Parallel(n_jobs=n_jobs, verbose=verbose)(
-        delayed(compute_background_mask)(
-            img,
-            border_size=border_size,
-            connected=connected,
-            opening=opening,
-            target_affine=target_affine,
-            target_shape=target_shape,
-            memory=memory,
-        )
-        for img in data_imgs
+    return _compute_multi_mask(
+        compute_background_mask,
+        data_imgs,
+        threshold,
+        connected,
+        n_jobs,
+        verbose,
+        border_size=border_size,
+        opening=opening,
+        target_affine=target_affine,
+        target_shape=target_shape,
+        memory=memory,
     )
 
-    mask = intersect_masks(masks, connected=connected, threshold=threshold)
-    return mask
-
 
 @_utils.fill_doc
 def compute_brain_mask(
@@ -843,6 +898,15 @@ def apply_mask_fmri(
             f"from img shape:{str(imgs_img.shape[:3])}"
         )
 
+    if len(imgs_img.shape) == 4:
+        return _apply_mask_fmri_chunks(
+            imgs_img,
+            mask_data,
+            dtype=dtype,
+            smoothing_fwhm=smoothing_fwhm,
+            ensure_finite=ensure_finite,
+        )
+
     # All the following has been optimized for C order.
     # Time that may be lost in conversion here is regained multiple times
     # afterward, especially if smoothing is applied.
@@ -867,7 +931,109 @@ def apply_mask_fmri(
     return series[mask_data].T
 
 
-def _unmask_3d(X, mask, order="C"):
+def _apply_mask_fmri_chunks(
+    imgs_img, mask_data, dtype="f", smoothing_fwhm=None, ensure_finite=True
+):
+    """Mask a 4D image a few volumes at a time.
+
+    Only :data:`_CHUNK_NBYTES` of image data are loaded and processed at
+    once, so the memory needed is mostly that of the masked series. See
+    :func:`apply_mask_fmri` for the parameters.
+    """
+    # Delayed import to avoid circular imports
+    from .image.image import smooth_array
+
+    volume_nbytes = 8 * np.prod(imgs_img.shape[:3])
+    chunk_size = int(max(1, _CHUNK_NBYTES // volume_nbytes))
+    # computed once instead of for the boolean mask of each chunk
+    indices = _mask_flat_indices(mask_data)
+    series = None
+    for start, chunk in _iter_volume_chunks(imgs_img, chunk_size):
+        if series is None:
+            if dtype == "f":
+                dtype = chunk.dtype if chunk.dtype.kind == "f" else np.float32
+            # same memory layout as masking the whole C-ordered series
+            series = np.empty(
+                (mask_data.sum(), imgs_img.shape[3]), dtype=dtype
+            )
+        # All the following has been optimized for C order.
+        chunk = _utils.as_ndarray(chunk, dtype=dtype, order="C", copy=True)
+        smooth_array(
+            chunk,
+            imgs_img.affine[:3, :3],
+            fwhm=smoothing_fwhm,
+            ensure_finite=ensure_finite,
+            copy=False,
+        )
+        series[:, start : start + chunk.shape[3]] = chunk.reshape(
+            (-1, chunk.shape[3])
+        )[indices]
+    return series.T
+
+
+def _mask_flat_indices(mask, order="C"):
+    """Return the flat indices of the voxels of a mask.
+
+    The indices are those of the voxels of ``mask`` in the array raveled
+    in ``order``, listed in the order of the masked features, i.e. the
+    C order of ``mask``, so that ``data.ravel(order)[indices]`` is
+    ``data[mask]``.
+    """
+    return np.ravel_multi_index(np.nonzero(mask), mask.shape, order=order)
+
+
+def _unmask_out(out, shape, dtype, order):
+    """Return an array of zeros in which to unmask data.
+
+    ``out`` is checked and filled with zeros if given, allocated
+    otherwise.
+    """
+    if out is None:
+        return np.zeros(shape, dtype=dtype, order=order)
+    if out.shape != shape:
+        raise ValueError(
+            f"out must be of shape {shape}; got shape: {out.shape}."
+        )
+    if not out.flags[f"{order}_CONTIGUOUS"]:
+        raise ValueError(f"out must be a {order}-contiguous array.")
+    out.fill(0)
+    return out
+
+
+def _write_unmasked(X, flat_data, indices, n_jobs=1):
+    """Write masked samples in the voxels of unmasked data.
+
+    Parameters
+    ----------
+    X : :class:`numpy.ndarray`
+        Masked data. shape: (samples, features)
+
+    flat_data : :class:`numpy.ndarray`
+        (voxels, samples) view of the unmasked data.
+
+    indices : :class:`numpy.ndarray`
+        Flat indices of the mask in ``flat_data``.
+
+    n_jobs : :obj:`int`, default=1
+        Number of threads writing the samples.
+    """
+
+    def _write_samples(samples):
+        flat_data[indices, samples] = X[samples].T
+
+    n_jobs = min(effective_n_jobs(n_jobs), X.shape[0])
+    if n_jobs <= 1:
+        _write_samples(slice(None))
+        return
+    bounds = np.linspace(0, X.shape[0], n_jobs + 1).astype(int)
+    # numpy releases the GIL while indexing
+    Parallel(n_jobs=n_jobs, prefer="threads")(
+        delayed(_write_samples)(slice(start, stop))
+        for start, stop in zip(bounds[:-1], bounds[1:])
+    )
+
+
+def _unmask_3d(X, mask, order="C", indices=None, out=None):
     """Take masked data and bring them back to 3D (space only).
 
     Parameters
@@ -878,25 +1044,31 @@ def _unmask_3d(X, mask, order="C"):
     mask : Niimg-like object
         See :ref:`extracting_data`.
         Mask. mask.ndim must be equal to 3, and dtype *must* be bool.
+
+    indices : :class:`numpy.ndarray` or None, default=None
+        Flat indices of the mask in ``order``, as returned by
+        :func:`_mask_flat_indices`. Computed if None.
+
+    out : :class:`numpy.ndarray` or None, default=None
+        Array of the shape of ``mask``, contiguous in ``order``, in which
+        to write the data. A new array is allocated if None.
     """
     if mask.dtype != bool:
         raise TypeError("mask must be a boolean array")
     if X.ndim != 1:
         raise TypeError("X must be a 1-dimensional array")
-    n_features = mask.sum()
+    n_features = mask.sum() if indices is None else len(indices)
     if X.shape[0] != n_features:
         raise TypeError(f"X must be of shape (samples, {n_features}).")
+    if indices is None:
+        indices = _mask_flat_indices(mask, order=order)
 
-    data = np.zeros(
-        (mask.shape[0], mask.shape[1], mask.shape[2]),
-        dtype=X.dtype,
-        order=order,
-    )
-    data[mask] = X
+    data = _unmask_out(out, mask.shape, X.dtype, order)
+    data.reshape(-1, order=order)[indices] = X
     return data
 
 
-def _unmask_4d(X, mask, order="C"):
+def _unmask_4d(X, mask, order="C", indices=None, out=None, n_jobs=1):
     """Take masked data and bring them back to 4D.
 
     Parameters
@@ -907,6 +1079,17 @@ def _unmask_4d(X, mask, order="C"):
     mask : :class:`numpy.ndarray`
         Mask. mask.ndim must be equal to 4, and dtype *must* be bool.
 
+    indices : :class:`numpy.ndarray` or None, default=None
+        Flat indices of the mask in ``order``, as returned by
+        :func:`_mask_flat_indices`. Computed if None.
+
+    out : :class:`numpy.ndarray` or None, default=None
+        Array of the shape of the unmasked data, contiguous in ``order``,
+        in which to write the data. A new array is allocated if None.
+
+    n_jobs : :obj:`int`, default=1
+        Number of threads writing the samples.
+
     Returns
     -------
     data : :class:`numpy.ndarray`
@@ -917,19 +1100,143 @@ def _unmask_4d(X, mask, order="C"):
         raise TypeError("mask must be a boolean array")
     if X.ndim != 2:
         raise TypeError("X must be a 2-dimensional array")
-    n_features = mask.sum()
+    n_features = mask.sum() if indices is None else len(indices)
     if X.shape[1] != n_features:
         raise TypeError(f"X must be of shape (samples, {n_features}).")
-
-    data = np.zeros(mask.shape + (X.shape[0],), dtype=X.dtype, order=order)
-    data[mask, :] = X.T
+    if indices is None:
+        indices = _mask_flat_indices(mask, order=order)
+
+    data = _unmask_out(out, mask.shape + (X.shape[0],), X.dtype, order)
+    _write_unmasked(
+        X,
+        data.reshape((-1, X.shape[0]), order=order),
+        indices,
+        n_jobs=n_jobs,
+    )
     return data
 
 
-def unmask(X, mask_img, order="F"):
+def _unmask_array(X, mask, order, indices, out=None, n_jobs=1):
+    """Unmask a 1D or 2D array, see :func:`unmask`."""
+    X = np.asanyarray(X)
+    if X.ndim == 2:
+        return _unmask_4d(
+            X, mask, order=order, indices=indices, out=out, n_jobs=n_jobs
+        )
+    elif X.ndim == 1:
+        return _unmask_3d(X, mask, order=order, indices=indices, out=out)
+    raise TypeError(
+        f"Masked data X must be 2D or 1D array; got shape: {str(X.shape)}"
+    )
+
+
+def _is_list_of_masked_data(X):
+    """Tell a list of masked data from a list of numbers."""
+    return isinstance(X, list) and not isinstance(X[0], numbers.Number)
+
+
+def _unmask_list(X, mask_img, mask, affine, order, indices, n_jobs=1):
+    """Unmask a list of masked data, possibly nested, see :func:`unmask`.
+
+    The arrays of the list, and of the lists it contains, are unmasked
+    in threads.
+    """
+    items = []
+
+    def flatten(X):
+        for x in X:
+            if _is_list_of_masked_data(x):
+                flatten(x)
+            else:
+                items.append(x)
+
+    flatten(X)
+    unmasked = Parallel(n_jobs=n_jobs, prefer="threads")(
+        delayed(_unmask_array)(x, mask, order, indices) for x in items
+    )
+    unmasked = iter(unmasked)
+
+    def nest(X):
+        return [
+            (
+                nest(x)
+                if _is_list_of_masked_data(x)
+                else new_img_like(mask_img, next(unmasked), affine)
+            )
+            for x in X
+        ]
+
+    return nest(X)
+
+
+def _unmask_to_file(X, mask, affine, filename, n_jobs=1):
+    """Write unmasked data directly in a NIfTI file.
+
+    The header is written first, then the masked data are written in
+    the file through a memory map. The voxels outside of the mask are
+    never written, so the unmasked data are never held in memory.
+
+    Returns
+    -------
+    img : :class:`nibabel.nifti1.Nifti1Image`
+        The image loaded from ``filename``.
+    """
+    filename = str(filename)
+    if not filename.endswith(".nii"):
+        raise ValueError(
+            "Unmasked data can only be written in an uncompressed NIfTI "
+            f"file with extension '.nii'; got: {filename}"
+        )
+    if X.ndim not in (1, 2):
+        raise TypeError(
+            f"Masked data X must be 2D or 1D array; got shape: {str(X.shape)}"
+        )
+    indices = _mask_flat_indices(mask, order="F")
+    if X.shape[-1] != len(indices):
+        raise TypeError(f"X must be of shape (samples, {len(indices)}).")
+
+    # same data types as images made by new_img_like
+    if X.dtype == bool:
+        X = X.view(np.uint8)
+    X = _downcast_from_int64_if_possible(X)
+    dtype = X.dtype
+    shape = mask.shape + X.shape[:-1]
+    # header of an image of the same affine made by new_img_like
+    header = nibabel.Nifti1Image(
+        np.zeros((1,) * len(shape), dtype=np.uint8), affine
+    ).header
+    header.set_data_shape(shape)
+    header.set_data_dtype(dtype)
+    header.set_data_offset(_NIFTI_DATA_OFFSET)
+    with open(filename, "wb") as file:
+        header.write_to(file)
+        # the data are zeros until written
+        file.truncate(
+            _NIFTI_DATA_OFFSET + np.dtype(dtype).itemsize * np.prod(shape)
+        )
+
+    data = np.memmap(
+        filename,
+        dtype=dtype,
+        mode="r+",
+        offset=_NIFTI_DATA_OFFSET,
+        shape=shape,
+        order="F",
+    )
+    X = np.atleast_2d(X)
+    _write_unmasked(
+        X, data.reshape((-1, X.shape[0]), order="F"), indices, n_jobs=n_jobs
+    )
+    data.flush()
+    del data
+    return nibabel.load(filename)
+
+
+def unmask(X, mask_img, order="F", out=None, n_jobs=1):
     """Take masked data and bring them back into 3D/4D.
 
-    This function can be applied to a list of masked data.
+    This function can be applied to a list of masked data, in which case
+    the mask is loaded only once.
 
     Parameters
     ----------
@@ -941,6 +1248,31 @@ def unmask(X, mask_img, order="F"):
         See :ref:`extracting_data`.
         Must be 3-dimensional.
 
+    order : {"F", "C"}, default="F"
+        Memory layout of the unmasked data.
+
+    out : :class:`numpy.ndarray`, :obj:`str`, :obj:`pathlib.Path` \
+          or None, default=None
+        Where to write the unmasked data of an array X:
+
+        - If None, a new array is allocated.
+        - If an array, for instance a :class:`numpy.memmap`, the data
+          are written in this array, which must have the shape of the
+          unmasked data and be contiguous in ``order``.
+        - If the path of a ``.nii`` file, the unmasked data are written
+          in this file without being held in memory, and the image
+          loaded from this file is returned. ``order`` is then ignored.
+
+        Not supported for a list of masked data.
+
+        .. versionadded:: 0.11.0
+
+    n_jobs : :obj:`int`, default=1
+        Number of threads unmasking the items of a list of masked data,
+        or the samples of an array.
+
+        .. versionadded:: 0.11.0
+
     Returns
     -------
     data : :class:`nibabel.nifti1.Nifti1Image`
@@ -952,27 +1284,33 @@ def unmask(X, mask_img, order="F"):
         - X.ndim == 1:
           Shape: (mask.shape[0], mask.shape[1], mask.shape[2])
     """
+    mask_img = _utils.check_niimg_3d(mask_img)
+    mask, affine = load_mask_img(mask_img)
+
     # Handle lists. This can be a list of other lists / arrays, or a list or
     # numbers. In the latter case skip.
-    if isinstance(X, list) and not isinstance(X[0], numbers.Number):
-        ret = [unmask(x, mask_img, order=order) for x in X]
-        return ret
+    if _is_list_of_masked_data(X):
+        if out is not None:
+            raise ValueError("out is not supported for a list of masked data.")
+        indices = _mask_flat_indices(mask, order=order)
+        return _unmask_list(
+            X, mask_img, mask, affine, order, indices, n_jobs=n_jobs
+        )
 
     # The code after this block assumes that X is an ndarray; ensure this
     X = np.asanyarray(X)
 
-    mask_img = _utils.check_niimg_3d(mask_img)
-    mask, affine = load_mask_img(mask_img)
-
-    if np.ndim(X) == 2:
-        unmasked = _unmask_4d(X, mask, order=order)
-    elif np.ndim(X) == 1:
-        unmasked = _unmask_3d(X, mask, order=order)
-    else:
-        raise TypeError(
-            f"Masked data X must be 2D or 1D array; got shape: {str(X.shape)}"
-        )
+    if isinstance(out, (str, Path)):
+        return _unmask_to_file(X, mask, affine, out, n_jobs=n_jobs)
 
+    unmasked = _unmask_array(
+        X,
+        mask,
+        order,
+        _mask_flat_indices(mask, order=order),
+        out=out,
+        n_jobs=n_jobs,
+    )
     return new_img_like(mask_img, unmasked, affine)
 
 
@@ -4,6 +4,8 @@ import numpy as np
 from scipy import linalg
 from scipy.ndimage import label
 
+from nilearn._utils.ndimage import cluster_measures, label_clusters
+
 
 def calculate_tfce(
     arr4d,
@@ -252,35 +254,18 @@ def calculate_cluster_measures(
         else:
             arr3d[arr3d <= threshold] = 0
 
-        labeled_arr3d, _ = label(arr3d > 0, bin_struct)
-
-        if two_sided_test:
-            # Label positive and negative clusters separately
-            n_positive_clusters = np.max(labeled_arr3d)
-            temp_labeled_arr3d, _ = label(
-                arr3d < 0,
-                bin_struct,
-            )
-            temp_labeled_arr3d[temp_labeled_arr3d > 0] += n_positive_clusters
-            labeled_arr3d = labeled_arr3d + temp_labeled_arr3d
-            del temp_labeled_arr3d
-
-        clust_vals, clust_sizes = np.unique(labeled_arr3d, return_counts=True)
-        assert clust_vals[0] == 0
-
-        clust_vals = clust_vals[1:]  # First cluster is zeros in matrix
-        clust_sizes = clust_sizes[1:]
+        labeled_arr3d, n_clusters = label_clusters(
+            arr3d, two_sided=two_sided_test, connectivity=bin_struct
+        )
+        clust_sizes, clust_masses = cluster_measures(
+            labeled_arr3d, n_clusters, arr3d, threshold
+        )
 
         # Cluster mass-based inference
-        max_mass = 0
-        for unique_val in clust_vals:
-            ss_vals = np.abs(arr3d[labeled_arr3d == unique_val]) - threshold
-            max_mass = np.maximum(max_mass, np.sum(ss_vals))
+        max_mass = np.max(clust_masses, initial=0)
 
         # Cluster size-based inference
-        max_size = 0
-        if clust_sizes.size:
-            max_size = np.max(clust_sizes)
+        max_size = np.max(clust_sizes)
 
         max_sizes[i_regressor], max_masses[i_regressor] = max_size, max_mass
 
@@ -11,10 +11,14 @@ import joblib
 import nibabel as nib
 import numpy as np
 from scipy import stats
-from scipy.ndimage import generate_binary_structure, label
 from sklearn.utils import check_random_state
 
 from nilearn import image
+from nilearn._utils.ndimage import (
+    cluster_measures,
+    cluster_structure,
+    label_clusters,
+)
 from nilearn.masking import apply_mask
 from nilearn.mass_univariate._utils import (
     calculate_cluster_measures,
@@ -237,7 +241,7 @@ def _permuted_ols_on_chunk(
         # Prepare data for cluster thresholding
         if tfce or (threshold is not None):
             arr4d = masker.inverse_transform(perm_scores.T).get_fdata()
-            bin_struct = generate_binary_structure(3, 1)
+            bin_struct = cluster_structure(connectivity=6)
 
         if tfce:
             # The TFCE map will contain positive and negative values if
@@ -796,7 +800,7 @@ def permuted_ols(
     )
 
     # Define connectivity for TFCE and/or cluster measures
-    bin_struct = generate_binary_structure(3, 1)
+    bin_struct = cluster_structure(connectivity=6)
 
     if tfce:
         scores_4d = masker.inverse_transform(
@@ -925,40 +929,21 @@ def permuted_ols(
             scores_original_data_3d = scores_original_data_4d[..., i_regressor]
 
             # Label the clusters for both cluster mass and size inference
-            labeled_arr3d, _ = label(
-                scores_original_data_3d > threshold_t,
-                bin_struct,
+            labeled_arr3d, n_clusters = label_clusters(
+                scores_original_data_3d,
+                threshold=threshold_t,
+                two_sided=two_sided_test,
+                connectivity=bin_struct,
             )
-
-            if two_sided_test:
-                # Add negative cluster labels
-                temp_labeled_arr3d, _ = label(
-                    scores_original_data_3d < -threshold_t,
-                    bin_struct,
-                )
-                n_negative_clusters = np.max(temp_labeled_arr3d)
-                labeled_arr3d[labeled_arr3d > 0] += n_negative_clusters
-                labeled_arr3d = labeled_arr3d + temp_labeled_arr3d
-                del temp_labeled_arr3d
-
-            cluster_labels, idx, cluster_dict["size_regressor"] = np.unique(
+            (
+                cluster_dict["size_regressor"],
+                cluster_dict["mass_regressor"],
+            ) = cluster_measures(
                 labeled_arr3d,
-                return_inverse=True,
-                return_counts=True,
+                n_clusters,
+                scores_original_data_3d,
+                threshold_t,
             )
-            assert cluster_labels[0] == 0  # the background
-
-            # Replace background's "cluster size" w zeros
-            cluster_dict["size_regressor"][0] = 0
-
-            # Calculate mass for each cluster
-            cluster_dict["mass_regressor"] = np.zeros(cluster_labels.shape)
-            for j_val in cluster_labels[1:]:  # skip background
-                cluster_mass = np.sum(
-                    np.fabs(scores_original_data_3d[labeled_arr3d == j_val])
-                    - threshold_t
-                )
-                cluster_dict["mass_regressor"][j_val] = cluster_mass
 
             # Calculate p-values from size/mass values and associated h0s
             for metric in ["mass", "size"]:
@@ -967,10 +952,8 @@ def permuted_ols(
                     cluster_dict[f"{metric}_h0"][i_regressor, :],
                     "larger",
                 )
-                p_map = p_vals[np.reshape(idx, labeled_arr3d.shape)]
-                metric_map = cluster_dict[f"{metric}_regressor"][
-                    np.reshape(idx, labeled_arr3d.shape)
-                ]
+                p_map = p_vals[labeled_arr3d]
+                metric_map = cluster_dict[f"{metric}_regressor"][labeled_arr3d]
 
                 # Convert 3D to image, then to 1D
                 # There is a problem if the masker performs preprocessing,
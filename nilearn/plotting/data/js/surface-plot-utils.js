@@ -1,13 +1,38 @@
+function float16ToFloat32(bits) {
+
+    let sign = bits & 0x8000 ? -1 : 1;
+    let exponent = (bits >> 10) & 0x1f;
+    let fraction = bits & 0x3ff;
+    if (exponent === 0) {
+        return sign * Math.pow(2, -14) * fraction / 1024;
+    }
+    if (exponent === 0x1f) {
+        return fraction ? NaN : sign * Infinity;
+    }
+    return sign * Math.pow(2, exponent - 15) * (1 + fraction / 1024);
+}
+
 function decodeBase64(encoded, dtype) {
 
     let getter = {
         "float32": "getFloat32",
-        "int32": "getInt32"
+        "int32": "getInt32",
+        "uint16": "getUint16",
+        "float16": "getUint16"
     }[dtype];
 
     let arrayType = {
         "float32": Float32Array,
-        "int32": Int32Array
+        "int32": Int32Array,
+        "uint16": Uint16Array,
+        "float16": Float32Array
+    }[dtype];
+
+    let bytesPerElement = {
+        "float32": 4,
+        "int32": 4,
+        "uint16": 2,
+        "float16": 2
     }[dtype];
 
     let raw = atob(encoded);
@@ -18,12 +43,14 @@ function decodeBase64(encoded, dtype) {
     }
 
     let view = new DataView(buffer);
-    let decoded = new arrayType(
-        raw.length / arrayType.BYTES_PER_ELEMENT);
+    let decoded = new arrayType(raw.length / bytesPerElement);
     for (let i = 0, off = 0; i !== decoded.length;
-        i++, off += arrayType.BYTES_PER_ELEMENT) {
+        i++, off += bytesPerElement) {
         decoded[i] = view[getter](off, true);
     }
+    if (dtype === "float16") {
+        decoded = decoded.map(float16ToFloat32);
+    }
     return decoded;
 }
 
@@ -6,6 +6,8 @@ import os
 from matplotlib import colors, patches, transforms
 from matplotlib.path import Path
 
+from .._utils.cache_mixin import _lru_cache
+
 
 def _codes_bezier(pts):
     bezier_num = len(pts)
@@ -131,6 +133,13 @@ def _get_json_and_transform(direction):
     return filename_and_transform
 
 
+@_lru_cache(maxsize=16)
+def _load_json(json_filename):
+    """Load the content of a brain schematics file, once per process."""
+    with open(json_filename) as json_file:
+        return json.loads(json_file.read())
+
+
 def _get_object_bounds(json_content, transform):
     xmin, xmax, ymin, ymax = json_content["metadata"]["bounds"]
     x0, y0 = transform.transform((xmin, ymin))
@@ -174,8 +183,7 @@ def plot_brain_schematics(ax, direction, **kwargs):
     ) == colors.colorConverter.to_rgba("k")
 
     json_filename, transform = _get_json_and_transform(direction)
-    with open(json_filename) as json_file:
-        json_content = json.loads(json_file.read())
+    json_content = _load_json(json_filename)
 
     mpl_patches = _get_mpl_patches(
         json_content,
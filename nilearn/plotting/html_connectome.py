@@ -86,6 +86,53 @@ def _prepare_line(edges, nodes):
     return path_edges, path_nodes
 
 
+def _decimate_edges(
+    rows, cols, weights, max_edges=None, max_edges_per_node=None
+):
+    """Select the strongest edges of a connectome.
+
+    Parameters
+    ----------
+    rows, cols : ndarray of int, shape=(n_edges,)
+        Source and target node indices of the edges.
+
+    weights : ndarray, shape=(n_edges,)
+        The weights of the edges. Edges are ranked by absolute weight.
+
+    max_edges : int or None, optional
+        Maximum number of edges to keep.
+
+    max_edges_per_node : int or None, optional
+        Edges are kept only if they are among the ``max_edges_per_node``
+        strongest edges of one of their nodes.
+
+    Returns
+    -------
+    keep : ndarray of bool, shape=(n_edges,)
+        Mask of the selected edges.
+    """
+    strength = np.abs(weights)
+    keep = np.ones(len(weights), dtype=bool)
+    if max_edges_per_node is not None:
+        # rank the edges of each node by decreasing strength
+        ends = np.concatenate([rows, cols])
+        edge_ids = np.tile(np.arange(len(weights)), 2)
+        order = np.lexsort((-strength[edge_ids], ends))
+        sorted_ends = ends[order]
+        ranks = np.arange(len(order)) - np.searchsorted(
+            sorted_ends, sorted_ends
+        )
+        keep = np.zeros(len(weights), dtype=bool)
+        keep[edge_ids[order[ranks < max_edges_per_node]]] = True
+    if max_edges is not None and keep.sum() > max_edges:
+        kept = np.flatnonzero(keep)
+        keep = np.zeros(len(weights), dtype=bool)
+        if max_edges > 0:
+            strongest = np.argpartition(-strength[kept], max_edges - 1)
+            keep[kept[strongest[:max_edges]]] = True
+    return keep
+
+
 def _prepare_colors_for_markers(marker_color, number_of_nodes):
     """Generate "color" and "colorscale" attributes \
     based on `marker_color` mode.
@@ -114,7 +161,14 @@ def _prepare_colors_for_markers(marker_color, number_of_nodes):
 
 
 def _prepare_lines_metadata(
-    adjacency_matrix, coords, threshold, cmap, symmetric_cmap
+    adjacency_matrix,
+    coords,
+    threshold,
+    cmap,
+    symmetric_cmap,
+    max_edges=None,
+    max_edges_per_node=None,
+    compact_edges=False,
 ):
     """Generate metadata related to lines for _connectome_view plot.
 
@@ -140,6 +194,17 @@ def _prepare_lines_metadata(
     symmetric_cmap : bool, default=True
         Make colormap symmetric (ranging from -vmax to vmax).
 
+    max_edges : int or None, optional
+        Maximum number of edges to display, the strongest ones.
+
+    max_edges_per_node : int or None, optional
+        Only display the edges which are among the ``max_edges_per_node``
+        strongest edges of one of their nodes.
+
+    compact_edges : bool, default=False
+        If True, edges are encoded as node indices and float16 weights,
+        instead of the coordinates of their ends.
+
     Returns
     -------
     coordinates : dict
@@ -161,7 +226,30 @@ def _prepare_lines_metadata(
         adjacency_matrix[
             np.abs(adjacency_matrix) <= colors["abs_threshold"]
         ] = 0
+    if (
+        compact_edges
+        or max_edges is not None
+        or max_edges_per_node is not None
+    ):
+        # self-loops have no length and must not be selected
+        # instead of connections, e.g. the unit diagonal of correlations
+        np.fill_diagonal(adjacency_matrix, 0)
+        # connectomes computed in floating point, e.g. with np.corrcoef,
+        # can be asymmetric by rounding errors
+        atol = 1e-8 * np.abs(adjacency_matrix).max(initial=0)
+        if np.allclose(adjacency_matrix, adjacency_matrix.T, atol=atol):
+            # draw each edge of a symmetric connectome once
+            adjacency_matrix = np.triu(adjacency_matrix, k=1)
     s = sparse.coo_matrix(adjacency_matrix)
+    if max_edges is not None or max_edges_per_node is not None:
+        keep = _decimate_edges(
+            s.row, s.col, s.data, max_edges, max_edges_per_node
+        )
+        s = sparse.coo_matrix(
+            (s.data[keep], (s.row[keep], s.col[keep])), shape=s.shape
+        )
+    if compact_edges:
+        return {**lines_metadata, **_encode_edges(s)}
     nodes = np.asarray([s.row, s.col], dtype=int).T
     edges = np.arange(len(nodes))
     path_edges, path_nodes = _prepare_line(edges, nodes)
@@ -179,6 +267,38 @@ def _prepare_lines_metadata(
     return lines_metadata
 
 
+def _encode_edges(edges):
+    """Encode edges as node indices and weights.
+
+    The javascript code draws the edges from the coordinates of the
+    markers, so the payload grows with the number of displayed edges only.
+    Weights are encoded in float16, unless they are too large for it.
+
+    Parameters
+    ----------
+    edges : scipy.sparse.coo_matrix, shape=(n_nodes, n_nodes)
+        The weights of the displayed edges.
+
+    Returns
+    -------
+    edges_metadata : dict
+        Dictionary containing the base64 encoded indices and weights.
+    """
+    index_dtype = "uint16" if edges.shape[0] <= 2**16 else "int32"
+    weights_dtype = "float16"
+    if np.abs(edges.data).max(initial=0) > np.finfo("float16").max:
+        weights_dtype = "float32"
+    little_endian = {"uint16": "<u2", "int32": "<i4"}
+    little_endian.update({"float16": "<f2", "float32": "<f4"})
+    return {
+        "con_index_dtype": index_dtype,
+        "con_w_dtype": weights_dtype,
+        "_con_i": encode(np.asarray(edges.row, little_endian[index_dtype])),
+        "_con_j": encode(np.asarray(edges.col, little_endian[index_dtype])),
+        "_con_w": encode(np.asarray(edges.data, little_endian[weights_dtype])),
+    }
+
+
 def _prepare_markers_metadata(coords, marker_size, marker_color, marker_only):
     markers_coordinates = _encode_coordinates(coords, prefix="_marker_")
     markers_metadata = {"markers_only": marker_only, **markers_coordinates}
@@ -204,6 +324,9 @@ def _get_connectome(
     marker_color="auto",
     cmap=cm.cold_hot,
     symmetric_cmap=True,
+    max_edges=None,
+    max_edges_per_node=None,
+    compact_edges=False,
 ):
     lines_metadata = _prepare_lines_metadata(
         adjacency_matrix,
@@ -211,6 +334,9 @@ def _get_connectome(
         threshold,
         cmap,
         symmetric_cmap,
+        max_edges=max_edges,
+        max_edges_per_node=max_edges_per_node,
+        compact_edges=compact_edges,
     )
 
     markers_metadata = _prepare_markers_metadata(
@@ -260,6 +386,9 @@ def view_connectome(
     colorbar_fontsize=25,
     title=None,
     title_fontsize=25,
+    max_edges=None,
+    max_edges_per_node=None,
+    compact_edges=False,
 ):
     """Insert a 3d plot of a connectome into an HTML page.
 
@@ -309,6 +438,28 @@ def view_connectome(
     title_fontsize : int, default=25
         Fontsize of the title.
 
+    max_edges : int or None, optional
+        If not None, only the ``max_edges`` strongest connections (in
+        absolute value) that pass the threshold are shown.
+        Each connection of a symmetric ``adjacency_matrix`` is counted once.
+
+        .. versionadded:: 0.11.0
+
+    max_edges_per_node : int or None, optional
+        If not None, a connection is only shown if it is among the
+        ``max_edges_per_node`` strongest connections of one of its nodes.
+
+        .. versionadded:: 0.11.0
+
+    compact_edges : bool, default=False
+        If True, connections are embedded in the page as pairs of node
+        indices with float16 weights rather than as the coordinates of
+        their ends, and each connection of a symmetric ``adjacency_matrix``
+        is embedded once. This makes pages showing many connections several
+        times lighter and faster to generate.
+
+        .. versionadded:: 0.11.0
+
     Returns
     -------
     ConnectomeView : plot of the connectome.
@@ -342,6 +493,9 @@ def view_connectome(
         symmetric_cmap=symmetric_cmap,
         marker_size=node_size,
         marker_color=node_color,
+        max_edges=max_edges,
+        max_edges_per_node=max_edges_per_node,
+        compact_edges=compact_edges,
     )
     connectome_info["line_width"] = linewidth
     connectome_info["colorbar"] = colorbar
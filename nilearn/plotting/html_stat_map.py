@@ -6,15 +6,18 @@ import os
 import warnings
 from base64 import b64encode
 from io import BytesIO
+from pathlib import Path
 
 import matplotlib
 import numpy as np
 from matplotlib.image import imsave
 from nibabel.affines import apply_affine
+from PIL import Image
 
 from nilearn.plotting.html_document import HTMLDocument
 
 from .._utils import fill_doc
+from .._utils.cache_mixin import _lru_cache
 from .._utils.extmath import fast_abs_percentile
 from .._utils.niimg import safe_get_data
 from .._utils.niimg_conversions import check_niimg_3d
@@ -48,17 +51,13 @@ def _data_to_sprite(data):
     nrows = int(np.ceil(np.sqrt(nx)))
     ncolumns = int(np.ceil(nx / float(nrows)))
 
-    sprite = np.zeros((nrows * nz, ncolumns * ny))
-    indrow, indcol = np.where(np.ones((nrows, ncolumns)))
-
-    for xx in range(nx):
-        # we need to flip the image in the x axis
-        sprite[
-            (indrow[xx] * nz) : ((indrow[xx] + 1) * nz),
-            (indcol[xx] * ny) : ((indcol[xx] + 1) * ny),
-        ] = data[xx, :, ::-1].transpose()
-
-    return sprite
+    # we need to flip the image in the x axis, and complete the last row
+    # with empty slices
+    slices = np.zeros((nrows * ncolumns, nz, ny), dtype=data.dtype)
+    slices[:nx] = data[:, :, ::-1].transpose(0, 2, 1)
+    # paste the (nz, ny) slices row by row
+    sprite = slices.reshape(nrows, ncolumns, nz, ny).transpose(0, 2, 1, 3)
+    return sprite.reshape(nrows * nz, ncolumns * ny)
 
 
 def _threshold_data(data, threshold=None):
@@ -156,13 +155,30 @@ def _save_sprite(
         sprite = np.ma.array(sprite, mask=mask)
 
     # Save the sprite
-    imsave(
+    _imsave(
         output_sprite, sprite, vmin=vmin, vmax=vmax, cmap=cmap, format=format
     )
 
     return sprite
 
 
+def _imsave(output, data, vmin=None, vmax=None, cmap="Greys", format="png"):
+    """Save a 2D array as a color-mapped image, like \
+    :func:`matplotlib.pyplot.imsave`.
+
+    PNG images are encoded from their uint8 colors with a lower compression
+    level than the default one, which for sprites is both faster and
+    lighter.
+    """
+    if format != "png":
+        imsave(output, data, vmin=vmin, vmax=vmax, cmap=cmap, format=format)
+        return
+    mappable = matplotlib.cm.ScalarMappable(cmap=cmap)
+    mappable.set_clim(vmin, vmax)
+    rgba = mappable.to_rgba(data, bytes=True)
+    Image.fromarray(rgba).save(output, format="png", compress_level=3)
+
+
 def _bytesIO_to_base64(handle_io):
     """Encode the content of a bytesIO virtual file as base64.
 
@@ -181,7 +197,7 @@ def _save_cm(output_cmap, cmap, format="png", n_colors=256):
     # save the colormap
     data = np.arange(0.0, n_colors) / (n_colors - 1.0)
     data = data.reshape([1, n_colors])
-    imsave(output_cmap, data, cmap=cmap, format=format)
+    _imsave(output_cmap, data, cmap=cmap, format=format)
 
 
 class StatMapView(HTMLDocument):  # noqa: D101
@@ -238,6 +254,27 @@ def _load_bg_img(stat_map_img, bg_img="MNI152", black_bg="auto", dim="auto"):
     return bg_img, bg_min, bg_max, black_bg
 
 
+@_lru_cache(maxsize=4)
+def _load_cached_bg_img(bg_img, black_bg, dim, mtime):
+    """Load a background image given by name or path, and its sprite.
+
+    The result is kept for the next calls with the same background, black_bg
+    and dim. ``mtime`` is the modification time of the file, so that the
+    background is loaded again if the file changes.
+
+    Returns: bg_img, bg_min, bg_max, black_bg, bg_base64
+
+    """
+    bg_img, bg_min, bg_max, black_bg = _load_bg_img(
+        None, bg_img, black_bg, dim
+    )
+    bg_sprite = BytesIO()
+    bg_data = safe_get_data(bg_img, ensure_finite=True).astype(float)
+    bg_mask, bg_cmap = _get_bg_mask_and_cmap(bg_img, black_bg)
+    _save_sprite(bg_data, bg_sprite, bg_max, bg_min, bg_mask, bg_cmap, "png")
+    return bg_img, bg_min, bg_max, black_bg, _bytesIO_to_base64(bg_sprite)
+
+
 def _resample_stat_map(
     stat_map_img, bg_img, mask_img, resampling_interpolation="continuous"
 ):
@@ -361,9 +398,13 @@ def _json_view_data(
     colors,
     cmap,
     colorbar,
+    bg_base64=None,
 ):
     """Create a json-like viewer object, and populate with base64 data.
 
+    The sprite of the background is made from bg_img, unless it is given
+    already encoded in bg_base64.
+
     Returns: json_view
 
     """
@@ -380,11 +421,15 @@ def _json_view_data(
     )
 
     # Create a base64 sprite for the background
-    bg_sprite = BytesIO()
-    bg_data = safe_get_data(bg_img, ensure_finite=True).astype(float)
-    bg_mask, bg_cmap = _get_bg_mask_and_cmap(bg_img, black_bg)
-    _save_sprite(bg_data, bg_sprite, bg_max, bg_min, bg_mask, bg_cmap, "png")
-    json_view["bg_base64"] = _bytesIO_to_base64(bg_sprite)
+    if bg_base64 is None:
+        bg_sprite = BytesIO()
+        bg_data = safe_get_data(bg_img, ensure_finite=True).astype(float)
+        bg_mask, bg_cmap = _get_bg_mask_and_cmap(bg_img, black_bg)
+        _save_sprite(
+            bg_data, bg_sprite, bg_max, bg_min, bg_mask, bg_cmap, "png"
+        )
+        bg_base64 = _bytesIO_to_base64(bg_sprite)
+    json_view["bg_base64"] = bg_base64
 
     # Create a base64 sprite for the stat map
     stat_map_sprite = BytesIO()
@@ -591,9 +636,17 @@ def view_img(
     )
 
     # Prepare the data for the cuts
-    bg_img, bg_min, bg_max, black_bg = _load_bg_img(
-        stat_map_img, bg_img, black_bg, dim
-    )
+    bg_base64 = None
+    if isinstance(bg_img, (str, Path)):
+        # backgrounds given by name or path, and their sprites, are cached
+        mtime = None if bg_img == "MNI152" else os.stat(bg_img).st_mtime_ns
+        bg_img, bg_min, bg_max, black_bg, bg_base64 = _load_cached_bg_img(
+            str(bg_img), black_bg, dim, mtime
+        )
+    else:
+        bg_img, bg_min, bg_max, black_bg = _load_bg_img(
+            stat_map_img, bg_img, black_bg, dim
+        )
     stat_map_img, mask_img = _resample_stat_map(
         stat_map_img, bg_img, mask_img, resampling_interpolation
     )
@@ -610,6 +663,7 @@ def view_img(
         colors,
         cmap,
         colorbar,
+        bg_base64=bg_base64,
     )
 
     json_view["params"] = _json_view_params(
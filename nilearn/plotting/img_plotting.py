@@ -34,6 +34,7 @@ from nilearn.plotting.displays._slicers import _get_cbar_ticks
 
 from .. import _utils
 from .._utils import compare_version, fill_doc
+from .._utils.cache_mixin import _register_in_memory_cache
 from .._utils.extmath import fast_abs_percentile
 from .._utils.ndimage import get_border_data
 from .._utils.niimg import safe_get_data
@@ -477,6 +478,13 @@ class _MNI152Template(SpatialImage):
             self.vmax = data.max()
             self._shape = anat_img.shape
 
+    def unload(self):
+        """Release the template data, which is loaded again when needed."""
+        self.data = None
+        self._affine = None
+        self.vmax = None
+        self._shape = None
+
     @property
     def _data_cache(self):
         self.load()
@@ -518,6 +526,7 @@ class _MNI152Template(SpatialImage):
 
 # The constant that we use as a default in functions
 MNI152TEMPLATE = _MNI152Template()
+_register_in_memory_cache(MNI152TEMPLATE.unload)
 
 
 def load_anat(anat_img=MNI152TEMPLATE, dim="auto", black_bg="auto"):
@@ -97,6 +97,131 @@ def test_get_connectome():
     assert (connectome["line_cmin"], connectome["line_cmax"]) == (-2.5, 2.5)
 
 
+def test_decimate_edges():
+    rows = np.asarray([0, 0, 0, 1, 2])
+    cols = np.asarray([1, 2, 3, 2, 3])
+    weights = np.asarray([0.1, -0.9, 0.5, 0.3, 0.2])
+
+    assert html_connectome._decimate_edges(rows, cols, weights).all()
+    np.testing.assert_array_equal(
+        html_connectome._decimate_edges(rows, cols, weights, max_edges=2),
+        [False, True, True, False, False],
+    )
+    # node 0 keeps (0, 2), node 1 (1, 2), node 2 (0, 2) and node 3 (0, 3)
+    np.testing.assert_array_equal(
+        html_connectome._decimate_edges(
+            rows, cols, weights, max_edges_per_node=1
+        ),
+        [False, True, True, True, False],
+    )
+    np.testing.assert_array_equal(
+        html_connectome._decimate_edges(
+            rows, cols, weights, max_edges=0, max_edges_per_node=1
+        ),
+        [False] * 5,
+    )
+
+
+def test_get_connectome_compact_edges():
+    adj, coord = _make_connectome()
+    connectome = html_connectome._get_connectome(
+        adj, coord, compact_edges=True
+    )
+
+    assert not {"_con_x", "_con_y", "_con_z"} & connectome.keys()
+    assert connectome["con_index_dtype"] == "uint16"
+    assert connectome["con_w_dtype"] == "float16"
+    # each edge of the symmetric matrix once, without the diagonal
+    np.testing.assert_array_equal(
+        decode(connectome["_con_i"], "<u2"), [0, 1, 2]
+    )
+    np.testing.assert_array_equal(
+        decode(connectome["_con_j"], "<u2"), [2, 3, 4]
+    )
+    np.testing.assert_allclose(
+        decode(connectome["_con_w"], "<f2"), [1.5, 0.3, 2.5], rtol=1e-3
+    )
+    assert (connectome["line_cmin"], connectome["line_cmax"]) == (-2.5, 2.5)
+
+    connectome = html_connectome._get_connectome(
+        adj, coord, compact_edges=True, max_edges=2
+    )
+    np.testing.assert_array_equal(
+        np.sort(decode(connectome["_con_w"], "<f2")), [1.5, 2.5]
+    )
+    assert (connectome["line_cmin"], connectome["line_cmax"]) == (-2.5, 2.5)
+
+    connectome = html_connectome._get_connectome(
+        adj * 1e5, coord, compact_edges=True
+    )
+    assert connectome["con_w_dtype"] == "float32"
+    np.testing.assert_allclose(
+        decode(connectome["_con_w"], "<f4")[0], adj[0, 2] * 1e5
+    )
+
+
+def test_get_connectome_max_edges():
+    adj, coord = _make_connectome()
+    connectome = html_connectome._get_connectome(adj, coord, max_edges=3)
+
+    # three segments, each made of two ends and a separator
+    assert len(decode(connectome["_con_w"], "<f4")) == 9
+
+
+def _make_correlation_connectome():
+    rng = np.random.default_rng(0)
+    signals = rng.standard_normal((5, 40))
+    # two strongly connected pairs of nodes
+    signals[1] += 3 * signals[0]
+    signals[3] += 3 * signals[2]
+    coord = np.arange(5)
+    coord = np.asarray([coord * 10, -coord, coord[::-1]]).T
+    return np.corrcoef(signals), coord
+
+
+def test_get_connectome_decimation_ignores_diagonal():
+    adj, coord = _make_correlation_connectome()
+    np.testing.assert_allclose(np.diag(adj), 1)
+
+    connectome = html_connectome._get_connectome(
+        adj, coord, max_edges=2, compact_edges=True
+    )
+
+    # the connections, each once, not the self-loops
+    edges = set(
+        zip(
+            decode(connectome["_con_i"], "<u2"),
+            decode(connectome["_con_j"], "<u2"),
+        )
+    )
+    assert edges == {(0, 1), (2, 3)}
+
+    connectome = html_connectome._get_connectome(
+        adj, coord, max_edges_per_node=1, compact_edges=True
+    )
+    i = decode(connectome["_con_i"], "<u2")
+    j = decode(connectome["_con_j"], "<u2")
+    assert (i < j).all()
+    assert {(0, 1), (2, 3)} <= set(zip(i, j))
+
+
+@pytest.mark.parametrize(
+    "params", [dict(max_edges=3), dict(max_edges_per_node=1)]
+)
+def test_get_connectome_decimation_no_self_loops(params):
+    adj, coord = _make_correlation_connectome()
+
+    connectome = html_connectome._get_connectome(adj, coord, **params)
+
+    # segments are made of two ends and a separator
+    con_x = decode(connectome["_con_x"], "<f4").reshape((-1, 3))
+    con_y = decode(connectome["_con_y"], "<f4").reshape((-1, 3))
+    assert len(con_x) <= 5
+    assert ((con_x[:, 0] != con_x[:, 1]) | (con_y[:, 0] != con_y[:, 1])).all()
+    if "max_edges" in params:
+        assert len(con_x) == 3
+
+
 def test_view_connectome():
     adj, coord = _make_connectome()
     html = html_connectome.view_connectome(adj, coord)
@@ -114,6 +239,10 @@ def test_view_connectome():
         adj, coord, "85.3%", linewidth=8.5, node_size=np.arange(len(coord))
     )
     check_html(html, False, "connectome-plot")
+    html = html_connectome.view_connectome(
+        adj, coord, max_edges_per_node=1, compact_edges=True
+    )
+    check_html(html, False, "connectome-plot")
 
 
 def test_view_markers():
@@ -72,6 +72,22 @@ def test_data_to_sprite():
     assert (sprite == gtruth).all(), "simulated sprite not as expected"
 
 
+def test_data_to_sprite_shapes(rng):
+    """Check the sprite against pasting the slices one by one."""
+    data = rng.standard_normal((7, 5, 3)).astype("float32")
+    sprite = html_stat_map._data_to_sprite(data)
+
+    assert sprite.shape == (3 * 3, 3 * 5)
+    assert sprite.dtype == data.dtype
+    for xx in range(7):
+        row, col = divmod(xx, 3)
+        np.testing.assert_array_equal(
+            sprite[row * 3 : (row + 1) * 3, col * 5 : (col + 1) * 5],
+            data[xx, :, ::-1].T,
+        )
+    assert (sprite[6:, 5:] == 0).all()
+
+
 def test_threshold_data():
     data = np.arange(-3, 4)
 
@@ -388,3 +404,24 @@ def test_view_img():
         "the following warnings were not expected: "
         f"{warnings_set.difference(expected_set)}"
     )
+
+
+def test_view_img_bg_cache(tmp_path):
+    """Check that backgrounds given by path are loaded once."""
+    html_stat_map._load_cached_bg_img.cache_clear()
+    img, _ = _simulate_img()
+    bg_data = np.ones((8, 8, 8))
+    bg_data[2:6, 2:6, 2:6] = 3
+    Nifti1Image(bg_data, np.eye(4)).to_filename(tmp_path / "bg.nii")
+
+    html_1 = html_stat_map.view_img(img, bg_img=tmp_path / "bg.nii")
+    html_2 = html_stat_map.view_img(img, bg_img=str(tmp_path / "bg.nii"))
+
+    _check_html(html_1)
+    assert str(html_1) == str(html_2)
+    assert html_stat_map._load_cached_bg_img.cache_info().hits == 1
+    # the background is the same as when it is given as an image
+    html_3 = html_stat_map.view_img(
+        img, bg_img=Nifti1Image(bg_data, np.eye(4))
+    )
+    assert str(html_1) == str(html_3)
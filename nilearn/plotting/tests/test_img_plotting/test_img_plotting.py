@@ -6,7 +6,7 @@ import pytest
 from nibabel import Nifti1Image
 
 from nilearn.conftest import _affine_mni
-from nilearn.datasets import load_mni152_template
+from nilearn.datasets import clear_template_cache, load_mni152_template
 from nilearn.image import get_data, reorder_img
 from nilearn.plotting import (
     plot_anat,
@@ -58,6 +58,16 @@ def test_mni152template_is_reordered():
     assert np.allclose(reordered_mni.shape, MNI152TEMPLATE.shape)
 
 
+def test_mni152template_is_unloaded_by_clear_template_cache():
+    MNI152TEMPLATE.load()
+    assert MNI152TEMPLATE.data is not None
+
+    clear_template_cache()
+
+    assert MNI152TEMPLATE.data is None
+    assert MNI152TEMPLATE.shape == (99, 117, 95)
+
+
 @pytest.mark.parametrize("plot_func", PLOTTING_FUNCS_3D)
 def test_plot_functions_3d_default_params(plot_func, img_3d_mni, tmp_path):
     """Smoke tests for 3D plotting functions with default parameters."""
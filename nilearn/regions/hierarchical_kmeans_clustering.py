@@ -3,6 +3,8 @@
 import warnings
 
 import numpy as np
+from joblib import Parallel, delayed
+from scipy import sparse
 from sklearn.base import BaseEstimator, ClusterMixin, TransformerMixin
 from sklearn.cluster import MiniBatchKMeans
 from sklearn.utils import check_array
@@ -45,6 +47,32 @@ def _adjust_small_clusters(array, n_clusters):
     return array_round
 
 
+def _refine_cluster(
+    X,
+    n_clusters,
+    init,
+    batch_size,
+    n_init,
+    max_no_improvement,
+    verbose,
+    random_state,
+):
+    """Split the samples of one coarse cluster into n_clusters."""
+    return (
+        MiniBatchKMeans(
+            init=init,
+            n_clusters=n_clusters,
+            batch_size=batch_size,
+            random_state=random_state,
+            max_no_improvement=max_no_improvement,
+            verbose=verbose,
+            n_init=n_init,
+        )
+        .fit(X)
+        .labels_
+    )
+
+
 def hierarchical_k_means(
     X,
     n_clusters,
@@ -54,6 +82,7 @@ def hierarchical_k_means(
     max_no_improvement=10,
     verbose=0,
     random_state=0,
+    n_jobs=1,
 ):
     """Use a recursive k-means to cluster X.
 
@@ -96,6 +125,12 @@ def hierarchical_k_means(
         Determines random number generation for centroid initialization and
         random reassignment. Use an int to make the randomness deterministic.
 
+    n_jobs : int, default=1
+        The number of CPUs to use to split the coarse clusters
+        in parallel. -1 means 'all CPUs'.
+
+        .. versionadded:: 0.11.0
+
     Returns
     -------
     labels : list of ints (len n_features)
@@ -113,28 +148,31 @@ def hierarchical_k_means(
     ).fit(X)
     coarse_labels = mbk.labels_
     fine_labels = np.zeros_like(coarse_labels)
-    q = 0
-    counts = np.bincount(coarse_labels)
-    exact_clusters = np.asarray(
-        [
-            n_clusters * counts[i] * 1.0 / X.shape[0]
-            for i in range(n_big_clusters)
-        ]
-    )
+    counts = np.bincount(coarse_labels, minlength=n_big_clusters)
+    exact_clusters = n_clusters * counts / X.shape[0]
 
     adjusted_clusters = _adjust_small_clusters(exact_clusters, n_clusters)
-    for i, n_small_clusters in enumerate(adjusted_clusters):
-        mbk = MiniBatchKMeans(
-            init=init,
-            n_clusters=n_small_clusters,
-            batch_size=batch_size,
-            random_state=random_state,
-            max_no_improvement=max_no_improvement,
-            verbose=verbose,
-            n_init=n_init,
-        ).fit(X[coarse_labels == i])
-        fine_labels[coarse_labels == i] = q + mbk.labels_
-        q += n_small_clusters
+    # samples of each coarse cluster, in their original order
+    order = np.argsort(coarse_labels, kind="stable")
+    cluster_samples = np.split(order, np.cumsum(counts)[:-1])
+    sub_labels = Parallel(n_jobs=n_jobs)(
+        delayed(_refine_cluster)(
+            X[samples],
+            n_small_clusters,
+            init,
+            batch_size,
+            n_init,
+            max_no_improvement,
+            verbose,
+            random_state,
+        )
+        for samples, n_small_clusters in zip(
+            cluster_samples, adjusted_clusters
+        )
+    )
+    offsets = np.cumsum(adjusted_clusters) - adjusted_clusters
+    for samples, labels, offset in zip(cluster_samples, sub_labels, offsets):
+        fine_labels[samples] = offset + labels
 
     return _remove_empty_labels(fine_labels)
 
@@ -190,6 +228,12 @@ class HierarchicalKMeans(BaseEstimator, ClusterMixin, TransformerMixin):
     verbose: int, optional (default 0)
         Verbosity level.
 
+    n_jobs : int, default=1
+        The number of CPUs to use to split the coarse clusters
+        in parallel. -1 means 'all CPUs'.
+
+        .. versionadded:: 0.11.0
+
     Attributes
     ----------
     labels_ : ndarray, shape = [n_features]
@@ -210,6 +254,7 @@ class HierarchicalKMeans(BaseEstimator, ClusterMixin, TransformerMixin):
         verbose=0,
         random_state=0,
         scaling=False,
+        n_jobs=1,
     ):
         self.n_clusters = n_clusters
         self.init = init
@@ -219,6 +264,7 @@ class HierarchicalKMeans(BaseEstimator, ClusterMixin, TransformerMixin):
         self.verbose = verbose
         self.random_state = random_state
         self.scaling = scaling
+        self.n_jobs = n_jobs
 
     def fit(self, X, y=None):
         """Compute clustering of the data.
@@ -234,7 +280,11 @@ class HierarchicalKMeans(BaseEstimator, ClusterMixin, TransformerMixin):
         self
         """
         X = check_array(
-            X, ensure_min_features=2, ensure_min_samples=2, estimator=self
+            X,
+            ensure_min_features=2,
+            ensure_min_samples=2,
+            dtype=[np.float32, np.float64],
+            estimator=self,
         )
         n_features = X.shape[1]
 
@@ -259,6 +309,7 @@ class HierarchicalKMeans(BaseEstimator, ClusterMixin, TransformerMixin):
             self.max_no_improvement,
             self.verbose,
             self.random_state,
+            self.n_jobs,
         )
         sizes = np.bincount(self.labels_)
 
@@ -280,18 +331,21 @@ class HierarchicalKMeans(BaseEstimator, ClusterMixin, TransformerMixin):
             Data reduced with agglomerated signal for each cluster
         """
         check_is_fitted(self, "labels_")
-        unique_labels = np.arange(self.n_clusters)
-
-        mean_cluster = np.empty(
-            (len(unique_labels), X.shape[1]), dtype=X.dtype
-        )
-        for label in unique_labels:
-            mean_cluster[label] = np.mean(X[self.labels_ == label], axis=0)
-
-        X_red = np.array(mean_cluster)
-
+        X = np.asarray(X)
+        dtype = X.dtype if X.dtype.kind == "f" else np.float64
+        # Sparse matrix averaging the features of each cluster; with
+        # scaling, the sum is divided by the square root of the size
+        weights = 1.0 / self.sizes_
         if self.scaling:
-            X_red = X_red * np.sqrt(self.sizes_[:, np.newaxis])
+            weights = np.sqrt(weights)
+        averaging = sparse.csr_matrix(
+            (
+                weights[self.labels_].astype(dtype),
+                (self.labels_, np.arange(len(self.labels_))),
+            ),
+            shape=(self.n_clusters, len(self.labels_)),
+        )
+        X_red = np.asarray(averaging @ X.astype(dtype, copy=False))
 
         return X_red
 
@@ -310,9 +364,13 @@ class HierarchicalKMeans(BaseEstimator, ClusterMixin, TransformerMixin):
             Data reduced expanded to the original feature space
         """
         check_is_fitted(self, "labels_")
-        inverse = self.labels_
+        X_red = np.asarray(X_red)
         if self.scaling:
-            X_red = X_red / np.sqrt(self.sizes_[:, np.newaxis])
-        X_inv = X_red[inverse, ...]
+            dtype = X_red.dtype if X_red.dtype.kind == "f" else np.float64
+            X_red = X_red / np.sqrt(self.sizes_[:, np.newaxis]).astype(dtype)
+        # Each feature takes the value of its cluster: this is the product
+        # with the (sparse) indicator matrix of the clusters, done by
+        # indexing the rows of X_red
+        X_inv = np.take(X_red, self.labels_, axis=0)
 
         return X_inv
@@ -99,7 +99,8 @@ def _labels_masker_extraction(img, masker, confound):
         Image to process.
 
     masker : instance of NiftiLabelsMasker
-        Used for extracting signals with fit_transform.
+        Fitted masker, shared by all images, used for extracting signals
+        with transform.
 
     confound : csv file, numpy ndarray or pandas DataFrame
         Confound used for signal cleaning while extraction.
@@ -111,8 +112,7 @@ def _labels_masker_extraction(img, masker, confound):
         Signals extracted on given img.
 
     """
-    masker = clone(masker)
-    signals = masker.fit_transform(img, confounds=confound)
+    signals = masker.transform(img, confounds=confound)
     return signals
 
 
@@ -230,6 +230,15 @@ class Parcellations(_MultiPCA):
     %(n_jobs)s
     %(verbose0)s
 
+    temp_folder : :obj:`str` or :obj:`pathlib.Path`, optional
+        If given, the reduced data of the images is written to a temporary
+        file in this folder, a few images at a time, and memory mapped
+        for the group reduction, instead of being held in memory. Use
+        this to learn parcellations from many subjects within a fixed
+        memory budget. The file is deleted at the end of ``fit``.
+
+        .. versionadded:: 0.11.0
+
     Attributes
     ----------
     labels_img_ : :class:`nibabel.nifti1.Nifti1Image`
@@ -289,6 +298,7 @@ class Parcellations(_MultiPCA):
         memory_level=0,
         n_jobs=1,
         verbose=1,
+        temp_folder=None,
     ):
         if memory is None:
             memory = Memory(location=None)
@@ -296,6 +306,7 @@ class Parcellations(_MultiPCA):
         self.n_parcels = n_parcels
         self.scaling = scaling
         self.n_iter = n_iter
+        self.temp_folder = temp_folder
 
         _MultiPCA.__init__(
             self,
@@ -384,10 +395,11 @@ class Parcellations(_MultiPCA):
                 max_no_improvement=10,
                 random_state=self.random_state,
                 verbose=max(0, self.verbose - 1),
+                n_jobs=self.n_jobs,
             )
             # data ou data.T
             labels = self._cache(_estimator_fit, func_memory_level=1)(
-                components.T, hkmeans
+                components.T.astype(np.float32), hkmeans
             )
 
         elif self.method == "rena":
@@ -500,7 +512,10 @@ class Parcellations(_MultiPCA):
             memory=self.memory,
             memory_level=self.memory_level,
             verbose=self.verbose,
+            reports=False,
         )
+        # The masker is fitted once and shared by all the images
+        masker.fit()
 
         region_signals = Parallel(n_jobs=self.n_jobs)(
             delayed(
@@ -4,7 +4,7 @@ import collections.abc
 import numbers
 
 import numpy as np
-from joblib import Memory
+from joblib import Memory, Parallel, delayed
 from scipy.ndimage import label
 from scipy.stats import scoreatpercentile
 
@@ -17,7 +17,7 @@ from .._utils.niimg import safe_get_data
 from .._utils.niimg_conversions import check_same_fov
 from .._utils.segmentation import random_walker
 from ..image import new_img_like, resample_img
-from ..image.image import concat_imgs, smooth_array, threshold_img
+from ..image.image import smooth_array, threshold_img
 
 
 def _threshold_maps_ratio(maps_img, threshold):
@@ -127,6 +127,68 @@ def _remove_small_regions(input_data, affine, min_size):
     return input_data
 
 
+def _label_map_regions(
+    map_3d,
+    affine,
+    extract_type,
+    smoothing_fwhm,
+    min_region_size,
+    random_walker_mode="cg",
+):
+    """Split one brain map into separate regions.
+
+    Parameters
+    ----------
+    map_3d : numpy.ndarray
+        3D brain map.
+
+    affine : numpy.ndarray
+        Affine of the map.
+
+    extract_type : {'connected_components', 'local_regions'}
+        See :func:`connected_regions`.
+
+    smoothing_fwhm : :obj:`float`
+        See :func:`connected_regions`.
+
+    min_region_size : :obj:`float`
+        Minimum number of voxels for a region to be kept.
+
+    random_walker_mode : {'cg', 'cg_j', 'bf'}, default='cg'
+        See :func:`connected_regions`.
+
+    Returns
+    -------
+    label_maps : numpy.ndarray
+        The labels of the regions of the map.
+
+    kept_labels : numpy.ndarray
+        The labels of the regions bigger than `min_region_size`.
+
+    """
+    # Mark the seeds using random walker
+    if extract_type == "local_regions":
+        smooth_map = smooth_array(map_3d, affine=affine, fwhm=smoothing_fwhm)
+        seeds = peak_local_max(smooth_map)
+        seeds_label, _ = label(seeds)
+        # Assign -1 to values which are 0. to indicate to ignore
+        seeds_label[map_3d == 0.0] = -1
+        rw_maps = random_walker(map_3d, seeds_label, mode=random_walker_mode)
+        # Now simply replace "-1" with "0" for regions separation
+        rw_maps[rw_maps == -1] = 0.0
+        label_maps = rw_maps
+    else:
+        # Connected component extraction
+        label_maps, n_labels = label(map_3d)
+
+    # Takes the size of each labelized region data
+    labels_size = np.bincount(label_maps.ravel())
+    # set background labels sitting in zero index to zero
+    labels_size[0] = 0.0
+    kept_labels = np.flatnonzero(labels_size > min_region_size)
+    return label_maps, kept_labels
+
+
 @fill_doc
 def connected_regions(
     maps_img,
@@ -134,6 +196,8 @@ def connected_regions(
     extract_type="local_regions",
     smoothing_fwhm=6,
     mask_img=None,
+    n_jobs=1,
+    random_walker_mode="cg",
 ):
     """Extract brain connected regions into separate regions.
 
@@ -170,6 +234,24 @@ def connected_regions(
         If given, mask image is applied to input data.
         If None, no masking is applied.
 
+    %(n_jobs)s
+        The maps are split into regions in parallel.
+
+        .. versionadded:: 0.11.0
+
+    random_walker_mode : {'cg', 'cg_j', 'bf'}, default='cg'
+        Solver of the random walker used if
+        ``extract_type='local_regions'``:
+
+        - 'cg': conjugate gradient.
+        - 'cg_j': conjugate gradient with a Jacobi preconditioner.
+        - 'bf': sparse LU factorization shared by all the seeds of a map.
+          It can be faster for maps with a small support, but its memory
+          grows faster than linearly with the number of nonzero voxels,
+          and one factorization is held by each of the ``n_jobs`` workers.
+
+        .. versionadded:: 0.11.0
+
     Returns
     -------
     regions_extracted_img : :class:`nibabel.nifti1.Nifti1Image`
@@ -189,13 +271,19 @@ def connected_regions(
         region extraction on continuous type atlas images and
         also time series signals extraction from regions extracted.
     """
-    all_regions_imgs = []
-    index_of_each_map = []
     maps_img = check_niimg(maps_img, atleast_4d=True)
     maps = safe_get_data(maps_img, copy_data=True)
     affine = maps_img.affine
     min_region_size = min_region_size / np.abs(np.linalg.det(affine[:3, :3]))
 
+    allowed_random_walker_modes = ["cg", "cg_j", "bf"]
+    if random_walker_mode not in allowed_random_walker_modes:
+        raise ValueError(
+            "'random_walker_mode' should be given "
+            f"either of these {allowed_random_walker_modes} "
+            f"You provided random_walker_mode='{random_walker_mode}'"
+        )
+
     allowed_extract_types = ["connected_components", "local_regions"]
     if extract_type not in allowed_extract_types:
         message = (
@@ -217,40 +305,37 @@ def connected_regions(
         # Set as 0 to the values which are outside of the mask
         maps[mask_data == 0.0] = 0.0
 
-    for index in range(maps.shape[-1]):
-        regions = []
-        map_3d = maps[..., index]
-        # Mark the seeds using random walker
-        if extract_type == "local_regions":
-            smooth_map = smooth_array(
-                map_3d, affine=affine, fwhm=smoothing_fwhm
-            )
-            seeds = peak_local_max(smooth_map)
-            seeds_label, _ = label(seeds)
-            # Assign -1 to values which are 0. to indicate to ignore
-            seeds_label[map_3d == 0.0] = -1
-            rw_maps = random_walker(map_3d, seeds_label)
-            # Now simply replace "-1" with "0" for regions separation
-            rw_maps[rw_maps == -1] = 0.0
-            label_maps = rw_maps
-        else:
-            # Connected component extraction
-            label_maps, n_labels = label(map_3d)
-
-        # Takes the size of each labelized region data
-        labels_size = np.bincount(label_maps.ravel())
-        # set background labels sitting in zero index to zero
-        labels_size[0] = 0.0
-        for label_id, label_size in enumerate(labels_size):
-            if label_size > min_region_size:
-                region_data = (label_maps == label_id) * map_3d
-                region_img = new_img_like(maps_img, region_data)
-                regions.append(region_img)
+    maps_regions = Parallel(n_jobs=n_jobs)(
+        delayed(_label_map_regions)(
+            maps[..., index],
+            affine,
+            extract_type,
+            smoothing_fwhm,
+            min_region_size,
+            random_walker_mode,
+        )
+        for index in range(maps.shape[-1])
+    )
 
-        index_of_each_map.extend([index] * len(regions))
-        all_regions_imgs.extend(regions)
+    index_of_each_map = []
+    for index, (_, kept_labels) in enumerate(maps_regions):
+        index_of_each_map.extend([index] * len(kept_labels))
+    if not index_of_each_map:
+        raise TypeError("Cannot concatenate empty objects")
+
+    # Write each region directly in the 4D image of the regions
+    regions_data = np.zeros(
+        maps.shape[:3] + (len(index_of_each_map),), dtype=maps.dtype
+    )
+    region_index = 0
+    for index, (label_maps, kept_labels) in enumerate(maps_regions):
+        map_3d = maps[..., index]
+        for label_id in kept_labels:
+            region_mask = label_maps == label_id
+            regions_data[region_mask, region_index] = map_3d[region_mask]
+            region_index += 1
 
-    regions_extracted_img = concat_imgs(all_regions_imgs)
+    regions_extracted_img = new_img_like(maps_img, regions_data)
 
     return regions_extracted_img, index_of_each_map
 
@@ -356,6 +441,16 @@ class RegionExtractor(NiftiMapsMasker):
     %(memory)s
     %(memory_level)s
     %(verbose0)s
+    %(n_jobs)s
+        The maps are split into regions in parallel.
+
+        .. versionadded:: 0.11.0
+
+    random_walker_mode : {'cg', 'cg_j', 'bf'}, default='cg'
+        Solver of the random walker used if ``extractor='local_regions'``.
+        See :func:`nilearn.regions.connected_regions`.
+
+        .. versionadded:: 0.11.0
 
     Attributes
     ----------
@@ -396,6 +491,8 @@ class RegionExtractor(NiftiMapsMasker):
         memory=None,
         memory_level=0,
         verbose=0,
+        n_jobs=1,
+        random_walker_mode="cg",
     ):
         if memory is None:
             memory = Memory(location=None)
@@ -419,6 +516,8 @@ class RegionExtractor(NiftiMapsMasker):
         self.threshold = threshold
         self.extractor = extractor
         self.smoothing_fwhm = smoothing_fwhm
+        self.n_jobs = n_jobs
+        self.random_walker_mode = random_walker_mode
 
     def fit(self, X=None, y=None):
         """Prepare the data and setup for the region extraction."""
@@ -461,6 +560,8 @@ class RegionExtractor(NiftiMapsMasker):
             self.extractor,
             self.smoothing_fwhm,
             mask_img=self.mask_img,
+            n_jobs=self.n_jobs,
+            random_walker_mode=self.random_walker_mode,
         )
 
         self.maps_img = self.regions_img_
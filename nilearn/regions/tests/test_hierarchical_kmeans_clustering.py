@@ -72,3 +72,40 @@ def test_hierarchical_k_means_clustering():
     assert_array_almost_equal(X_compress, X_compress_scaled)
 
     del X_red, X_compress, X_red_scaled, X_compress_scaled
+
+
+def test_hierarchical_k_means_n_jobs(rng):
+    X = rng.standard_normal((500, 10))
+    labels = hierarchical_k_means(X, 20)
+    labels_parallel = hierarchical_k_means(X, 20, n_jobs=2)
+
+    np.testing.assert_array_equal(labels_parallel, labels)
+    assert len(np.unique(labels)) == labels.max() + 1
+
+
+@pytest.mark.parametrize("scaling", [False, True])
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_hierarchical_k_means_transform(rng, scaling, dtype):
+    """Check the reduction against averaging each cluster, \
+       and that float32 data stay in float32."""
+    X = rng.standard_normal((200, 30)).astype(dtype)
+    hkmeans = HierarchicalKMeans(n_clusters=10, scaling=scaling).fit(X)
+    X_red = hkmeans.transform(X)
+
+    expected = np.asarray(
+        [X[hkmeans.labels_ == label].mean(axis=0) for label in range(10)]
+    )
+    if scaling:
+        expected *= np.sqrt(hkmeans.sizes_[:, np.newaxis])
+    assert X_red.dtype == dtype
+    np.testing.assert_allclose(X_red, expected, rtol=1e-5, atol=1e-5)
+
+    X_inv = hkmeans.inverse_transform(X_red)
+    assert X_inv.dtype == dtype
+    assert X_inv.shape == X.shape
+    np.testing.assert_allclose(
+        X_inv,
+        hkmeans.inverse_transform(hkmeans.transform(X_inv)),
+        rtol=1e-5,
+        atol=1e-5,
+    )
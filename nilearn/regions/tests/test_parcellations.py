@@ -8,6 +8,7 @@ import pytest
 from nibabel import Nifti1Image
 
 from nilearn.conftest import _affine_eye
+from nilearn.image import get_data
 from nilearn.regions.parcellations import (
     Parcellations,
     _check_parameters_transform,
@@ -160,6 +161,53 @@ def test_parcellations_transform_multi_nifti_images(
     assert len(signals) == len(fmri_imgs)
 
 
+@pytest.mark.parametrize("method", ["ward", "rena", "hierarchical_kmeans"])
+def test_parcellations_fit_temp_folder(method, rng, tmp_path):
+    """Fitting with the reduced data memory mapped in a temporary folder \
+    gives the same parcellation."""
+    fmri_imgs = [
+        Nifti1Image(rng.standard_normal((10, 11, 12, 10)), _affine_eye())
+        for _ in range(3)
+    ]
+    mask_img = Nifti1Image(np.ones((10, 11, 12), dtype="uint8"), _affine_eye())
+    parcellator = Parcellations(
+        method=method, n_parcels=5, mask=mask_img, verbose=0
+    )
+    parcellator.fit(fmri_imgs)
+    parcellator_memmap = Parcellations(
+        method=method,
+        n_parcels=5,
+        mask=mask_img,
+        verbose=0,
+        temp_folder=tmp_path,
+    )
+    parcellator_memmap.fit(fmri_imgs)
+
+    np.testing.assert_array_equal(
+        get_data(parcellator_memmap.labels_img_),
+        get_data(parcellator.labels_img_),
+    )
+    assert not list(tmp_path.iterdir())
+
+
+def test_parcellations_transform_n_jobs(test_image_2, rng):
+    """Signals extracted in parallel with the shared masker are the same."""
+    fmri_imgs = [test_image_2] * 3
+    confounds = [rng.standard_normal(size=(10, 3)) for _ in fmri_imgs]
+    parcellator = Parcellations(method="kmeans", n_parcels=5, verbose=0)
+    parcellator.fit(fmri_imgs)
+    signals = parcellator.transform(fmri_imgs, confounds)
+
+    parcellator.n_jobs = 2
+    signals_parallel = parcellator.transform(fmri_imgs, confounds)
+
+    assert len(signals_parallel) == len(fmri_imgs)
+    for this_signals, this_signals_parallel in zip(signals, signals_parallel):
+        np.testing.assert_array_almost_equal(
+            this_signals_parallel, this_signals
+        )
+
+
 def test_check_parameters_transform(test_image_2, rng):
     # single confound
     confounds = rng.standard_normal(size=(10, 3))
@@ -123,6 +123,52 @@ def test_connected_regions_4D(maps, extract_type):
     assert index, np.ndarray
 
 
+@pytest.mark.parametrize(
+    "extract_type", ["connected_components", "local_regions"]
+)
+def test_connected_regions_n_jobs(maps, extract_type):
+    """Regions extracted in parallel are the same as sequentially."""
+    regions_img, index = connected_regions(
+        maps, min_region_size=10, extract_type=extract_type
+    )
+    regions_img_parallel, index_parallel = connected_regions(
+        maps, min_region_size=10, extract_type=extract_type, n_jobs=2
+    )
+    assert index_parallel == index
+    np.testing.assert_array_equal(
+        get_data(regions_img_parallel), get_data(regions_img)
+    )
+
+    # each region is a part of the map it was extracted from
+    maps_data = get_data(maps)
+    regions_data = get_data(regions_img)
+    for region_id, map_id in enumerate(index):
+        region = regions_data[..., region_id]
+        assert np.any(region != 0)
+        np.testing.assert_array_equal(
+            region[region != 0], maps_data[..., map_id][region != 0]
+        )
+
+
+@pytest.mark.parametrize("random_walker_mode", ["cg", "cg_j", "bf"])
+def test_connected_regions_random_walker_mode(maps, random_walker_mode):
+    regions_img, index = connected_regions(
+        maps, min_region_size=10, random_walker_mode=random_walker_mode
+    )
+    assert regions_img.shape[-1] >= N_REGIONS
+    assert len(index) == regions_img.shape[-1]
+
+    extractor = RegionExtractor(
+        maps, min_region_size=10, random_walker_mode=random_walker_mode
+    ).fit()
+    assert extractor.regions_img_.shape == regions_img.shape
+
+
+def test_connected_regions_invalid_random_walker_mode(dummy_map):
+    with pytest.raises(ValueError, match="'random_walker_mode' should be"):
+        connected_regions(dummy_map, random_walker_mode="amg")
+
+
 @pytest.mark.parametrize(
     "extract_type", ["connected_components", "local_regions"]
 )
@@ -11,13 +11,16 @@ import numpy as np
 import pandas as pd
 from scipy.ndimage import (
     center_of_mass,
-    generate_binary_structure,
+    find_objects,
     label,
+    maximum,
     maximum_filter,
     minimum_filter,
 )
+from scipy.spatial import cKDTree
 
 from nilearn._utils import check_niimg_3d
+from nilearn._utils.ndimage import cluster_measures, label_clusters
 from nilearn._utils.niimg import safe_get_data
 from nilearn.image import new_img_like, threshold_img
 from nilearn.image.resampling import coord_transform
@@ -136,9 +139,15 @@ def _cluster_nearest_neighbor(ijk, labels_index, labeled):
     """
     labels = labeled[labeled > 0]
     clusters_ijk = np.array(labeled.nonzero()).T
+    # group the voxels by cluster, to look up each cluster without a
+    # pass over all the voxels
+    order = np.argsort(labels, kind="stable")
+    labels, clusters_ijk = labels[order], clusters_ijk[order]
+    starts = np.searchsorted(labels, labels_index, side="left")
+    ends = np.searchsorted(labels, labels_index, side="right")
     nbrs = np.zeros_like(ijk)
-    for ii, (lab, point) in enumerate(zip(labels_index, ijk)):
-        lab_ijk = clusters_ijk[labels == lab]
+    for ii, (start, end, point) in enumerate(zip(starts, ends, ijk)):
+        lab_ijk = clusters_ijk[start:end]
         dist = np.linalg.norm(lab_ijk - point, axis=1)
         nbrs[ii] = lab_ijk[np.argmin(dist)]
     return nbrs
@@ -196,11 +205,14 @@ def _pare_subpeaks(xyz, ijk, vals, min_distance):
         The statistical values associated with the reduced set of subpeaks.
     """
     keep_idx = np.ones(xyz.shape[0]).astype(bool)
-    for i in range(xyz.shape[0]):
-        for j in range(i + 1, xyz.shape[0]):
-            if keep_idx[i] == 1:
-                dist = np.linalg.norm(xyz[i, :] - xyz[j, :])
-                keep_idx[j] = dist > min_distance
+    # pairs of subpeaks closer than min_distance, found with a KD-tree
+    close_pairs = cKDTree(xyz).query_pairs(min_distance, output_type="ndarray")
+    # subpeaks are sorted: a subpeak is removed if it is too close to a
+    # higher subpeak which has been kept
+    close_pairs = close_pairs[np.lexsort(close_pairs.T[::-1])]
+    for i, j in close_pairs:
+        if keep_idx[i]:
+            keep_idx[j] = False
     ijk = ijk[keep_idx, :]
     vals = vals[keep_idx]
     return ijk, vals
@@ -316,9 +328,6 @@ def get_clusters_table(
         copy_data=(cluster_threshold is not None),
     )
 
-    # Define array for 6-connectivity, aka NN1 or "faces"
-    bin_struct = generate_binary_structure(rank=3, connectivity=1)
-
     voxel_size = np.prod(stat_img.header.get_zooms())
 
     signs = [1, -1] if two_sided else [1]
@@ -344,12 +353,16 @@ def get_clusters_table(
             )
             continue
 
-        # Now re-label and create table
-        label_map = label(binarized, bin_struct)[0]
-        clust_ids = sorted(list(np.unique(label_map)[1:]))
-        peak_vals = np.array(
-            [np.max(temp_stat_map * (label_map == c)) for c in clust_ids]
+        # Now re-label and create table, with 6-connectivity,
+        # aka NN1 or "faces"
+        label_map, n_clusters = label_clusters(
+            temp_stat_map, threshold=stat_threshold, connectivity=6
         )
+        cluster_sizes = cluster_measures(label_map, n_clusters)
+        clust_ids = list(range(1, n_clusters + 1))
+        peak_vals = np.asarray(maximum(temp_stat_map, label_map, clust_ids))
+        # bounding boxes of the clusters, indexed by label - 1
+        cluster_boxes = find_objects(label_map)
         # Sort by descending max value
         clust_ids = [clust_ids[c] for c in (-peak_vals).argsort()]
 
@@ -363,17 +376,25 @@ def get_clusters_table(
             )
 
         for c_id, c_val in enumerate(clust_ids):
-            cluster_mask = label_map == c_val
-            masked_data = temp_stat_map * cluster_mask
+            # Work on the bounding box of the cluster, with a margin of one
+            # voxel for the filters finding the local maxima
+            box = tuple(
+                slice(max(sl.start - 1, 0), sl.stop + 1)
+                for sl in cluster_boxes[c_val - 1]
+            )
+            box_offset = np.array([sl.start for sl in box])
+            cluster_mask = label_map[box] == c_val
+            masked_data = temp_stat_map[box] * cluster_mask
 
-            cluster_size_mm = int(np.sum(cluster_mask) * voxel_size)
+            cluster_size_mm = int(cluster_sizes[c_val] * voxel_size)
 
             # Get peaks, subpeaks and associated statistics
             subpeak_ijk, subpeak_vals = _local_max(
                 masked_data,
-                stat_img.affine,
+                affine @ nib.affines.from_matvec(np.eye(3), box_offset),
                 min_distance=min_distance,
             )
+            subpeak_ijk += box_offset
             subpeak_vals *= sign  # flip signs if necessary
             subpeak_xyz = np.asarray(
                 coord_transform(
@@ -19,6 +19,7 @@ from html import escape
 
 import numpy as np
 import pandas as pd
+from joblib import Parallel, delayed
 from matplotlib import pyplot as plt
 
 from nilearn.plotting import plot_glass_brain, plot_roi, plot_stat_map
@@ -41,7 +42,7 @@ from nilearn._utils import check_niimg
 from nilearn._utils.niimg import safe_get_data
 from nilearn.maskers import NiftiMasker
 from nilearn.reporting.get_clusters_table import get_clusters_table
-from nilearn.reporting.utils import figure_to_svg_quoted
+from nilearn.reporting.utils import figure_to_png_base64, figure_to_svg_quoted
 
 HTML_TEMPLATE_ROOT_PATH = os.path.join(
     os.path.dirname(__file__), "glm_reporter_templates"
@@ -64,6 +65,8 @@ def make_glm_report(
     cut_coords=None,
     display_mode=None,
     report_dims=(1600, 800),
+    image_format="svg",
+    n_jobs=1,
 ):
     """Return HTMLReport object \
     for a report which shows all important aspects of a fitted GLM.
@@ -164,12 +167,30 @@ def make_glm_report(
         Only applicable when inserting the report into a Jupyter notebook.
         Can be set after report creation using report.width, report.height.
 
+    image_format : {'svg', 'png'}, default='svg'
+        Format of the figures embedded in the report.
+        PNG figures are compressed rasters, which make much lighter reports
+        than SVG for large images or many contrasts.
+
+        .. versionadded:: 0.11.0
+
+    %(n_jobs)s
+        The figures and cluster tables of the contrasts are computed in
+        ``n_jobs`` processes.
+
+        .. versionadded:: 0.11.0
+
     Returns
     -------
     report_text : HTMLReport Object
         Contains the HTML code for the :term:`GLM` Report.
 
     """
+    if image_format not in ("svg", "png"):
+        raise ValueError(
+            "image_format must be 'svg' or 'png'. "
+            f"Got {image_format!r} instead."
+        )
     if bg_img == "MNI152TEMPLATE":
         bg_img = MNI152TEMPLATE
     if not display_mode:
@@ -198,7 +219,9 @@ def make_glm_report(
     report_body_template = string.Template(html_body_template_text)
 
     contrasts = _coerce_to_dict(contrasts)
-    contrast_plots = _plot_contrasts(contrasts, design_matrices)
+    contrast_plots = _plot_contrasts(
+        contrasts, design_matrices, image_format=image_format
+    )
     page_title, page_heading_1, page_heading_2 = _make_headings(
         contrasts,
         title,
@@ -213,7 +236,9 @@ def make_glm_report(
             sparsify=False,
         )
     statistical_maps = _make_stat_maps(model, contrasts)
-    html_design_matrices = _dmtx_to_svg_url(design_matrices)
+    html_design_matrices = _dmtx_to_svg_url(
+        design_matrices, image_format=image_format
+    )
 
     # Select mask_img to use for plotting
     if isinstance(model.mask_img, NiftiMasker):
@@ -227,7 +252,10 @@ def make_glm_report(
             mask_img = model.masker_.mask_img_
 
     mask_plot_html_code = _mask_to_svg(
-        mask_img=mask_img, bg_img=bg_img, cut_coords=cut_coords
+        mask_img=mask_img,
+        bg_img=bg_img,
+        cut_coords=cut_coords,
+        image_format=image_format,
     )
     all_components = _make_stat_maps_contrast_clusters(
         stat_img=statistical_maps,
@@ -242,6 +270,8 @@ def make_glm_report(
         cut_coords=cut_coords,
         display_mode=display_mode,
         plot_type=plot_type,
+        image_format=image_format,
+        n_jobs=n_jobs,
     )
     all_components_text = "\n".join(all_components)
     report_values_head = {
@@ -331,8 +361,8 @@ def _coerce_to_dict(input_arg):
     return input_arg
 
 
-def _plot_to_svg(plot):
-    """Create an SVG image as a data URL \
+def _plot_to_svg(plot, image_format="svg"):
+    """Create an SVG or PNG image as a data URL \
     from a Matplotlib Axes or Figure object.
 
     Parameters
@@ -340,19 +370,22 @@ def _plot_to_svg(plot):
     plot : Matplotlib Axes or Figure object
         Contains the plot information.
 
+    image_format : {'svg', 'png'}, default='svg'
+        Format of the image.
+
     Returns
     -------
     url_plot_svg : String
-        SVG Image Data URL.
+        SVG or PNG Image Data URL.
 
     """
-    try:
-        return figure_to_svg_quoted(plot)
-    except AttributeError:
-        return figure_to_svg_quoted(plot.figure)
+    fig = getattr(plot, "figure", plot)
+    if image_format == "png":
+        return f"data:image/png;base64,{figure_to_png_base64(fig)}"
+    return f"data:image/svg+xml,{figure_to_svg_quoted(fig)}"
 
 
-def _plot_contrasts(contrasts, design_matrices):
+def _plot_contrasts(contrasts, design_matrices, image_format="svg"):
     """Accept dict of contrasts and list of design matrices and generate \
     a dict of contrast titles & HTML for SVG Image data url \
     for corresponding contrast plot.
@@ -366,6 +399,9 @@ def _plot_contrasts(contrasts, design_matrices):
     design_matrices : List[pd.Dataframe]
         Design matrices computed in the model.
 
+    image_format : {'svg', 'png'}, default='svg'
+        Format of the plots.
+
     Returns
     -------
     contrast_plots : Dict[str, svg img]
@@ -380,7 +416,8 @@ def _plot_contrasts(contrasts, design_matrices):
     with open(contrast_template_path) as html_template_obj:
         contrast_template_text = html_template_obj.read()
 
-    for design_matrix in design_matrices:
+    # only the plots of the last design matrix are kept
+    for design_matrix in design_matrices[-1:]:
         for contrast_name, contrast_data in contrasts.items():
             contrast_text_ = string.Template(contrast_template_text)
             contrast_plot = plot_contrast_matrix(
@@ -389,7 +426,9 @@ def _plot_contrasts(contrasts, design_matrices):
             contrast_plot.set_xlabel(contrast_name)
             contrast_plot.figure.set_figheight(2)
             contrast_plot.figure.set_tight_layout(True)
-            url_contrast_plot_svg = _plot_to_svg(contrast_plot)
+            url_contrast_plot_svg = _plot_to_svg(
+                contrast_plot, image_format=image_format
+            )
             # prevents sphinx-gallery & jupyter
             # from scraping & inserting plots
             plt.close()
@@ -551,7 +590,7 @@ def _make_stat_maps(model, contrasts, output_type="z_score"):
     return statistical_maps
 
 
-def _dmtx_to_svg_url(design_matrices):
+def _dmtx_to_svg_url(design_matrices, image_format="svg"):
     """Accept a FirstLevelModel or SecondLevelModel object \
     with fitted design matrices & generate SVG Image URL, \
     which can be inserted into an HTML template.
@@ -561,6 +600,9 @@ def _dmtx_to_svg_url(design_matrices):
     design_matrices : List[pd.Dataframe]
         Design matrices computed in the model.
 
+    image_format : {'svg', 'png'}, default='svg'
+        Format of the plots.
+
     Returns
     -------
     svg_url_design_matrices : String
@@ -581,7 +623,9 @@ def _dmtx_to_svg_url(design_matrices):
         if len(design_matrices) > 1:
             plt.title(dmtx_title, y=1.025, x=-0.1)
         dmtx_plot = _resize_plot_inches(dmtx_plot, height_change=0.3)
-        url_design_matrix_svg = _plot_to_svg(dmtx_plot)
+        url_design_matrix_svg = _plot_to_svg(
+            dmtx_plot, image_format=image_format
+        )
         # prevents sphinx-gallery & jupyter from scraping & inserting plots
         plt.close()
         dmtx_text_ = dmtx_text_.safe_substitute(
@@ -634,7 +678,7 @@ def _resize_plot_inches(plot, width_change=0, height_change=0):
     return plot
 
 
-def _mask_to_svg(mask_img, bg_img, cut_coords=None):
+def _mask_to_svg(mask_img, bg_img, cut_coords=None, image_format="svg"):
     """Plot cuts of an mask image and creates SVG code of it.
 
     Parameters
@@ -649,6 +693,9 @@ def _mask_to_svg(mask_img, bg_img, cut_coords=None):
         The background image that the mask will be plotted on top of.
         To turn off background image, just pass "bg_img=None".
 
+    image_format : {'svg', 'png'}, default='svg'
+        Format of the plot.
+
     Returns
     -------
     mask_plot_svg : str
@@ -663,7 +710,7 @@ def _mask_to_svg(mask_img, bg_img, cut_coords=None):
             cmap="Set1",
             cut_coords=cut_coords,
         )
-        mask_plot_svg = _plot_to_svg(plt.gcf())
+        mask_plot_svg = _plot_to_svg(plt.gcf(), image_format=image_format)
         # prevents sphinx-gallery & jupyter from scraping & inserting plots
         plt.close()
     else:
@@ -685,6 +732,8 @@ def _make_stat_maps_contrast_clusters(
     cut_coords,
     display_mode,
     plot_type,
+    image_format="svg",
+    n_jobs=1,
 ):
     """Populate a smaller HTML sub-template with the proper values, \
     make a list containing one or more of such components \
@@ -754,6 +803,12 @@ def _make_stat_maps_contrast_clusters(
     plot_type : string {'slice', 'glass'}
         The type of plot to be drawn.
 
+    image_format : {'svg', 'png'}, default='svg'
+        Format of the statistical map plots.
+
+    %(n_jobs)s
+        The components of the contrasts are made in ``n_jobs`` processes.
+
     Returns
     -------
     all_components : List[String]
@@ -761,76 +816,119 @@ def _make_stat_maps_contrast_clusters(
         contrast name, contrast plot, statistical map, cluster table.
 
     """
-    all_components = []
     components_template_path = os.path.join(
         HTML_TEMPLATE_ROOT_PATH, "stat_maps_contrast_clusters_template.html"
     )
     with open(components_template_path) as html_template_obj:
         components_template_text = html_template_obj.read()
-    for contrast_name, stat_map_img in stat_img.items():
-        component_text_ = string.Template(components_template_text)
-
-        # Only use threshold_stats_img to adjust the threshold
-        # that we will pass to  _clustering_params_to_dataframe
-        # and _stat_map_to_svg
-        # Necessary to avoid :
-        # https://github.com/nilearn/nilearn/issues/4192
-        thresholded_img, threshold = threshold_stats_img(
-            stat_img=stat_map_img,
+    all_components = Parallel(n_jobs=n_jobs)(
+        delayed(_make_stat_map_contrast_clusters)(
+            components_template_text,
+            contrast_name,
+            stat_map_img,
+            contrast_plot=contrasts_plots[contrast_name],
             threshold=threshold,
             alpha=alpha,
             cluster_threshold=cluster_threshold,
             height_control=height_control,
-        )
-
-        table_details = _clustering_params_to_dataframe(
-            threshold,
-            cluster_threshold,
-            min_distance,
-            height_control,
-            alpha,
-        )
-
-        stat_map_svg = _stat_map_to_svg(
-            stat_img=thresholded_img,
-            threshold=threshold,
+            two_sided=two_sided,
+            min_distance=min_distance,
             bg_img=bg_img,
             cut_coords=cut_coords,
             display_mode=display_mode,
             plot_type=plot_type,
-            table_details=table_details,
+            image_format=image_format,
         )
+        for contrast_name, stat_map_img in stat_img.items()
+    )
+    return all_components
 
-        cluster_table = get_clusters_table(
-            thresholded_img,
-            stat_threshold=threshold,
-            cluster_threshold=cluster_threshold,
-            min_distance=min_distance,
-            two_sided=two_sided,
-        )
 
-        cluster_table_html = _dataframe_to_html(
-            cluster_table,
-            precision=2,
-            index=False,
-            classes="cluster-table",
-        )
-        table_details_html = _dataframe_to_html(
-            table_details,
-            precision=3,
-            header=False,
-            classes="cluster-details-table",
-        )
-        components_values = {
-            "contrast_name": escape(contrast_name),
-            "contrast_plot": contrasts_plots[contrast_name],
-            "stat_map_img": stat_map_svg,
-            "cluster_table_details": table_details_html,
-            "cluster_table": cluster_table_html,
-        }
-        component_text_ = component_text_.safe_substitute(**components_values)
-        all_components.append(component_text_)
-    return all_components
+def _make_stat_map_contrast_clusters(
+    components_template_text,
+    contrast_name,
+    stat_map_img,
+    contrast_plot,
+    threshold,
+    alpha,
+    cluster_threshold,
+    height_control,
+    two_sided,
+    min_distance,
+    bg_img,
+    cut_coords,
+    display_mode,
+    plot_type,
+    image_format,
+):
+    """Make the HTML component of a single contrast.
+
+    See :func:`_make_stat_maps_contrast_clusters` for the parameters.
+    The thresholded map is computed once, and shared by the plot and the
+    cluster table.
+    """
+    component_text_ = string.Template(components_template_text)
+
+    # Only use threshold_stats_img to adjust the threshold
+    # that we will pass to  _clustering_params_to_dataframe
+    # and _stat_map_to_svg
+    # Necessary to avoid :
+    # https://github.com/nilearn/nilearn/issues/4192
+    thresholded_img, threshold = threshold_stats_img(
+        stat_img=stat_map_img,
+        threshold=threshold,
+        alpha=alpha,
+        cluster_threshold=cluster_threshold,
+        height_control=height_control,
+    )
+
+    table_details = _clustering_params_to_dataframe(
+        threshold,
+        cluster_threshold,
+        min_distance,
+        height_control,
+        alpha,
+    )
+
+    stat_map_svg = _stat_map_to_svg(
+        stat_img=thresholded_img,
+        threshold=threshold,
+        bg_img=bg_img,
+        cut_coords=cut_coords,
+        display_mode=display_mode,
+        plot_type=plot_type,
+        table_details=table_details,
+        image_format=image_format,
+    )
+
+    cluster_table = get_clusters_table(
+        thresholded_img,
+        stat_threshold=threshold,
+        cluster_threshold=cluster_threshold,
+        min_distance=min_distance,
+        two_sided=two_sided,
+    )
+
+    cluster_table_html = _dataframe_to_html(
+        cluster_table,
+        precision=2,
+        index=False,
+        classes="cluster-table",
+    )
+    table_details_html = _dataframe_to_html(
+        table_details,
+        precision=3,
+        header=False,
+        classes="cluster-details-table",
+    )
+    components_values = {
+        "contrast_name": escape(contrast_name),
+        "contrast_plot": contrast_plot,
+        "stat_map_img": stat_map_svg,
+        "cluster_table_details": table_details_html,
+        "cluster_table": cluster_table_html,
+    }
+    return component_text_.safe_substitute(**components_values)
 
 
 def _clustering_params_to_dataframe(
@@ -913,6 +1011,7 @@ def _stat_map_to_svg(
     display_mode,
     plot_type,
     table_details,
+    image_format="svg",
 ):
     """Generate SVG code for a statistical map, \
     including its clustering parameters.
@@ -955,6 +1054,9 @@ def _stat_map_to_svg(
         Dataframe listing the parameters used for clustering,
         to be included in the plot.
 
+    image_format : {'svg', 'png'}, default='svg'
+        Format of the plot.
+
     Returns
     -------
     stat_map_svg : string
@@ -1018,7 +1120,7 @@ def _stat_map_to_svg(
     with pd.option_context("display.precision", 2):
         _add_params_to_plot(table_details, stat_map_plot)
     fig = plt.gcf()
-    stat_map_svg = _plot_to_svg(fig)
+    stat_map_svg = _plot_to_svg(fig, image_format=image_format)
     # prevents sphinx-gallery & jupyter from scraping & inserting plots
     plt.close()
     return stat_map_svg
@@ -71,6 +71,30 @@ def test_flm_reporting_method(flm):
     )
 
 
+@pytest.mark.skipif(
+    not_have_mpl, reason="Matplotlib not installed; required for this test"
+)
+def test_flm_reporting_png(flm):
+    """Check that figures are embedded as PNG when requested."""
+    contrasts = {"c1": np.eye(3)[1], "c2": np.eye(3)[2]}
+    report = glmr.make_glm_report(
+        flm, contrasts, image_format="png", threshold=2, n_jobs=2
+    )
+    html = str(report)
+
+    assert "data:image/svg+xml" not in html
+    # mask, design matrix, and stat map and contrast (shown twice)
+    # of each contrast
+    assert html.count('src="data:image/png;base64,') == 8
+    # the components are in the order of the contrasts
+    assert html.index("<h4>c1</h4>") < html.index("<h4>c2</h4>")
+
+
+def test_make_glm_report_image_format_error(flm):
+    with pytest.raises(ValueError, match="image_format must be"):
+        glmr.make_glm_report(flm, np.eye(3)[1], image_format="gif")
+
+
 @pytest.fixture()
 def slm(tmp_path):
     """Generate a fitted second level model."""
@@ -10,6 +10,7 @@ from nilearn.reporting import get_clusters_table
 from nilearn.reporting.get_clusters_table import (
     _cluster_nearest_neighbor,
     _local_max,
+    _pare_subpeaks,
 )
 
 # Avoid making pyflakes unhappy
@@ -107,6 +108,48 @@ def test_cluster_nearest_neighbor(shape):
     assert np.array_equal(nbrs, np.array([[4, 7, 5], [4, 5, 5], [4, 2, 6]]))
 
 
+def test_pare_subpeaks(rng):
+    """Check that _pare_subpeaks removes the subpeaks too close to a higher \
+       subpeak which is kept, like a greedy pass over the sorted subpeaks."""
+    ijk = rng.integers(0, 20, size=(50, 3))
+    vals = np.sort(rng.standard_normal(50))[::-1]
+    min_distance = 6.0
+
+    keep = []
+    for i, point in enumerate(ijk):
+        if all(np.linalg.norm(point - ijk[j]) > min_distance for j in keep):
+            keep.append(i)
+
+    pared_ijk, pared_vals = _pare_subpeaks(ijk, ijk, vals, min_distance)
+    assert np.array_equal(pared_ijk, ijk[keep])
+    assert np.array_equal(pared_vals, vals[keep])
+
+
+def test_get_clusters_table_peaks_in_bounding_boxes(affine_eye):
+    """Check peaks of clusters at the border of the image and far from \
+       the origin, which are found in the bounding box of each cluster."""
+    data = np.zeros((20, 20, 20))
+    data[0:3, 0:3, 0:3] = 2
+    data[1, 1, 1] = 5
+    data[15:20, 12:15, 17:20] = 3
+    data[19, 13, 19] = 4
+    data[16, 13, 17] = 3.5
+    stat_img = nib.Nifti1Image(data, affine_eye)
+
+    table = get_clusters_table(stat_img, 1, min_distance=2)
+    peaks = table[["X", "Y", "Z", "Peak Stat"]].to_numpy()
+    assert np.array_equal(
+        peaks,
+        [
+            [1, 1, 1, 5.0],
+            [19, 13, 19, 4.0],
+            [16, 13, 17, 3.5],
+            [15, 13, 19, 3.0],
+        ],
+    )
+    assert list(table["Cluster Size (mm3)"][:2]) == [27, 45]
+
+
 @pytest.mark.parametrize(
     "stat_threshold, cluster_threshold, two_sided, expected_nb_cluster",
     [
@@ -22,3 +22,16 @@ def figure_to_svg_base64(fig):
 def figure_to_svg_quoted(fig):
     """Save figure as svg and return it as quoted string."""
     return urllib.parse.quote(figure_to_svg_bytes(fig).decode("utf-8"))
+
+
+def figure_to_png_base64(fig):
+    """Save figure as png and return it as 64 bytes."""
+    with io.BytesIO() as io_buffer:
+        fig.savefig(
+            io_buffer,
+            format="png",
+            facecolor="white",
+            edgecolor="white",
+            pil_kwargs={"optimize": True},
+        )
+        return base64.b64encode(io_buffer.getvalue()).decode()
@@ -1,9 +1,11 @@
 """Functions for surface manipulation."""
 
 import gzip
+import hashlib
 import os
+import threading
 import warnings
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
 from collections.abc import Mapping
 from pathlib import Path
 
@@ -12,10 +14,11 @@ import numpy as np
 import sklearn.cluster
 import sklearn.preprocessing
 from nibabel import freesurfer as fs, gifti
-from scipy import interpolate, sparse
+from scipy import sparse
 
 from nilearn import _utils, datasets
 from nilearn._utils import stringify_path
+from nilearn._utils.cache_mixin import _lru_cache, _register_in_memory_cache
 from nilearn._utils.path_finding import resolve_globbing
 from nilearn.image import get_data, load_img, resampling
 
@@ -405,6 +408,179 @@ def _projection_matrix(mesh, affine, img_shape, kind='auto', radius=3.,
     return proj
 
 
+def _trilinear_interpolation_matrix(locations, img_shape):
+    """Get a sparse matrix interpolating an image at some locations.
+
+    The interpolation is the one of
+    :class:`scipy.interpolate.RegularGridInterpolator` with
+    ``method='linear'`` and ``fill_value=None``: locations beyond the
+    last voxel of a dimension are linearly extrapolated.
+
+    Parameters
+    ----------
+    locations : :obj:`numpy.ndarray`, shape(n_locations, 3)
+        Locations, in voxel space, at which the image is interpolated.
+
+    img_shape : 3-tuple of :obj:`int`
+        The shape of the image to be interpolated.
+
+    Returns
+    -------
+    interp : :obj:`scipy.sparse.csr_matrix`
+       Shape (n_locations, n_voxels). The dot product of this matrix with an
+       image (represented as a column vector) gives the interpolated values.
+
+    """
+    img_shape = np.asarray(img_shape)
+    lower = np.clip(np.floor(locations), 0, np.maximum(img_shape - 2, 0))
+    weights_upper = locations - lower
+    lower = lower.astype(int)
+    rows, columns, weights = [], [], []
+    for corner in np.ndindex(2, 2, 2):
+        indices = np.minimum(lower + corner, img_shape - 1)
+        rows.append(np.arange(len(locations)))
+        columns.append(np.ravel_multi_index(indices.T, img_shape))
+        weights.append(np.prod(
+            np.where(corner, weights_upper, 1 - weights_upper), axis=1))
+    return sparse.csr_matrix(
+        (np.concatenate(weights),
+         (np.concatenate(rows), np.concatenate(columns))),
+        shape=(len(locations), np.prod(img_shape)))
+
+
+def _interpolation_matrices(mesh, affine, img_shape, kind='auto', radius=3.,
+                            n_points=None, mask=None, inner_mesh=None,
+                            depth=None):
+    """Get the sparse matrices that interpolate volume data at the samples \
+    drawn around each vertex of a mesh, and average them.
+
+    See :func:`_projection_matrix` for a description of the parameters.
+
+    Returns
+    -------
+    interp : :obj:`scipy.sparse.csr_matrix`
+       Shape (n_vertices * n_points, n_voxels). Trilinear interpolation at
+       each sample location; weights of samples that are outside of the
+       image or masked are 0.
+
+    average : :obj:`scipy.sparse.csr_matrix`
+       Shape (n_vertices, n_vertices * n_points). Average of the kept samples
+       of each vertex.
+
+    """
+    mesh = load_surf_mesh(mesh)
+    sample_locations = _sample_locations(
+        mesh, affine, kind=kind, radius=radius, n_points=n_points,
+        inner_mesh=inner_mesh, depth=depth)
+    n_vertices, n_points, _ = sample_locations.shape
+    interp_locations = np.vstack(sample_locations)
+    kept = ~_masked_indices(interp_locations, img_shape, mask=mask)
+    interp = _trilinear_interpolation_matrix(interp_locations, img_shape)
+    interp.data[np.repeat(~kept, np.diff(interp.indptr))] = 0
+    kept = kept.reshape((n_vertices, n_points))
+    n_kept = kept.sum(axis=1)
+    weights = np.divide(
+        kept, n_kept[:, np.newaxis], out=np.zeros(kept.shape),
+        where=n_kept[:, np.newaxis] > 0)
+    row_indices, _ = np.mgrid[:n_vertices, :n_points]
+    average = sparse.csr_matrix(
+        (weights.ravel(), (row_indices.ravel(), np.arange(kept.size))),
+        shape=(n_vertices, kept.size))
+    return interp, average
+
+
+# Projection operators are cached because they are expensive to build and
+# the same mesh, image grid and sampling strategy are often used for many
+# images (e.g. all the subjects of a study in MNI space).
+_PROJECTION_CACHE = OrderedDict()
+_PROJECTION_CACHE_SIZE = 4
+_PROJECTION_CACHE_LOCK = threading.Lock()
+_register_in_memory_cache(_PROJECTION_CACHE.clear)
+
+
+def _reset_projection_cache_lock():
+    """Replace the lock, which may be held by another thread at fork time."""
+    global _PROJECTION_CACHE_LOCK
+    _PROJECTION_CACHE_LOCK = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_projection_cache_lock)
+
+
+def _projection_cache_key(interpolation, mesh, affine, img_shape, **kwargs):
+    """Hash all the inputs that determine a projection operator."""
+    hasher = hashlib.sha1()
+
+    def update(value):
+        if value is None:
+            hasher.update(b"None")
+            return
+        value = np.ascontiguousarray(value)
+        hasher.update(f"{value.dtype}{value.shape}".encode())
+        hasher.update(value.tobytes())
+
+    hasher.update(interpolation.encode())
+    for mesh_ in (mesh, kwargs.pop("inner_mesh")):
+        if mesh_ is None:
+            update(None)
+        else:
+            update(mesh_.coordinates)
+            update(mesh_.faces)
+    update(affine)
+    update(np.asarray(img_shape))
+    update(kwargs.pop("mask"))
+    depth = kwargs.pop("depth")
+    update(None if depth is None else np.asarray(depth, dtype=float))
+    hasher.update(repr(sorted(kwargs.items())).encode())
+    return hasher.hexdigest()
+
+
+def _projection_operator(interpolation, mesh, affine, img_shape, kind='auto',
+                         radius=3., n_points=None, mask=None,
+                         inner_mesh=None, depth=None):
+    """Get the sparse matrix projecting volume data onto a mesh.
+
+    Operators are cached, so that projecting many images sampled on the same
+    grid onto the same mesh only builds the operator once.
+
+    Returns
+    -------
+    proj : :obj:`scipy.sparse.csr_matrix`
+       Shape (n_vertices, n_voxels). The dot product of this matrix with
+       images (represented as column vectors) gives their projection.
+
+    empty : :obj:`numpy.ndarray` of :obj:`bool`, shape (n_vertices,)
+        Vertices all the samples of which are outside of the image or
+        masked, for which there is no reasonable projected value.
+
+    """
+    mesh = load_surf_mesh(mesh)
+    if inner_mesh is not None:
+        inner_mesh = load_surf_mesh(inner_mesh)
+    kwargs = dict(kind=kind, radius=radius, n_points=n_points, mask=mask,
+                  inner_mesh=inner_mesh, depth=depth)
+    key = _projection_cache_key(
+        interpolation, mesh, affine, img_shape, **kwargs)
+    with _PROJECTION_CACHE_LOCK:
+        if key in _PROJECTION_CACHE:
+            _PROJECTION_CACHE.move_to_end(key)
+            return _PROJECTION_CACHE[key]
+    if interpolation == 'nearest':
+        proj = _projection_matrix(mesh, affine, img_shape, **kwargs)
+        empty = np.asarray(proj.sum(axis=1) == 0).ravel()
+    else:
+        interp, average = _interpolation_matrices(
+            mesh, affine, img_shape, **kwargs)
+        proj = average.dot(interp).tocsr()
+        empty = np.asarray(average.sum(axis=1) == 0).ravel()
+    with _PROJECTION_CACHE_LOCK:
+        _PROJECTION_CACHE[key] = proj, empty
+        while len(_PROJECTION_CACHE) > _PROJECTION_CACHE_SIZE:
+            _PROJECTION_CACHE.popitem(last=False)
+    return proj, empty
+
+
 def _nearest_voxel_sampling(images, mesh, affine, kind='auto', radius=3.,
                             n_points=None, mask=None, inner_mesh=None,
                             depth=None):
@@ -416,15 +592,15 @@ def _nearest_voxel_sampling(images, mesh, affine, kind='auto', radius=3.,
     See documentation of vol_to_surf for details.
 
     """
-    proj = _projection_matrix(
-        mesh, affine, images[0].shape, kind=kind, radius=radius,
+    proj, empty = _projection_operator(
+        'nearest', mesh, affine, images[0].shape, kind=kind, radius=radius,
         n_points=n_points, mask=mask, inner_mesh=inner_mesh, depth=depth)
     data = np.asarray(images).reshape(len(images), -1).T
     texture = proj.dot(data)
     # if all samples around a mesh vertex are outside the image,
     # there is no reasonable value to assign to this vertex.
     # in this case we return NaN for this vertex.
-    texture[np.asarray(proj.sum(axis=1) == 0).ravel()] = np.nan
+    texture[empty] = np.nan
     return texture.T
 
 
@@ -440,29 +616,31 @@ def _interpolation_sampling(images, mesh, affine, kind='auto', radius=3,
     See documentation of vol_to_surf for details.
 
     """
-    sample_locations = _sample_locations(
-        mesh, affine, kind=kind, radius=radius, n_points=n_points,
-        inner_mesh=inner_mesh, depth=depth)
-    n_vertices, n_points, _ = sample_locations.shape
-    grid = [np.arange(size) for size in images[0].shape]
-    interp_locations = np.vstack(sample_locations)
-    masked = _masked_indices(interp_locations, images[0].shape, mask=mask)
-    # loop over images rather than building a big array to use less memory
-    all_samples = []
-    for img in images:
-        interpolator = interpolate.RegularGridInterpolator(
-            grid, img,
-            bounds_error=False, method='linear', fill_value=None)
-        samples = interpolator(interp_locations)
+    img_shape = images[0].shape
+    data = np.asarray(images).reshape(len(images), -1).T
+    kwargs = dict(kind=kind, radius=radius, n_points=n_points, mask=mask,
+                  inner_mesh=inner_mesh, depth=depth)
+    nan_voxels = np.isnan(data)
+    if not nan_voxels.any():
+        proj, empty = _projection_operator(
+            'linear', mesh, affine, img_shape, **kwargs)
+        texture = proj.dot(data)
         # if all samples around a mesh vertex are outside the image,
         # there is no reasonable value to assign to this vertex.
         # in this case we return NaN for this vertex.
-        samples[masked] = np.nan
-        all_samples.append(samples)
-    all_samples = np.asarray(all_samples)
-    all_samples = all_samples.reshape((len(images), n_vertices, n_points))
-    texture = np.nanmean(all_samples, axis=2)
-    return texture
+        texture[empty] = np.nan
+        return texture.T
+    # samples interpolated from NaN voxels are ignored, so the average
+    # depends on the image and cannot be precomputed
+    interp, average = _interpolation_matrices(
+        mesh, affine, img_shape, **kwargs)
+    samples = interp.dot(np.where(nan_voxels, 0, data))
+    interp.data[:] = 1
+    samples[interp.dot(nan_voxels) > 0] = np.nan
+    samples[average.sum(axis=0).A1 == 0] = np.nan
+    n_vertices = average.shape[0]
+    samples = samples.T.reshape((len(images), n_vertices, -1))
+    return np.nanmean(samples, axis=2)
 
 
 def vol_to_surf(img, surf_mesh,
@@ -497,9 +675,9 @@ def vol_to_surf(img, surf_mesh,
         - 'nearest':
             Use the intensity of the nearest voxel.
 
-        For one image, the speed difference is small, 'linear' takes about x1.5
-        more time. For many images, 'nearest' scales much better, up to x20
-        faster.
+        Both are computed with a sparse projection matrix, which is
+        slower to build for 'linear' but is cached and reused when images on
+        the same grid are projected onto the same mesh.
 
     kind : {'auto', 'depth', 'line', 'ball'}, default='auto'
         The strategy used to sample image intensities around each vertex.
@@ -608,9 +786,14 @@ def vol_to_surf(img, surf_mesh,
     voxel, and 'linear' performs trilinear interpolation of neighbouring
     voxels. 'linear' may give better results - for example, the projected
     values are more stable when resampling the 3d image or applying affine
-    transformations to it. For one image, the speed difference is small,
-    'linear' takes about x1.5 more time. For many images, 'nearest' scales much
-    better, up to x20 faster.
+    transformations to it.
+
+    In both cases, the sampling and averaging are combined in a sparse matrix
+    that projects all the frames of the image at once. This matrix only
+    depends on the meshes, the image grid, the mask and the sampling
+    parameters; the most recently used ones are kept in memory, so that
+    projecting many images (e.g. all the subjects of a study in MNI space)
+    onto the same mesh only builds it once.
 
     Once the 3d image has been interpolated at each sample point, the
     interpolated values are averaged to produce the value associated to this
@@ -855,6 +1038,42 @@ def _gifti_img_to_mesh(gifti_img):
 
 
 # function to figure out datatype and load data
+@_lru_cache(maxsize=8)
+def _load_surf_mesh_file(surf_mesh, mtime):
+    """Load a surface :term:`mesh` from a file.
+
+    Meshes are kept in memory for the next calls, as the same meshes
+    (e.g. fsaverage) are often loaded many times. ``mtime`` is the
+    modification time of the file, so that the mesh is loaded again if
+    the file changes.
+    """
+    if any(surf_mesh.endswith(x) for x in FREESURFER_MESH_EXTENSIONS):
+        coords, faces, header = fs.io.read_geometry(surf_mesh,
+                                                    read_metadata=True)
+        # See https://github.com/nilearn/nilearn/pull/3235
+        if 'cras' in header:
+            coords += header['cras']
+        mesh = Mesh(coordinates=coords, faces=faces)
+    elif surf_mesh.endswith('gii'):
+        coords, faces = _gifti_img_to_mesh(nibabel.load(surf_mesh))
+        mesh = Mesh(coordinates=coords, faces=faces)
+    elif surf_mesh.endswith('gii.gz'):
+        gifti_img = _load_surf_files_gifti_gzip(surf_mesh)
+        coords, faces = _gifti_img_to_mesh(gifti_img)
+        mesh = Mesh(coordinates=coords, faces=faces)
+    else:
+        raise ValueError('The input type is not recognized. '
+                         f'{surf_mesh!r} was given '
+                         'while valid inputs are one of the following '
+                         'file formats: .gii, .gii.gz, '
+                         'Freesurfer specific files such as '
+                         f"{_stringify(FREESURFER_MESH_EXTENSIONS)}, "
+                         'two Numpy arrays organized in a list, tuple '
+                         'or a namedtuple with the '
+                         'fields "coordinates" and "faces".')
+    return mesh
+
+
 def load_surf_mesh(surf_mesh):
     """Load a surface :term:`mesh` geometry.
 
@@ -889,30 +1108,11 @@ def load_surf_mesh(surf_mesh):
                 f"More than one file matching path: {surf_mesh} \n"
                 "load_surf_mesh can only load one file at a time.")
 
-        if any(surf_mesh.endswith(x) for x in FREESURFER_MESH_EXTENSIONS):
-            coords, faces, header = fs.io.read_geometry(surf_mesh,
-                                                        read_metadata=True)
-            # See https://github.com/nilearn/nilearn/pull/3235
-            if 'cras' in header:
-                coords += header['cras']
-            mesh = Mesh(coordinates=coords, faces=faces)
-        elif surf_mesh.endswith('gii'):
-            coords, faces = _gifti_img_to_mesh(nibabel.load(surf_mesh))
-            mesh = Mesh(coordinates=coords, faces=faces)
-        elif surf_mesh.endswith('gii.gz'):
-            gifti_img = _load_surf_files_gifti_gzip(surf_mesh)
-            coords, faces = _gifti_img_to_mesh(gifti_img)
-            mesh = Mesh(coordinates=coords, faces=faces)
-        else:
-            raise ValueError('The input type is not recognized. '
-                             f'{surf_mesh!r} was given '
-                             'while valid inputs are one of the following '
-                             'file formats: .gii, .gii.gz, '
-                             'Freesurfer specific files such as '
-                             f"{_stringify(FREESURFER_MESH_EXTENSIONS)}, "
-                             'two Numpy arrays organized in a list, tuple '
-                             'or a namedtuple with the '
-                             'fields "coordinates" and "faces".')
+        mesh = _load_surf_mesh_file(
+            surf_mesh, os.stat(surf_mesh).st_mtime_ns)
+        # the arrays of the cached mesh are shared between calls
+        mesh = Mesh(coordinates=mesh.coordinates.copy(),
+                    faces=mesh.faces.copy())
     elif isinstance(surf_mesh, (list, tuple)):
         try:
             coords, faces = surf_mesh
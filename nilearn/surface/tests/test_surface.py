@@ -9,6 +9,7 @@ import numpy as np
 import pytest
 from nibabel import gifti
 from numpy.testing import assert_array_almost_equal, assert_array_equal
+from scipy import interpolate
 from scipy.spatial import Delaunay
 from scipy.stats import pearsonr
 
@@ -388,6 +389,29 @@ def test_load_surf_mesh_file_freesurfer(suffix, tmp_path):
     assert_array_almost_equal(load_surf_mesh(filename_fs_mesh)[1], mesh[1])
 
 
+def test_load_surf_mesh_file_cache(tmp_path):
+    mesh = generate_surf()
+    filename = str(tmp_path / 'mesh.pial')
+    nb.freesurfer.write_geometry(filename, mesh[0], mesh[1])
+
+    loaded = load_surf_mesh(filename)
+    # modifying the loaded mesh does not change the cached one
+    loaded.coordinates[:] = 0
+    assert_array_almost_equal(load_surf_mesh(filename)[0], mesh[0])
+
+    # the mesh is loaded again when the file changes
+    nb.freesurfer.write_geometry(filename, 2 * mesh[0], mesh[1])
+    os.utime(filename, ns=(0, 10 ** 9))
+    assert_array_almost_equal(load_surf_mesh(filename)[0], 2 * mesh[0])
+
+    # or when the caches are cleared
+    nb.freesurfer.write_geometry(filename, 3 * mesh[0], mesh[1])
+    os.utime(filename, ns=(0, 10 ** 9))
+    assert_array_almost_equal(load_surf_mesh(filename)[0], 2 * mesh[0])
+    datasets.clear_template_cache()
+    assert_array_almost_equal(load_surf_mesh(filename)[0], 3 * mesh[0])
+
+
 @pytest.mark.parametrize("suffix", ['.vtk', '.obj', '.mnc', '.txt'])
 def test_load_surf_mesh_file_error(suffix, tmp_path):
     # test if files with unexpected suffixes raise errors
@@ -720,6 +744,56 @@ def test_sampling_between_surfaces(projection, affine_eye):
         projection.ravel(), img[:, :, 1:4].mean(axis=-1).ravel())
 
 
+def test_trilinear_interpolation_matrix(rng):
+    img = rng.standard_normal((4, 5, 6))
+    # includes locations on the borders and beyond the last voxels
+    locations = rng.uniform(-.5, 1, size=(50, 3)) * np.asarray(img.shape)
+    locations[:3] = [[0, 0, 0], [3, 4, 5], [2, 2.5, 3.2]]
+    interpolator = interpolate.RegularGridInterpolator(
+        [np.arange(size) for size in img.shape], img,
+        bounds_error=False, method='linear', fill_value=None)
+    interp = surface._trilinear_interpolation_matrix(locations, img.shape)
+    assert interp.shape == (50, img.size)
+    assert_array_almost_equal(
+        interp.dot(img.ravel()), interpolator(locations))
+
+
+@pytest.mark.parametrize("projection", ["linear", "nearest"])
+def test_sampling_operator_cache(projection, affine_eye):
+    projector = {"nearest": surface._nearest_voxel_sampling,
+                 "linear": surface._interpolation_sampling}[projection]
+    mesh = flat_mesh(5, 7, 4)
+    img = z_const_img(5, 7, 13)
+    surface._PROJECTION_CACHE.clear()
+    projection_1 = projector([img], mesh, affine_eye, radius=1.)
+    projection_2 = projector([img, 2 * img], mesh, affine_eye, radius=1.)
+    assert len(surface._PROJECTION_CACHE) == 1
+    assert_array_almost_equal(projection_1[0], projection_2[0])
+    assert_array_almost_equal(2 * projection_1[0], projection_2[1])
+    # a different sampling gives a different operator
+    projector([img], mesh, affine_eye, radius=2.)
+    assert len(surface._PROJECTION_CACHE) == 2
+    for radius in range(3, 3 + surface._PROJECTION_CACHE_SIZE):
+        projector([img], mesh, affine_eye, radius=radius)
+    assert len(surface._PROJECTION_CACHE) == surface._PROJECTION_CACHE_SIZE
+
+
+def test_interpolation_sampling_ignores_nan(affine_eye):
+    mesh = flat_mesh(5, 7, 4)
+    inner_mesh = flat_mesh(5, 7, 0)
+    img = np.ones((5, 7, 13)) * np.arange(13)
+    nan_img = img.copy()
+    nan_img[0, 0, :] = np.nan
+    nan_img[1:, :, 2] = np.nan
+    projection = surface._interpolation_sampling(
+        [img, nan_img], mesh, affine_eye, inner_mesh=inner_mesh,
+        depth=[0, .25, .5, .75])
+    assert_array_almost_equal(projection[0], 2.5)
+    # samples interpolated from NaN voxels are ignored
+    assert np.isnan(projection[1, 0])
+    assert_array_almost_equal(projection[1, 1:], 3.5)
+
+
 def test_choose_kind():
     kind = surface._choose_kind("abc", None)
     assert kind == "abc"
@@ -4,7 +4,7 @@ import warnings
 
 import numpy as np
 import pytest
-from nibabel import Nifti1Image
+from nibabel import Nifti1Image, load
 from numpy.testing import assert_array_equal
 from sklearn.preprocessing import StandardScaler
 
@@ -342,6 +342,36 @@ def test_apply_mask(affine_eye, tmp_path):
         masking.apply_mask(Nifti1Image(data, affine), mask_img)
 
 
+@pytest.mark.parametrize("suffix", [".nii", ".nii.gz"])
+@pytest.mark.parametrize("smoothing_fwhm", [None, 3])
+def test_apply_mask_chunks(
+    suffix, smoothing_fwhm, rng, affine_eye, tmp_path, monkeypatch
+):
+    """Check that masking 4D images in chunks gives the same result."""
+    data = rng.integers(0, 100, size=(9, 8, 7, 11)).astype("int16")
+    mask = np.zeros((9, 8, 7))
+    mask[2:7, 1:6, 3:5] = 1
+    mask_img = Nifti1Image(mask, affine_eye)
+    img = Nifti1Image(data, affine_eye)
+    img.header.set_slope_inter(0.5, 2)
+    img.to_filename(tmp_path / f"img{suffix}")
+
+    # the scaled data, fully loaded in memory
+    img = Nifti1Image(
+        np.asanyarray(load(tmp_path / f"img{suffix}").dataobj), affine_eye
+    )
+    expected = masking.apply_mask(img, mask_img, smoothing_fwhm=smoothing_fwhm)
+    # chunks of 3 volumes, the last one shorter
+    monkeypatch.setattr(masking, "_CHUNK_NBYTES", 3 * 8 * 9 * 8 * 7)
+    series = masking.apply_mask(
+        tmp_path / f"img{suffix}", mask_img, smoothing_fwhm=smoothing_fwhm
+    )
+
+    assert series.shape == (11, mask.sum())
+    assert series.dtype == expected.dtype
+    np.testing.assert_allclose(series, expected)
+
+
 def test_unmask(rng, affine_eye, tmp_path):
     # A delta in 3D
     shape = (10, 20, 30, 40)
@@ -417,6 +447,98 @@ def test_unmask(rng, affine_eye, tmp_path):
         unmask(transposed_vector, mask_img)
 
 
+def test_unmask_out(rng, affine_eye):
+    shape = (5, 6, 7)
+    mask = rng.uniform(size=shape) < 0.5
+    mask_img = Nifti1Image(mask.astype("int32"), affine_eye)
+    X = rng.standard_normal((4, mask.sum()))
+    expected = get_data(unmask(X, mask_img))
+
+    out = np.full(shape + (4,), np.nan, order="F")
+    img = unmask(X, mask_img, out=out, n_jobs=2)
+    assert get_data(img) is out
+    assert_array_equal(out, expected)
+
+    out = np.empty(shape, order="C")
+    unmask(X[0], mask_img, order="C", out=out)
+    assert_array_equal(out, expected[..., 0])
+
+    with pytest.raises(ValueError, match="out must be of shape"):
+        unmask(X, mask_img, out=np.empty(shape))
+    with pytest.raises(ValueError, match="F-contiguous"):
+        unmask(X, mask_img, out=np.empty(shape + (4,), order="C"))
+    with pytest.raises(ValueError, match="list"):
+        unmask([X], mask_img, out=out)
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_unmask_n_jobs(rng, affine_eye, n_jobs):
+    shape = (5, 6, 7)
+    mask = rng.uniform(size=shape) < 0.5
+    mask_img = Nifti1Image(mask.astype("int32"), affine_eye)
+    X = rng.standard_normal((5, mask.sum())).astype("float32")
+    expected = np.zeros(shape + (5,), dtype="float32")
+    expected[mask] = X.T
+
+    for order in ["F", "C"]:
+        t = get_data(unmask(X, mask_img, order=order, n_jobs=n_jobs))
+        assert t.dtype == np.float32
+        assert_array_equal(t, expected)
+
+    imgs = unmask(list(X), mask_img, n_jobs=n_jobs)
+    assert len(imgs) == 5
+    for i, img in enumerate(imgs):
+        assert_array_equal(get_data(img), expected[..., i])
+
+    # nested lists give nested lists of images
+    imgs = unmask([[X[0], X[1]], [X[2]], X[3:]], mask_img, n_jobs=n_jobs)
+    assert [len(item) for item in imgs[:2]] == [2, 1]
+    assert_array_equal(get_data(imgs[0][1]), expected[..., 1])
+    assert_array_equal(get_data(imgs[1][0]), expected[..., 2])
+    assert_array_equal(get_data(imgs[2]), expected[..., 3:])
+
+
+def test_unmask_to_file(rng, affine_eye, tmp_path):
+    shape = (5, 6, 7)
+    mask = rng.uniform(size=shape) < 0.5
+    affine = affine_eye.copy()
+    affine[:3, 3] = [1, 2, 3]
+    mask_img = Nifti1Image(mask.astype("int32"), affine)
+    X = rng.standard_normal((3, mask.sum()))
+    expected = unmask(X, mask_img)
+
+    img = unmask(X, mask_img, out=tmp_path / "unmasked.nii", n_jobs=2)
+    assert img.get_filename() == str(tmp_path / "unmasked.nii")
+    assert_array_equal(img.affine, expected.affine)
+    assert_array_equal(get_data(img), get_data(expected))
+    reloaded = load(tmp_path / "unmasked.nii")
+    assert reloaded.get_data_dtype() == np.float64
+    assert_array_equal(reloaded.get_fdata(), get_data(expected))
+
+    img = unmask(X[1], mask_img, out=str(tmp_path / "unmasked_3d.nii"))
+    assert img.shape == shape
+    assert_array_equal(get_data(img), get_data(expected)[..., 1])
+
+    # same data types as the images in memory
+    for X_typed, dtype in [
+        (rng.integers(-5, 5, size=X.shape, dtype=np.int64), np.int32),
+        (X > 0, np.uint8),
+    ]:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)
+            expected = unmask(X_typed, mask_img)
+            img = unmask(X_typed, mask_img, out=tmp_path / "typed.nii")
+        assert get_data(expected).dtype == dtype
+        assert img.get_data_dtype() == dtype
+        assert_array_equal(get_data(img), get_data(expected))
+
+    with pytest.raises(ValueError, match="'.nii'"):
+        unmask(X, mask_img, out=tmp_path / "unmasked.nii.gz")
+    with pytest.raises(TypeError, match="X must be of shape"):
+        unmask(X[:, 1:], mask_img, out=tmp_path / "wrong.nii")
+    assert not (tmp_path / "wrong.nii").exists()
+
+
 def test_intersect_masks_filename(affine_eye, tmp_path):
     # Create dummy masks
     mask_a = np.zeros((4, 4, 1), dtype=bool)
@@ -574,6 +696,44 @@ def test_compute_multi_epi_mask(affine_eye):
     assert_array_equal(mask_ab, get_data(mask_ab_))
 
 
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_compute_multi_epi_mask_counts_masks(n_jobs):
+    """The masks of the runs are added one batch at a time: check the \
+    result against the intersection of the masks of each run."""
+    imgs = []
+    for seed in range(5):
+        img, _ = data_gen.generate_fake_fmri(
+            shape=(12, 13, 14), length=6, random_state=seed
+        )
+        imgs.append(img)
+
+    mask = compute_multi_epi_mask(imgs, threshold=0.6, n_jobs=n_jobs)
+    expected = intersect_masks(
+        [compute_epi_mask(img) for img in imgs], threshold=0.6
+    )
+    assert_array_equal(get_data(mask), get_data(expected))
+    np.testing.assert_array_equal(mask.affine, expected.affine)
+
+    with pytest.raises(ValueError, match="threshold should be"):
+        compute_multi_epi_mask(imgs, threshold=2)
+
+
+def test_mean_shared_by_mask_strategies(tmp_path):
+    """The (unsmoothed) mean image is cached once for the EPI and \
+    background masks."""
+    img, _ = data_gen.generate_fake_fmri(shape=(12, 13, 14), length=6)
+    img.to_filename(tmp_path / "img.nii")
+    compute_epi_mask(tmp_path / "img.nii", memory=tmp_path)
+    compute_background_mask(tmp_path / "img.nii", memory=tmp_path)
+
+    cached_means = [
+        path
+        for path in tmp_path.glob("joblib/**/_compute_mean/*")
+        if path.is_dir()
+    ]
+    assert len(cached_means) == 1
+
+
 def test_compute_multi_brain_mask():
     with pytest.raises(TypeError):
         compute_multi_brain_mask([])